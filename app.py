@@ -11,6 +11,7 @@ from datetime import datetime
 import tempfile
 import shutil
 import importlib
+import threading
 
 # Load environment variables from .env file
 try:
@@ -31,13 +32,29 @@ if 'src.google_sheets_manager' in sys.modules:
     importlib.reload(sys.modules['src.google_sheets_manager'])
 
 from src.resume_parser import ResumeParser
-from src.jd_matcher import JDMatcher
+from src.jd_matcher import JDMatcher, TopKSelector
+from src.jd_cache import invalidate_jd
 from src.google_sheets_manager import GoogleSheetsManager
+from src.resume_index import ResumeIndex
+from src.score_store import NUMPY_AVAILABLE as SCORE_HISTORY_AVAILABLE, ScoreMatrixStore
+from src.leaderboard import Leaderboard
+from src.role_manager import RoleManager
+from src.job_queue import JobQueue, QUEUED as JOB_QUEUED, RUNNING as JOB_RUNNING, DONE as JOB_DONE, FAILED as JOB_FAILED
+from src.evaluation_jobs import AI_EVALUATION_JOB, build_ai_evaluator, job_uploads_folder, process_job, prune_job_uploads
+from src.score_sketch import AI_SCORES_SUFFIX, ScoreSketchStore, ai_scores_key
 from src.email_sender import EmailSender
 from src.whatsapp_sender import WhatsAppSender
 from src.auth_pages import show_login_page, show_register_page, show_admin_users_page, show_user_profile
 from src.drive_uploader import DriveUploader
 
+# Result cards rendered by the AI Evaluator and Review Candidates pages
+AI_EVAL_TOP_K = 50
+REVIEW_PAGE_TOP_K = 50
+
+# AI Evaluator jobs: run by evaluation_worker.py (true) or on an app server thread (false)
+AI_EVAL_BACKGROUND = os.getenv('AI_EVAL_BACKGROUND', 'false').lower() == 'true'
+JOB_POLL_SECONDS = 2
+
 # Page configuration
 st.set_page_config(
     page_title="Hiring Automation - Printo",
@@ -205,12 +222,12 @@ def get_sheets_manager():
             try:
                 # Use the existing sheet ID
                 st.session_state.sheets_manager.sheet = st.session_state.sheets_manager.client.open_by_key('1hqcD0b1fuYjyJab1oLu9y_4wTuvM1EeQeFdbHV3zJGE')
-                st.session_state.sheets_manager.worksheet = st.session_state.sheets_manager.sheet.worksheet('Candidates_Master')
+                st.session_state.sheets_manager.get_worksheet()
                 st.session_state.sheet_url = 'https://docs.google.com/spreadsheets/d/1hqcD0b1fuYjyJab1oLu9y_4wTuvM1EeQeFdbHV3zJGE'
             except:
                 # If that fails, try to create new
                 st.session_state.sheets_manager.sheet = st.session_state.sheets_manager.get_or_create_sheet('Hiring_Automation_Candidates')
-                st.session_state.sheets_manager.worksheet = st.session_state.sheets_manager.setup_candidates_master_sheet()
+                st.session_state.sheets_manager.get_worksheet(refresh=True)
                 st.session_state.sheet_url = st.session_state.sheets_manager.get_sheet_url()
 
         except Exception as e:
@@ -350,12 +367,14 @@ elif page == "📝 Manage Job Descriptions":
                     if st.button("💾 Save", key=f"save_{jd_file}"):
                         with open(jd_path, 'w', encoding='utf-8') as f:
                             f.write(edited_content)
+                        invalidate_jd(jd_path)
                         st.success(f"✅ Updated {role_name}")
                         st.rerun()
 
                 with col2:
                     if st.button("🗑️ Delete", key=f"delete_{jd_file}"):
                         os.remove(jd_path)
+                        invalidate_jd(jd_path)
                         st.success(f"✅ Deleted {role_name}")
                         st.rerun()
     else:
@@ -431,14 +450,26 @@ elif page == "🤖 AI Evaluator":
 
     st.success("✅ OpenAI API key configured")
 
-    # Import evaluator
+    # Check the evaluator can be created before queueing work for it
     try:
-        from src.resume_evaluator import ResumeEvaluator
-        evaluator = ResumeEvaluator()
+        build_ai_evaluator()
     except Exception as e:
         st.error(f"❌ Failed to initialize AI evaluator: {str(e)}")
         st.stop()
 
+    job_queue = JobQueue()
+    # Old jobs' upload folders are cleared once per session
+    if not st.session_state.get('job_uploads_pruned'):
+        prune_job_uploads(job_queue)
+        st.session_state.job_uploads_pruned = True
+
+    def run_job_in_app(job_id):
+        """Claim a queued job and run it on a thread of the app server (no worker process)"""
+        claimed_job = job_queue.claim('app', job_id=job_id)
+        if claimed_job:
+            threading.Thread(target=process_job, args=(JobQueue(), claimed_job), daemon=True).start()
+        return claimed_job
+
     # Job Description Selection
     st.markdown("### 📝 Step 1: Select Job Description")
 
@@ -509,6 +540,7 @@ elif page == "🤖 AI Evaluator":
             if st.button("💾 Save Changes"):
                 with open(jd_file_path, 'w', encoding='utf-8') as f:
                     f.write(edited_jd)
+                invalidate_jd(jd_file_path)
                 st.success("✅ Updated!")
                 jd_text = edited_jd
 
@@ -537,21 +569,12 @@ elif page == "🤖 AI Evaluator":
     # Evaluate Button
     st.markdown("### ⚙️ Step 3: Evaluate & Rank")
 
-    # Auto-generate role name and ID from selected JD file
+    # Stable role for the selected JD (registered role, else JD_<STEM>), shared with ingest_resumes.py
     if selected_jd_file:
-        if selected_jd_file.endswith('(from jd_files)'):
-            role_name_auto = "Python Developer"
-            role_id_auto = "ROLE001"
-        else:
-            # Convert filename to role name
-            role_name_auto = selected_jd_file.replace('.txt', '').replace('_', ' ').title()
-            # Generate role ID from index
-            role_index = jd_files_list.index(selected_jd_file) + 1
-            role_id_auto = f"ROLE{role_index:03d}"
-
-        st.info(f"**Processing for:** {role_name_auto} (ID: {role_id_auto})")
-        role_name = role_name_auto
-        role_id = role_id_auto
+        jd_role = RoleManager().get_role_for_jd(jd_file_path)
+        role_name = jd_role['role_name']
+        role_id = jd_role['role_id']
+        st.info(f"**Processing for:** {role_name} (ID: {role_id})")
     else:
         role_name = "Unknown Role"
         role_id = "ROLE000"
@@ -562,115 +585,183 @@ elif page == "🤖 AI Evaluator":
         elif not jd_text:
             st.error("❌ Please select or enter a job description")
         else:
-            # Save uploaded files temporarily
-            temp_resumes = []
-
+            # Save uploaded files for the evaluation job, in a folder of their own so
+            # concurrent jobs with same-named files don't overwrite each other
+            job_id = JobQueue.new_job_id()
+            job_resumes_folder = job_uploads_folder(job_id)
+            os.makedirs(job_resumes_folder, exist_ok=True)
             with st.spinner("📤 Processing uploaded files..."):
                 for uploaded_file in uploaded_files:
-                    file_path = os.path.join('resumes', uploaded_file.name)
+                    file_path = os.path.join(job_resumes_folder, os.path.basename(uploaded_file.name))
                     with open(file_path, 'wb') as f:
                         f.write(uploaded_file.getbuffer())
 
-            # Parse resumes
-            with st.spinner("📄 Parsing resumes..."):
-                resume_parser = ResumeParser()
-                for uploaded_file in uploaded_files:
-                    file_path = os.path.join('resumes', uploaded_file.name)
-                    try:
-                        parsed_data = resume_parser.parse_resume(file_path)
-                        if parsed_data and parsed_data.get('resume_text'):
-                            temp_resumes.append({
-                                'filename': uploaded_file.name,
-                                'resume_text': parsed_data['resume_text']
-                            })
-                    except Exception as e:
-                        st.warning(f"⚠️ Could not parse {uploaded_file.name}: {str(e)}")
-
-            if not temp_resumes:
-                st.error("❌ No resumes could be parsed successfully")
-                st.stop()
-
-            st.success(f"✅ Parsed {len(temp_resumes)} resume(s)")
-
-            # Evaluate with AI
-            st.markdown("### 🤖 AI Evaluation in Progress...")
-
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-
-            try:
-                results = []
-                for idx, resume in enumerate(temp_resumes):
-                    status_text.text(f"Evaluating {idx + 1}/{len(temp_resumes)}: {resume['filename']}")
-
-                    # Extract candidate data (pass JD for relevant experience calculation)
-                    candidate_data = evaluator.extract_candidate_data(resume['resume_text'], jd_text)
-                    print(f"[DEBUG] Extracted candidate data: {candidate_data}")
-
-                    # Fallback: If AI didn't extract name/phone/email, try traditional parser
-                    if not candidate_data.get('name') or not candidate_data.get('phone') or not candidate_data.get('email'):
-                        print(f"[DEBUG] AI extraction incomplete, trying fallback parser...")
-                        fallback_name = resume_parser.extract_name(resume['resume_text'], resume['filename'])
-                        fallback_phone = resume_parser.extract_phone(resume['resume_text'])
-                        fallback_email = resume_parser.extract_email(resume['resume_text'])
-                        fallback_location = resume_parser.extract_location(resume['resume_text'])
-
-                        # Use fallback values if AI returned None
-                        if not candidate_data.get('name') and fallback_name:
-                            candidate_data['name'] = fallback_name
-                            print(f"[DEBUG] Used fallback name: {fallback_name}")
-                        if not candidate_data.get('phone') and fallback_phone:
-                            candidate_data['phone'] = fallback_phone
-                            print(f"[DEBUG] Used fallback phone: {fallback_phone}")
-                        if not candidate_data.get('email') and fallback_email:
-                            candidate_data['email'] = fallback_email
-                            print(f"[DEBUG] Used fallback email: {fallback_email}")
-                        if not candidate_data.get('location') and fallback_location:
-                            candidate_data['location'] = fallback_location
-                            print(f"[DEBUG] Used fallback location: {fallback_location}")
-
-                    # Evaluate resume
-                    evaluation = evaluator.evaluate_resume(resume['resume_text'], jd_text)
-                    print(f"[DEBUG] Evaluation result: fit_score={evaluation.get('fit_score')}, fit_label={evaluation.get('fit_label')}")
-
-                    # Combine results
-                    result = {
-                        'filename': resume['filename'],
-                        'candidate_name': candidate_data.get('name'),
-                        'email': candidate_data.get('email'),
-                        'phone': candidate_data.get('phone'),
-                        'location': candidate_data.get('location'),
-                        'total_years_experience': candidate_data.get('total_years_experience'),
-                        'relevant_years_experience': candidate_data.get('relevant_years_experience'),
-                        'experience_brief': candidate_data.get('experience_brief'),
-                        'fit_score': evaluation.get('fit_score', 0),
-                        'fit_label': evaluation.get('fit_label', 'Unknown'),
-                        'reasoning': evaluation.get('reasoning', ''),
-                        'strengths': evaluation.get('strengths', []),
-                        'gaps': evaluation.get('gaps', [])
-                    }
-                    print(f"[DEBUG] Combined result: name={result['candidate_name']}, phone={result['phone']}, email={result['email']}, location={result['location']}, total_yrs={result['total_years_experience']}, relevant_yrs={result['relevant_years_experience']}, exp_brief={result['experience_brief']}, score={result['fit_score']}")
-
-                    results.append(result)
-                    progress_bar.progress((idx + 1) / len(temp_resumes))
-
-                # Sort by fit_score
-                results.sort(key=lambda x: x['fit_score'], reverse=True)
-
-                # Store results and JD info in session state for the save button
-                st.session_state.ai_eval_results = results
-                st.session_state.ai_eval_jd_name = selected_jd_file.replace('.txt', '').replace('_', ' ').title() if 'selected_jd_file' in locals() else 'AI Evaluation'
-
-                status_text.text("✅ Evaluation complete!")
-
-            except Exception as e:
-                st.error(f"❌ Evaluation failed: {str(e)}")
-                import traceback
-                st.code(traceback.format_exc())
+            # Parsing, evaluation and saving run as a queued job; this page only polls it
+            job_queue.submit(AI_EVALUATION_JOB, {
+                'files': [os.path.basename(uploaded_file.name) for uploaded_file in uploaded_files],
+                'resumes_folder': job_resumes_folder,
+                'jd_file_path': jd_file_path,
+                'jd_text': jd_text,
+                'role_id': role_id,
+                'role_name': role_name,
+                'jd_name': selected_jd_file.replace('.txt', '').replace('_', ' ').title()
+            }, owner=st.session_state.get('user_email', ''), job_id=job_id)
+            st.session_state.ai_eval_job_id = job_id
+            st.query_params['job'] = job_id
+            for key in ('ai_eval_results', 'ai_eval_top_results', 'ai_eval_loaded_job'):
+                st.session_state.pop(key, None)
+
+            # Without a separate worker process, run the job on a thread of the app server
+            if not AI_EVAL_BACKGROUND:
+                run_job_in_app(job_id)
+
+    def render_result_card(result, rank, expanded=False):
+        """Expandable card for one evaluated candidate"""
+        # Color code by score
+        if result['fit_score'] >= 4:
+            header_emoji = "🌟"
+        elif result['fit_score'] >= 3:
+            header_emoji = "✅"
+        elif result['fit_score'] >= 2:
+            header_emoji = "⚠️"
+        else:
+            header_emoji = "❌"
+
+        with st.expander(f"{header_emoji} Rank #{rank}: {result['candidate_name'] or 'Unknown'} - {result['fit_score']}/5 ({result['fit_label']})", expanded=expanded):
+            col1, col2 = st.columns([2, 1])
+
+            with col1:
+                st.markdown(f"**Email:** {result['email'] or 'N/A'}")
+                st.markdown(f"**Phone:** {result['phone'] or 'N/A'}")
+                st.markdown(f"**Location:** {result['location'] or 'N/A'}")
+                st.markdown(f"**Experience:** {result.get('experience_brief') or 'N/A'}")
+
+                # Show years of experience
+                total_yrs = result.get('total_years_experience')
+                relevant_yrs = result.get('relevant_years_experience')
+                if total_yrs is not None:
+                    exp_text = f"{total_yrs} years total"
+                    if relevant_yrs is not None:
+                        exp_text += f" ({relevant_yrs} years relevant)"
+                    st.markdown(f"**Years:** {exp_text}")
+
+                st.markdown("**Reasoning:**")
+                st.info(result['reasoning'])
+
+                if result['strengths']:
+                    st.markdown("**Strengths:**")
+                    for strength in result['strengths']:
+                        st.markdown(f"- ✓ {strength}")
+
+                if result['gaps'] and result['gaps'] != ['None']:
+                    st.markdown("**Gaps/Concerns:**")
+                    for gap in result['gaps']:
+                        st.markdown(f"- ✗ {gap}")
+
+            with col2:
+                st.markdown(f"### {result['fit_score']}/5")
+                st.markdown(f"**{result['fit_label']}**")
+                st.markdown(f"📄 {result['filename']}")
+
+    @st.fragment(run_every=JOB_POLL_SECONDS)
+    def show_job_progress(job_id):
+        """
+        Poll a running job and stream its finished candidates in, best first.
+        Only this fragment reruns, so the recruiter can read cards meanwhile.
+        """
+        job = job_queue.get_job(job_id)
+        if job['status'] not in (JOB_QUEUED, JOB_RUNNING):
+            st.rerun()  # Full rerun loads the finished job
+
+        if job['status'] == JOB_QUEUED:
+            st.info("⏳ Waiting for the evaluation worker (`python evaluation_worker.py`)...")
+        else:
+            st.progress(job['done'] / job['total'] if job['total'] else 0.0)
+            st.text(f"{job['stage']}: {job['done']}/{job['total']}")
+
+        # Fetch only results added since the last poll into a live top-K
+        live = st.session_state.get('ai_eval_live')
+        if not live or live['job_id'] != job_id:
+            live = {'job_id': job_id, 'cursor': 0, 'seen': set(),
+                    'top': TopKSelector(AI_EVAL_TOP_K, key=lambda r: r['fit_score'])}
+            st.session_state.ai_eval_live = live
+        new_results, live['cursor'] = job_queue.get_new_results(job_id, live['cursor'])
+        for index, result in new_results:
+            if index not in live['seen']:
+                live['seen'].add(index)
+                live['top'].push(result)
+
+        if live['seen']:
+            shown = live['top'].results()
+            st.markdown(f"### 📊 Results so far ({len(live['seen'])} evaluated)")
+            if len(shown) < len(live['seen']):
+                st.caption(f"Showing the top {len(shown)} so far")
+            for idx, result in enumerate(shown):
+                render_result_card(result, idx + 1, expanded=(idx < 3))
+
+    # Evaluation job progress (survives reruns and closed tabs - the job ID is in the page URL)
+    active_job_id = st.session_state.get('ai_eval_job_id') or st.query_params.get('job')
+    active_job = job_queue.get_job(active_job_id) if active_job_id else None
+
+    # Without a worker process nothing else recovers jobs whose app thread died
+    # (e.g. the server restarted mid-run): requeue them once their heartbeat is
+    # stale and run the open one again
+    if not AI_EVAL_BACKGROUND and active_job and active_job['status'] in (JOB_QUEUED, JOB_RUNNING):
+        if job_queue.requeue_stale() or active_job['status'] == JOB_QUEUED:
+            active_job = run_job_in_app(active_job_id) or job_queue.get_job(active_job_id)
+
+    if active_job and active_job['status'] in (JOB_QUEUED, JOB_RUNNING):
+        st.markdown("### 🤖 AI Evaluation in Progress...")
+        st.caption("You can leave this page - the evaluation keeps running and its results are saved. "
+                   "Open this page's link again to see them.")
+        show_job_progress(active_job_id)
+
+    elif active_job and active_job['status'] == JOB_FAILED:
+        st.error(f"❌ Evaluation failed: {active_job['error']}")
+
+    elif active_job and active_job['status'] == JOB_DONE and st.session_state.get('ai_eval_loaded_job') != active_job_id:
+        # Load the finished job's results (all for saving, top K for display)
+        results = job_queue.get_results(active_job_id)
+        summary = active_job['summary']
+        for parse_error in summary.get('parse_errors', []):
+            st.warning(f"⚠️ Could not parse {parse_error}")
+
+        top_results = TopKSelector(AI_EVAL_TOP_K, key=lambda r: r['fit_score'])
+        top_results.extend(results)
+        st.session_state.ai_eval_results = results
+        st.session_state.ai_eval_top_results = top_results.results()
+        st.session_state.ai_eval_jd_name = active_job['payload'].get('jd_name', 'AI Evaluation')
+        st.session_state.ai_eval_role_id = active_job['payload'].get('role_id')
+        st.session_state.ai_eval_resumes_folder = active_job['payload'].get('resumes_folder', 'resumes')
+        st.session_state.ai_eval_prescreen_stats = summary.get('prescreen')
+        st.session_state.ai_eval_cache_stats = summary.get('cache')
+        st.session_state.ai_eval_resilience_stats = summary.get('resilience')
+        st.session_state.ai_eval_job_id = active_job_id
+        st.session_state.ai_eval_loaded_job = active_job_id
+
+    # Earlier evaluations can be reopened from the job history
+    recent_jobs = job_queue.list_jobs(owner=st.session_state.get('user_email') or None, limit=5)
+    if recent_jobs:
+        with st.expander("🕘 Recent evaluations"):
+            for recent_job in recent_jobs:
+                col1, col2 = st.columns([4, 1])
+                with col1:
+                    st.markdown(
+                        f"**{recent_job['payload'].get('jd_name', 'AI Evaluation')}** - "
+                        f"{len(recent_job['payload'].get('files', []))} file(s), "
+                        f"{datetime.fromtimestamp(recent_job['created_at']).strftime('%d %b %H:%M')} ({recent_job['status']})"
+                    )
+                with col2:
+                    if st.button("Open", key=f"open_job_{recent_job['job_id']}"):
+                        st.session_state.ai_eval_job_id = recent_job['job_id']
+                        st.session_state.pop('ai_eval_loaded_job', None)
+                        st.query_params['job'] = recent_job['job_id']
+                        st.rerun()
 
     # Display Results (moved outside button block to persist across reruns)
     if 'ai_eval_results' in st.session_state and st.session_state.ai_eval_results:
         results = st.session_state.ai_eval_results
+        top_results = st.session_state.get('ai_eval_top_results') or results[:AI_EVAL_TOP_K]
 
         st.markdown("---")
         st.markdown("### 📊 Evaluation Results")
@@ -686,60 +777,41 @@ elif page == "🤖 AI Evaluator":
             strong_matches = sum(1 for r in results if r['fit_score'] >= 4)
             st.metric("Strong Matches (4-5)", strong_matches)
         with col4:
-            top_score = results[0]['fit_score'] if results else 0
+            top_score = top_results[0]['fit_score'] if top_results else 0
             st.metric("Top Score", f"{top_score}/5")
 
-        st.markdown("---")
+        prescreen_stats = st.session_state.get('ai_eval_prescreen_stats')
+        if prescreen_stats and prescreen_stats['floor']:
+            st.caption(
+                f"🔎 Keyword pre-screen (floor {prescreen_stats['floor']:g}/100): "
+                f"{prescreen_stats['screened_out']} resume(s) screened out, "
+                f"{prescreen_stats['llm_calls_saved']} LLM call(s) saved"
+            )
 
-        # Detailed results
-        for idx, result in enumerate(results):
-            rank = idx + 1
-
-            # Color code by score
-            if result['fit_score'] >= 4:
-                header_emoji = "🌟"
-            elif result['fit_score'] >= 3:
-                header_emoji = "✅"
-            elif result['fit_score'] >= 2:
-                header_emoji = "⚠️"
-            else:
-                header_emoji = "❌"
+        cache_stats = st.session_state.get('ai_eval_cache_stats')
+        if cache_stats:
+            st.caption(
+                f"💾 LLM cache: {cache_stats['hits']} hit(s), {cache_stats['misses']} miss(es) this run "
+                f"({cache_stats['hit_rate']:.0%} hit rate) · lifetime hit rate {cache_stats['lifetime_hit_rate']:.0%} "
+                f"over {cache_stats['entries']} cached response(s)"
+            )
 
-            with st.expander(f"{header_emoji} Rank #{rank}: {result['candidate_name'] or 'Unknown'} - {result['fit_score']}/5 ({result['fit_label']})", expanded=(idx < 3)):
-                col1, col2 = st.columns([2, 1])
+        resilience_stats = st.session_state.get('ai_eval_resilience_stats')
+        if resilience_stats and resilience_stats['fallbacks']:
+            st.warning(
+                f"⚠️ The AI provider was failing or too slow: {resilience_stats['fallbacks']} candidate(s) were scored "
+                f"on keywords only (circuit breaker tripped {resilience_stats['breaker']['trips']} time(s)). "
+                f"Re-run the evaluation later for AI assessments."
+            )
 
-                with col1:
-                    st.markdown(f"**Email:** {result['email'] or 'N/A'}")
-                    st.markdown(f"**Phone:** {result['phone'] or 'N/A'}")
-                    st.markdown(f"**Location:** {result['location'] or 'N/A'}")
-                    st.markdown(f"**Experience:** {result.get('experience_brief') or 'N/A'}")
-
-                    # Show years of experience
-                    total_yrs = result.get('total_years_experience')
-                    relevant_yrs = result.get('relevant_years_experience')
-                    if total_yrs is not None:
-                        exp_text = f"{total_yrs} years total"
-                        if relevant_yrs is not None:
-                            exp_text += f" ({relevant_yrs} years relevant)"
-                        st.markdown(f"**Years:** {exp_text}")
-
-                    st.markdown("**Reasoning:**")
-                    st.info(result['reasoning'])
-
-                    if result['strengths']:
-                        st.markdown("**Strengths:**")
-                        for strength in result['strengths']:
-                            st.markdown(f"- ✓ {strength}")
-
-                    if result['gaps'] and result['gaps'] != ['None']:
-                        st.markdown("**Gaps/Concerns:**")
-                        for gap in result['gaps']:
-                            st.markdown(f"- ✗ {gap}")
+        st.markdown("---")
 
-                with col2:
-                    st.markdown(f"### {result['fit_score']}/5")
-                    st.markdown(f"**{result['fit_label']}**")
-                    st.markdown(f"📄 {result['filename']}")
+        if len(top_results) < len(results):
+            st.caption(f"Showing the top {len(top_results)} of {len(results)} candidates (all are included when saving)")
+
+        # Detailed results
+        for idx, result in enumerate(top_results):
+            render_result_card(result, idx + 1, expanded=(idx < 3))
 
         # Download results and save to Google Sheets
         st.markdown("---")
@@ -811,7 +883,7 @@ elif page == "🤖 AI Evaluator":
                                     if drive_uploader:
                                         try:
                                             # Find the resume file path
-                                            resume_file_path = os.path.join('resumes', result['filename'])
+                                            resume_file_path = os.path.join(st.session_state.get('ai_eval_resumes_folder', 'resumes'), result['filename'])
                                             if os.path.exists(resume_file_path):
                                                 resume_link = drive_uploader.upload_resume(
                                                     file_path=resume_file_path,
@@ -822,7 +894,7 @@ elif page == "🤖 AI Evaluator":
                                             print(f"[ERROR] Failed to upload resume to Drive: {str(e)}")
 
                                     candidate = {
-                                        'role_id': f"AI_{datetime.now().strftime('%Y%m%d')}",
+                                        'role_id': st.session_state.get('ai_eval_role_id') or f"AI_{datetime.now().strftime('%Y%m%d')}",
                                         'role_name': jd_name,
                                         'candidate_name': result['candidate_name'] or 'Unknown',
                                         'phone': result['phone'] or '',
@@ -865,6 +937,81 @@ elif page == "🤖 AI Evaluator":
 elif page == "👥 Review Candidates":
     st.markdown('<div class="main-header">👥 Review Candidates</div>', unsafe_allow_html=True)
 
+    # Per-role leaderboard kept locally (no Google Sheets download needed)
+    leaderboard = Leaderboard()
+    leaderboard_roles = leaderboard.get_roles()
+    if leaderboard_roles:
+        with st.expander("🏆 Top 20 for this role", expanded=True):
+            # Keyword and AI scores are on different scales, so each has its own ranking
+            role_labels = {
+                f"{role['role_name'] or role['role_id']}"
+                f"{' - AI Evaluator' if role['role_id'].endswith(AI_SCORES_SUFFIX) else ' - Keyword'}"
+                f" ({role['candidates']} candidates)": role['role_id']
+                for role in leaderboard_roles
+            }
+            selected_role_label = st.selectbox("Role:", options=list(role_labels), key="leaderboard_role")
+
+            # ... and its own distribution
+            sketch_store = ScoreSketchStore()
+            selected_role_id = role_labels[selected_role_label]
+            base_role_id = selected_role_id[:-len(AI_SCORES_SUFFIX)] if selected_role_id.endswith(AI_SCORES_SUFFIX) else selected_role_id
+            for label, role_distribution in (("Keyword", sketch_store.get(base_role_id)),
+                                             ("AI", sketch_store.get(ai_scores_key(base_role_id)))):
+                if role_distribution is not None and role_distribution.n:
+                    st.caption(
+                        f"{label} score distribution ({role_distribution.n} evaluations): "
+                        f"median {role_distribution.quantile(0.5):.0f}, "
+                        f"top 30% from {role_distribution.quantile(0.7):.0f}, "
+                        f"top 10% from {role_distribution.quantile(0.9):.0f}"
+                    )
+            st.table([
+                {
+                    'rank': entry['rank'],
+                    'candidate_name': entry['candidate_name'],
+                    'email': entry['email'],
+                    'score': int(entry['score']),
+                    'fit_label': entry['fit_label'],
+                    'updated_at': entry['updated_at']
+                }
+                for entry in leaderboard.top(role_labels[selected_role_label], top_k=20)
+            ])
+
+    # Historical scores from the local score matrix (no Google Sheets download needed)
+    if SCORE_HISTORY_AVAILABLE:
+        score_store = ScoreMatrixStore(readonly=True)
+        if score_store.role_ids:
+            with st.expander(f"📊 Score History ({len(score_store.candidate_ids)} candidates × {len(score_store.role_ids)} roles)"):
+                history_role = st.selectbox("Role:", options=score_store.role_ids, key="history_role")
+                history_min = st.slider("Minimum score:", 0, 100, 0, key="history_min")
+                history_index = ResumeIndex()
+
+                history_rows = []
+                for candidate_id, score in score_store.leaderboard(history_role, top_k=50, min_score=history_min):
+                    candidate = history_index.candidates.get(candidate_id, {})
+                    history_rows.append({
+                        'candidate_name': candidate.get('candidate_name', candidate_id),
+                        'email': candidate.get('email', ''),
+                        'score': int(score)
+                    })
+                st.table(history_rows)
+
+                # Export the full matrix
+                import csv
+                import io
+                import math
+                export_buffer = io.StringIO()
+                writer = csv.writer(export_buffer)
+                writer.writerow(['candidate_id', 'candidate_name'] + score_store.role_ids)
+                for candidate_id, row in zip(score_store.candidate_ids, score_store.scores):
+                    name = history_index.candidates.get(candidate_id, {}).get('candidate_name', '')
+                    writer.writerow([candidate_id, name] + ['' if math.isnan(value) else int(value) for value in row])
+                st.download_button(
+                    label="📥 Export Score Matrix (CSV)",
+                    data=export_buffer.getvalue(),
+                    file_name="score_matrix.csv",
+                    mime="text/csv"
+                )
+
     # Get sheets manager
     sheets_manager = get_sheets_manager()
 
@@ -876,7 +1023,7 @@ elif page == "👥 Review Candidates":
     with st.spinner("📥 Loading candidates from Google Sheets..."):
         try:
             # Get all candidates
-            worksheet = sheets_manager.worksheet
+            worksheet = sheets_manager.get_worksheet()
             all_data = worksheet.get_all_values()
 
             if len(all_data) <= 1:
@@ -885,10 +1032,11 @@ elif page == "👥 Review Candidates":
 
             # Convert to list of dictionaries
             headers = all_data[0]
-            rows = all_data[1:]
             candidates_list = []
-            for row in rows:
-                candidate_dict = {}
+            # Sheet row numbers start at 2 (row 1 is the header); kept with each
+            # record because identical rows can't be told apart by value
+            for sheet_row, row in enumerate(all_data[1:], start=2):
+                candidate_dict = {'_sheet_row': sheet_row}
                 for i, header in enumerate(headers):
                     candidate_dict[header] = row[i] if i < len(row) else ''
                 candidates_list.append(candidate_dict)
@@ -896,6 +1044,8 @@ elif page == "👥 Review Candidates":
             st.success(f"✅ Loaded {len(candidates_list)} candidate(s)")
 
         except Exception as e:
+            # Resolve the worksheet again on the next attempt (it may have been renamed or re-created)
+            sheets_manager.invalidate_worksheet()
             st.error(f"❌ Failed to load candidates: {str(e)}")
             st.stop()
 
@@ -935,11 +1085,26 @@ elif page == "👥 Review Candidates":
     if search_name:
         filtered_candidates = [c for c in filtered_candidates if search_name.lower() in c.get('candidate_name', '').lower()]
 
-    st.markdown(f"### 📋 Candidates ({len(filtered_candidates)} shown)")
+    # Render only the best-scoring candidates; filters narrow the pool further
+    def sheet_score(candidate):
+        """auto_fit_score from the sheet as a number (blank or invalid -> 0)"""
+        try:
+            return float(candidate.get('auto_fit_score') or 0)
+        except ValueError:
+            return 0
+
+    top_candidates = TopKSelector(REVIEW_PAGE_TOP_K, key=sheet_score)
+    top_candidates.extend(filtered_candidates)
+    shown_candidates = top_candidates.results()
+
+    if len(shown_candidates) < len(filtered_candidates):
+        st.markdown(f"### 📋 Candidates (top {len(shown_candidates)} of {len(filtered_candidates)} by score)")
+    else:
+        st.markdown(f"### 📋 Candidates ({len(filtered_candidates)} shown)")
 
     # Display candidates with approval checkboxes
-    if len(filtered_candidates) > 0:
-        for idx, row in enumerate(filtered_candidates):
+    if len(shown_candidates) > 0:
+        for idx, row in enumerate(shown_candidates):
             with st.expander(f"{'✅' if row['hr_approved'] == 'Yes' else '❌'} {row['candidate_name']} - {row['auto_fit_label']} ({row['auto_fit_score']}%)"):
                 col1, col2 = st.columns([3, 1])
 
@@ -961,10 +1126,8 @@ elif page == "👥 Review Candidates":
                     if new_approval != current_approval:
                         if st.button("💾 Save", key=f"save_{idx}"):
                             try:
-                                # Update in Google Sheets (row index + 2 because of header and 0-indexing)
-                                row_num = int(idx) + 2
-                                col_num = headers.index('hr_approved') + 1
-                                worksheet.update_cell(row_num, col_num, 'Yes' if new_approval else 'No')
+                                # Update in Google Sheets
+                                sheets_manager.set_approval([row['_sheet_row']], new_approval)
                                 st.success("✅ Updated!")
                                 st.rerun()
                             except Exception as e:
@@ -979,11 +1142,8 @@ elif page == "👥 Review Candidates":
         with col1:
             if st.button("✅ Approve All Filtered", type="primary"):
                 try:
-                    for idx, candidate in enumerate(filtered_candidates):
-                        # Find the actual row in all_data
-                        row_num = candidates_list.index(candidate) + 2
-                        col_num = headers.index('hr_approved') + 1
-                        worksheet.update_cell(row_num, col_num, 'Yes')
+                    # One batch update for all filtered rows
+                    sheets_manager.set_approval([c['_sheet_row'] for c in filtered_candidates], True)
                     st.success(f"✅ Approved {len(filtered_candidates)} candidate(s)!")
                     st.rerun()
                 except Exception as e:
@@ -992,11 +1152,8 @@ elif page == "👥 Review Candidates":
         with col2:
             if st.button("❌ Reject All Filtered"):
                 try:
-                    for idx, candidate in enumerate(filtered_candidates):
-                        # Find the actual row in all_data
-                        row_num = candidates_list.index(candidate) + 2
-                        col_num = headers.index('hr_approved') + 1
-                        worksheet.update_cell(row_num, col_num, 'No')
+                    # One batch update for all filtered rows
+                    sheets_manager.set_approval([c['_sheet_row'] for c in filtered_candidates], False)
                     st.success(f"❌ Rejected {len(filtered_candidates)} candidate(s)!")
                     st.rerun()
                 except Exception as e:
@@ -1034,6 +1191,8 @@ elif page == "📧 Send Notifications":
             st.success(f"✅ Found {len(approved_candidates)} approved candidate(s)")
 
         except Exception as e:
+            # Resolve the worksheet again on the next attempt (it may have been renamed or re-created)
+            sheets_manager.invalidate_worksheet()
             st.error(f"❌ Failed to load candidates: {str(e)}")
             st.stop()
 
@@ -1310,9 +1469,10 @@ elif page == "⚙️ Settings":
         if st.button("🗑️ Clear Resume Folder", type="secondary"):
             if st.checkbox("Confirm clear resumes?"):
                 try:
-                    for file in os.listdir('resumes'):
-                        if file.endswith(('.pdf', '.docx')):
-                            os.remove(os.path.join('resumes', file))
+                    for folder, _, files in os.walk('resumes'):
+                        for file in files:
+                            if file.endswith(('.pdf', '.docx')):
+                                os.remove(os.path.join(folder, file))
                     st.success("✅ Resume folder cleared!")
                 except Exception as e:
                     st.error(f"❌ Failed: {str(e)}")
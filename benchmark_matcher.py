@@ -0,0 +1,84 @@
+"""
+JD Matcher Benchmark
+Compares the single-pass skill matcher against the previous per-keyword regex scan.
+
+Usage:
+    python benchmark_matcher.py [number_of_resumes]
+
+This script will:
+1. Generate synthetic resumes (default: 10,000)
+2. Score them with the legacy regex implementation and the current JDMatcher
+3. Check that both find the same JD keywords and print the timings
+"""
+
+import random
+import re
+import sys
+import time
+
+from src.jd_matcher import JDMatcher
+from src.skill_taxonomy import get_skill_taxonomy
+
+JD_FILE = "jd_library/senior_python_developer.txt"
+
+FILLER_WORDS = [
+    'developed', 'managed', 'team', 'project', 'delivered', 'system', 'client',
+    'built', 'designed', 'improved', 'performance', 'using', 'with', 'and', 'the',
+    'responsible', 'for', 'application', 'services', 'data', 'platform', 'users'
+]
+
+
+def legacy_calculate_match_score(jd_keywords, resume_text):
+    """Previous implementation: one compiled-on-the-fly regex per JD keyword."""
+    resume_lower = resume_text.lower()
+    matched = []
+    missing = []
+    for keyword in jd_keywords:
+        pattern = r'\b' + re.escape(keyword) + r'\b'
+        if re.search(pattern, resume_lower):
+            matched.append(keyword)
+        else:
+            missing.append(keyword)
+    score = int((len(matched) / len(jd_keywords)) * 100) if jd_keywords else 0
+    return score, matched, missing
+
+
+def generate_resumes(count, seed=42):
+    """Generate synthetic resumes of roughly 400 words each."""
+    rng = random.Random(seed)
+    skills = list(get_skill_taxonomy().skills)
+    resumes = []
+    for _ in range(count):
+        words = [rng.choice(FILLER_WORDS) for _ in range(380)]
+        for skill in rng.sample(skills, 20):
+            words.insert(rng.randrange(len(words)), skill.title() if rng.random() < 0.5 else skill)
+        resumes.append(' '.join(words))
+    return resumes
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    matcher = JDMatcher(JD_FILE)
+    resumes = generate_resumes(count)
+    print(f"[INFO] {count} resumes, {len(matcher.jd_keywords)} JD keywords")
+
+    start = time.perf_counter()
+    legacy_results = [legacy_calculate_match_score(matcher.jd_keywords, text) for text in resumes]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    new_results = [matcher.calculate_match_score(text) for text in resumes]
+    new_time = time.perf_counter() - start
+
+    # Scores differ by design (keywords are weighted), so compare what was matched
+    mismatches = sum(1 for old, new in zip(legacy_results, new_results) if old[1] != new[1])
+
+    print(f"Legacy regex scan:   {legacy_time:.2f}s ({legacy_time / count * 1e6:.0f} us/resume)")
+    print(f"Single-pass matcher: {new_time:.2f}s ({new_time / count * 1e6:.0f} us/resume)")
+    print(f"Speedup: {legacy_time / new_time:.1f}x")
+    print(f"Matched-keyword mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Bulk Screening Script
+Overnight AI screening of a whole folder of resumes against one job description,
+optimized for throughput and cost rather than latency: resumes below the keyword
+floor are skipped, the rest are compacted and sent to the LLM several per request
+(the JD is sent once per batch). Results are written to a CSV, best first.
+
+Usage:
+    python bulk_screen.py <jd_file> [resumes_folder] [output_csv]
+
+Example:
+    python bulk_screen.py jd_library/data_analyst.txt resumes data/data_analyst_screening.csv
+
+Batch size comes from AI_BATCH_SIZE (default 5). To try it offline, start
+python -m src.llm_stub_server and set OPENAI_BASE_URL=http://127.0.0.1:8765/v1.
+"""
+
+import csv
+import os
+import sys
+import time
+from dotenv import load_dotenv
+
+# Import src modules as src.<module>, the way they import each other, so each loads once
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.resume_parser import ResumeParser
+from src.jd_matcher import JDMatcher
+from src.prescreen import KeywordPrescreen
+from src.resume_compactor import ResumeCompactor
+from src.evaluation_engine import EvaluationEngine
+from src.batch_evaluator import BatchResumeEvaluator
+
+CSV_COLUMNS = ['filename', 'candidate_name', 'email', 'phone', 'location', 'total_years_experience',
+               'relevant_years_experience', 'fit_score', 'fit_label', 'reasoning', 'strengths', 'gaps']
+
+
+def main():
+    """
+    Screen every resume in a folder against a JD and write the results to CSV.
+    """
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return
+
+    load_dotenv()
+
+    jd_file = sys.argv[1]
+    resumes_folder = sys.argv[2] if len(sys.argv) > 2 else 'resumes'
+    jd_name = os.path.splitext(os.path.basename(jd_file))[0]
+    output_csv = sys.argv[3] if len(sys.argv) > 3 else os.path.join('data', f"bulk_screen_{jd_name}.csv")
+
+    if not os.path.exists(jd_file):
+        print(f"[ERROR] Error: Job description file '{jd_file}' not found")
+        return
+    if not os.getenv('OPENAI_API_KEY'):
+        print("[ERROR] OPENAI_API_KEY is not set (see .env.example)")
+        return
+
+    with open(jd_file, 'r', encoding='utf-8') as f:
+        jd_text = f.read()
+
+    # Step 1: Parse resumes
+    print(f"\n[STEP 1] Parsing resumes from '{resumes_folder}'...")
+    parser = ResumeParser()
+    resumes = []
+    for filename in sorted(os.listdir(resumes_folder)):
+        if os.path.splitext(filename)[1].lower() not in ('.pdf', '.docx'):
+            continue
+        parsed = parser.parse_resume(os.path.join(resumes_folder, filename))
+        if parsed:
+            resumes.append({'filename': filename, **parsed})
+        else:
+            print(f"[ERROR] Failed to parse: {filename}")
+    print(f"[OK] Parsed {len(resumes)} resume(s)")
+    if not resumes:
+        return
+
+    # Step 2: Keyword pre-screen
+    print("\n[STEP 2] Keyword pre-screen...")
+    prescreen = KeywordPrescreen(JDMatcher(jd_file))
+    outcomes = [({}, prescreen(resume['resume_text'])) for resume in resumes]
+    to_evaluate = [index for index, (_, screened) in enumerate(outcomes) if screened is None]
+    print(f"[OK] {len(resumes) - len(to_evaluate)} screened out, {len(to_evaluate)} sent for AI evaluation")
+
+    # Step 3: Batched AI evaluation
+    evaluator = BatchResumeEvaluator()
+    engine = EvaluationEngine(evaluator, compactor=ResumeCompactor())
+    print(f"\n[STEP 3] AI evaluation, {evaluator.batch_size} resumes per request, "
+          f"{engine.max_workers} request(s) at a time...")
+    start = time.perf_counter()
+    evaluated = evaluator.evaluate_all(
+        [resumes[index]['resume_text'] for index in to_evaluate], jd_text, engine=engine,
+        on_batch=lambda done, total, _: print(f"  {done}/{total} evaluated")
+    )
+    fallbacks = 0
+    for index, outcome in zip(to_evaluate, evaluated):
+        if outcome[1].get('fit_label') == 'Evaluation Failed':
+            # Provider failing (or circuit open): keep the keyword score instead
+            outcome = ({}, prescreen.keyword_evaluation(resumes[index]['resume_text']))
+            fallbacks += 1
+        outcomes[index] = outcome
+    print(f"[OK] {len(to_evaluate)} resume(s) in {time.perf_counter() - start:.1f}s using "
+          f"{engine.stats['llm_calls']} batched request(s) ({evaluator.stats['retried']} retried individually)")
+    if fallbacks:
+        print(f"[WARN] {fallbacks} resume(s) scored on keywords only - the LLM failed or its circuit was open "
+              f"(breaker tripped {engine.breaker.trips} time(s))")
+
+    # Step 4: Write results, best first
+    rows = []
+    for resume, (candidate_data, evaluation) in zip(resumes, outcomes):
+        rows.append({
+            'filename': resume['filename'],
+            'candidate_name': candidate_data.get('name') or resume['candidate_name'],
+            'email': candidate_data.get('email') or resume['email'],
+            'phone': candidate_data.get('phone') or resume['phone'],
+            'location': candidate_data.get('location') or resume['location'],
+            'total_years_experience': candidate_data.get('total_years_experience', resume['total_years_experience']),
+            'relevant_years_experience': candidate_data.get('relevant_years_experience'),
+            'fit_score': evaluation.get('fit_score', 0),
+            'fit_label': evaluation.get('fit_label', 'Unknown'),
+            'reasoning': evaluation.get('reasoning', ''),
+            'strengths': '; '.join(evaluation.get('strengths', [])),
+            'gaps': '; '.join(evaluation.get('gaps', []))
+        })
+    rows.sort(key=lambda row: row['fit_score'], reverse=True)
+
+    os.makedirs(os.path.dirname(output_csv) or '.', exist_ok=True)
+    with open(output_csv, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+    print(f"\n[OK] Results written to {output_csv}")
+
+
+if __name__ == "__main__":
+    main()
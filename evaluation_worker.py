@@ -0,0 +1,60 @@
+"""
+Evaluation Worker
+Background process that runs AI Evaluator jobs submitted by the web app.
+Parsing, OCR and LLM calls happen here rather than in the Streamlit session, so
+closing the tab or rerunning the page doesn't lose work. Results are stored in
+data/jobs.db and the page picks them up when reopened.
+
+Usage:
+    python evaluation_worker.py          # run until stopped (Ctrl+C)
+    python evaluation_worker.py --once   # run queued jobs, then exit
+
+Several workers can run at once; each job is claimed by exactly one of them.
+"""
+
+import os
+import socket
+import sys
+import time
+from dotenv import load_dotenv
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from job_queue import JobQueue
+from evaluation_jobs import process_job, prune_job_uploads
+
+# Seconds between checks for new jobs when the queue is empty
+POLL_INTERVAL_SECONDS = 2
+
+
+def main():
+    """
+    Claim and run queued jobs.
+    """
+    load_dotenv()
+    run_once = '--once' in sys.argv
+
+    queue = JobQueue()
+    worker_id = f"{socket.gethostname()}-{os.getpid()}"
+    queue.requeue_stale()
+    prune_job_uploads(queue)
+    print(f"[OK] Evaluation worker {worker_id} started - waiting for jobs")
+
+    try:
+        while True:
+            job = queue.claim(worker_id)
+            if job is None:
+                if run_once:
+                    break
+                time.sleep(POLL_INTERVAL_SECONDS)
+                continue
+            process_job(queue, job)
+    except KeyboardInterrupt:
+        print("\n[INFO] Worker stopped")
+    finally:
+        queue.close()
+
+
+if __name__ == "__main__":
+    main()
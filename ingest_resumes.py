@@ -5,11 +5,15 @@ Main script to process resumes and populate Google Sheets.
 Usage:
     python ingest_resumes.py
 
+Set MULTI_ROLE_MODE=true to score every resume against all active roles
+(roles_config.json + jd_library/) instead of a single JD.
+
 This script will:
 1. Read the JD file from jd_files folder
 2. Parse all resumes from resumes folder
-3. Match candidates against JD keywords
-4. Save results to Google Sheets (Candidates_Master)
+3. Add parsed resumes to the local resume index (see search_resumes.py)
+4. Match candidates against JD keywords (updates the local score history and leaderboard)
+5. Save results to Google Sheets (Candidates_Master)
 """
 
 import os
@@ -22,6 +26,13 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 from resume_parser import ResumeParser
 from jd_matcher import JDMatcher
 from google_sheets_manager import GoogleSheetsManager
+from resume_index import ResumeIndex
+from bm25_scorer import BM25Scorer
+from role_manager import RoleManager
+from multi_role_matcher import MultiRoleMatcher, collect_active_roles
+from score_store import NUMPY_AVAILABLE as SCORE_HISTORY_AVAILABLE, ScoreMatrixStore
+from leaderboard import Leaderboard
+from score_sketch import ScoreSketchStore
 
 
 def main():
@@ -42,9 +53,23 @@ def main():
     CREDENTIALS_FILE = "credentials/service-account.json"
     SHEET_NAME = "Hiring_Automation_Phase1"
 
-    # Get role information from environment or use defaults
-    ROLE_ID = os.getenv("ROLE_ID", "ROLE001")
-    ROLE_NAME = os.getenv("ROLE_NAME", "Software Developer")
+    # Role for the JD: the roles_config.json role using JD_FILE, else JD_<STEM>.
+    # The same id is used by the app, so scores for one JD always share one role.
+    jd_role = RoleManager().get_role_for_jd(JD_FILE)
+    ROLE_ID = os.getenv("ROLE_ID") or jd_role['role_id']
+    ROLE_NAME = os.getenv("ROLE_NAME") or jd_role['role_name']
+    if ROLE_ID != jd_role['role_id']:
+        print(f"[WARN] ROLE_ID={ROLE_ID} differs from the role registered for {JD_FILE} ({jd_role['role_id']}); "
+              f"its scores will be stored under a separate role")
+
+    # Scoring method: "keyword" (default) or "bm25" (requires numpy and scipy)
+    SCORING_METHOD = os.getenv("SCORING_METHOD", "keyword").lower()
+
+    # Multi-role mode: score every resume against all active roles and assign the best fit
+    MULTI_ROLE_MODE = os.getenv("MULTI_ROLE_MODE", "false").lower() == "true"
+
+    # Fit labels: fixed (70/50/30 cutoffs) or percentile (within each role's past scores)
+    FIT_LABEL_MODE = os.getenv("FIT_LABEL_MODE", "fixed").lower()
 
     # Validation: Check if required files and folders exist
     print("Step 1: Validating setup...")
@@ -88,9 +113,31 @@ def main():
         parser = ResumeParser()
         print("[OK] Resume parser initialized")
 
-        # Initialize JD matcher
-        matcher = JDMatcher(JD_FILE)
-        print(f"[OK] JD matcher initialized ({len(matcher.jd_keywords)} keywords extracted)")
+        # Initialize JD matcher (one per active role in multi-role mode)
+        if MULTI_ROLE_MODE:
+            multi_matcher = MultiRoleMatcher(collect_active_roles(RoleManager()))
+            print(f"[OK] Multi-role mode: {len(multi_matcher.roles)} active role(s)")
+        else:
+            matcher = JDMatcher(JD_FILE)
+            print(f"[OK] JD matcher initialized ({len(matcher.jd_keywords)} keywords extracted)")
+
+        # Percentile-based fit labels from each role's past score distribution (optional)
+        sketch_store = ScoreSketchStore()
+        if FIT_LABEL_MODE == 'percentile':
+            if MULTI_ROLE_MODE:
+                calibration = [(role_matcher, role['role_id'])
+                               for role_matcher, role in zip(multi_matcher.matchers, multi_matcher.roles)]
+            else:
+                calibration = [(matcher, ROLE_ID)]
+            calibrated = sum(role_matcher.use_score_distribution(sketch_store.get(role_id))
+                             for role_matcher, role_id in calibration)
+            print(f"[OK] Percentile fit labels for {calibrated}/{len(calibration)} role(s) (others need more scores)")
+
+        # Initialize BM25 scorer (optional)
+        scorer = None
+        if SCORING_METHOD == 'bm25':
+            scorer = BM25Scorer()
+            print(f"[OK] BM25 scorer initialized ({scorer.doc_count} resumes in corpus statistics)")
 
         # Initialize Google Sheets manager
         sheets_manager = GoogleSheetsManager(CREDENTIALS_FILE)
@@ -115,6 +162,13 @@ def main():
             print("[ERROR] No candidates were successfully parsed")
             return
 
+        # Keep the parsed resumes searchable for future roles
+        resume_index = ResumeIndex()
+        for candidate in candidates:
+            candidate['candidate_id'] = resume_index.add_candidate(candidate)
+        resume_index.save()
+        print(f"[OK] Resume index updated ({resume_index.get_candidate_count()} candidates indexed)")
+
         print()
 
     except Exception as e:
@@ -126,13 +180,72 @@ def main():
     print("-" * 60)
 
     try:
-        evaluated_candidates = matcher.evaluate_multiple_candidates(candidates)
+        if MULTI_ROLE_MODE:
+            # Role information comes from each candidate's best-fit role
+            evaluated_candidates, score_matrix = multi_matcher.evaluate_candidates(candidates, scorer=scorer)
+            if scorer is not None:
+                scorer.save_stats()
+            for candidate in evaluated_candidates:
+                candidate['source_portal'] = 'Local Resume'
 
-        # Add role information to each candidate
-        for candidate in evaluated_candidates:
-            candidate['role_id'] = ROLE_ID
-            candidate['role_name'] = ROLE_NAME
-            candidate['source_portal'] = 'Local Resume'
+            print()
+            print("Score matrix (candidate x role):")
+            print("  " + " | ".join(role['role_name'] for role in multi_matcher.roles))
+            for candidate, scores in zip(evaluated_candidates, score_matrix):
+                print(f"  {candidate.get('candidate_name', 'Unknown')}: {scores}")
+
+            role_ids = [role['role_id'] for role in multi_matcher.roles]
+            role_names = [role['role_name'] for role in multi_matcher.roles]
+            role_matchers = multi_matcher.matchers
+            score_rows = score_matrix
+        else:
+            evaluated_candidates = matcher.evaluate_multiple_candidates(candidates, scorer=scorer)
+            if scorer is not None:
+                scorer.save_stats()
+
+            # Add role information to each candidate
+            for candidate in evaluated_candidates:
+                candidate['role_id'] = ROLE_ID
+                candidate['role_name'] = ROLE_NAME
+                candidate['source_portal'] = 'Local Resume'
+
+            role_ids = [ROLE_ID]
+            role_names = [ROLE_NAME]
+            role_matchers = [matcher]
+            score_rows = [[candidate['auto_fit_score']] for candidate in evaluated_candidates]
+
+        # Record scores in the local score history (candidate x role matrix)
+        if SCORE_HISTORY_AVAILABLE:
+            scored = [(candidate['candidate_id'], row) for candidate, row in zip(evaluated_candidates, score_rows)
+                      if candidate.get('candidate_id')]
+            if scored and ScoreMatrixStore().set_scores([cid for cid, _ in scored], role_ids, [row for _, row in scored]):
+                print(f"[OK] Score history updated ({len(scored)} candidate(s) x {len(role_ids)} role(s))")
+
+        # Add this batch to each role's score distribution
+        for j, role_id in enumerate(role_ids):
+            sketch_store.record(role_id, [row[j] for row in score_rows])
+        sketch_store.save()
+
+        # Update the per-role leaderboards in place
+        leaderboard_entries = [
+            {
+                'role_id': role_id,
+                'role_name': role_name,
+                'candidate_id': candidate.get('candidate_id'),
+                'candidate_name': candidate.get('candidate_name', ''),
+                'email': candidate.get('email') or '',
+                'score': score,
+                'fit_label': role_matcher.get_fit_label(score),
+                'source': 'ingest_resumes.py'
+            }
+            for candidate, row in zip(evaluated_candidates, score_rows)
+            for role_id, role_name, role_matcher, score in zip(role_ids, role_names, role_matchers, row)
+        ]
+        leaderboard = Leaderboard()
+        updated = leaderboard.record_many(leaderboard_entries)
+        leaderboard.close()
+        if updated:
+            print(f"[OK] Leaderboard updated ({updated} entries)")
 
         print()
 
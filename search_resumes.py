@@ -0,0 +1,65 @@
+"""
+Resume Search Script
+Finds the best-matching candidates for a job description in the local resume index,
+without re-parsing any resume files.
+
+Usage:
+    python search_resumes.py <jd_file> [top_k]
+
+Example:
+    python search_resumes.py jd_library/data_analyst.txt 20
+
+The index is filled by ingest_resumes.py and the AI Evaluator.
+"""
+
+import os
+import sys
+import time
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from resume_index import ResumeIndex
+
+
+def main():
+    """
+    Search the resume index for the given JD and print the top candidates.
+    """
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return
+
+    jd_file = sys.argv[1]
+    top_k = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    if not os.path.exists(jd_file):
+        print(f"[ERROR] Error: Job description file '{jd_file}' not found")
+        return
+
+    with open(jd_file, 'r', encoding='utf-8') as f:
+        jd_text = f.read()
+
+    index = ResumeIndex()
+    if index.get_candidate_count() == 0:
+        print("[ERROR] Resume index is empty - run ingest_resumes.py first")
+        return
+
+    # Use the packed skill bitsets when numpy is available, posting lists otherwise
+    bitsets = index.load_bitsets()
+
+    start = time.perf_counter()
+    results = index.search_jd(jd_text, top_k=top_k, bitsets=bitsets)
+    method = "skill bitsets" if bitsets is not None else "posting lists"
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    print(f"[OK] Searched {index.get_candidate_count()} candidates in {elapsed_ms:.1f} ms ({method})")
+    print("-" * 60)
+    for rank, result in enumerate(results, 1):
+        print(f"{rank:3d}. {result['match_score']:3d}%  {result['candidate_name'] or 'Unknown'}"
+              f"  <{result['email'] or 'no email'}>")
+        print(f"      Skills: {', '.join(result['matched_skills'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+Batch Evaluator Module
+Throughput-oriented AI evaluation for bulk screening: several (compacted)
+resumes for the same JD are packed into one request, so the JD and the
+instructions are sent once per batch instead of once per resume. The reply
+is split back into per-resume results and each one is schema-checked;
+resumes missing from the reply or failing validation are re-evaluated on
+their own with a single combined call.
+"""
+
+import json
+import os
+from typing import Callable, Dict, List, Tuple
+
+from src.combined_evaluator import CombinedResumeEvaluator, RESPONSE_FORMAT, SchemaError, validate_combined
+from src.evaluation_engine import EvaluationEngine
+from src.llm_client import LLMClient, LLMError
+
+DEFAULT_BATCH_SIZE = 5
+
+# Each resume in a batched prompt starts with this line
+RESUME_MARKER = "### RESUME {id}"
+
+BATCH_PROMPT = """You are an expert technical recruiter screening several resumes against one job description.
+Evaluate every resume independently. Respond with a single JSON object:
+{"results": [{"id": "<resume id>", "candidate": {...}, "evaluation": {...}}, ...]}
+with exactly one entry per resume, using the ids given in the "### RESUME <id>" lines.
+
+The "candidate" and "evaluation" objects follow this format:
+
+""" + RESPONSE_FORMAT
+
+
+def failed_evaluation(reason: str) -> Tuple[Dict, Dict]:
+    """Placeholder result for a resume that couldn't be evaluated"""
+    return {}, {
+        'fit_score': 0,
+        'fit_label': 'Evaluation Failed',
+        'reasoning': f"AI evaluation failed: {reason}",
+        'strengths': [],
+        'gaps': []
+    }
+
+
+class BatchResumeEvaluator:
+    """
+    Packs several resumes into one LLM request and splits the results.
+    """
+
+    PROMPT_VERSION = 'batch-1'
+
+    def __init__(self, client: LLMClient = None, batch_size: int = None, single_evaluator=None):
+        """
+        Initialize the evaluator.
+
+        Args:
+            client: LLM client (defaults to one configured from the environment)
+            batch_size: Resumes per request (defaults to AI_BATCH_SIZE, then 5)
+            single_evaluator: Evaluator with extract_and_evaluate() for retries
+                              (defaults to a CombinedResumeEvaluator on the same client)
+        """
+        self.client = client or LLMClient()
+        self.model = self.client.model
+        if batch_size is None:
+            try:
+                batch_size = int(os.getenv('AI_BATCH_SIZE', DEFAULT_BATCH_SIZE))
+            except ValueError:
+                print(f"[WARN] Invalid AI_BATCH_SIZE - using {DEFAULT_BATCH_SIZE}")
+                batch_size = DEFAULT_BATCH_SIZE
+        self.batch_size = max(1, batch_size)
+        self.single_evaluator = single_evaluator or CombinedResumeEvaluator(client=self.client)
+        self.stats = {'batches': 0, 'batched_resumes': 0, 'retried': 0}
+
+    @staticmethod
+    def build_messages(resume_texts: List[str], jd_text: str) -> List[Dict]:
+        """Chat messages for one batch (resume ids are r1, r2, ...)"""
+        resumes = "\n\n".join(
+            f"{RESUME_MARKER.format(id=f'r{number}')}\n{text}" for number, text in enumerate(resume_texts, 1)
+        )
+        return [
+            {'role': 'system', 'content': BATCH_PROMPT},
+            {'role': 'user', 'content': f"JOB DESCRIPTION:\n{jd_text}\n\nRESUMES:\n{resumes}"}
+        ]
+
+    @staticmethod
+    def split_results(payload: Dict, count: int) -> Dict[int, Tuple[Dict, Dict]]:
+        """
+        Validate a batch reply and index its results by resume position.
+
+        Args:
+            payload: Parsed JSON reply
+            count: Number of resumes in the batch
+
+        Returns:
+            Dictionary of position -> (candidate_data, evaluation) for valid entries only
+            (unknown ids and ids answered more than once are left out)
+        """
+        entries = payload.get('results') if isinstance(payload, dict) else None
+        if not isinstance(entries, list):
+            raise SchemaError("'results' is not a list")
+
+        results = {}
+        duplicated = set()
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            resume_id = str(entry.get('id', ''))
+            position = int(resume_id[1:]) - 1 if resume_id[:1] == 'r' and resume_id[1:].isdigit() else -1
+            if not 0 <= position < count:
+                continue
+            if position in results or position in duplicated:
+                # Two answers for one id: can't tell which is right, so evaluate it again on its own
+                duplicated.add(position)
+                results.pop(position, None)
+                print(f"[WARN] Duplicate batch result for {resume_id}")
+                continue
+            try:
+                results[position] = validate_combined(entry)
+            except SchemaError as e:
+                print(f"[WARN] Invalid batch result for {resume_id}: {e}")
+        return results
+
+    def request_batch(self, resume_texts: List[str], jd_text: str) -> Dict[int, Tuple[Dict, Dict]]:
+        """
+        Send one batch request.
+
+        Args:
+            resume_texts: Resume texts (already compacted)
+            jd_text: Job description text
+
+        Returns:
+            Dictionary of position -> (candidate_data, evaluation) for the usable
+            results (empty if the whole response is unusable)
+
+        Raises:
+            LLMError: If the request itself fails
+        """
+        try:
+            content, _ = self.client.chat(self.build_messages(resume_texts, jd_text), json_mode=True)
+            results = self.split_results(json.loads(content), len(resume_texts))
+        except (json.JSONDecodeError, SchemaError) as e:
+            print(f"[WARN] Unusable batch response ({e}) - evaluating resumes one by one")
+            results = {}
+
+        self.stats['batches'] += 1
+        self.stats['batched_resumes'] += len(results)
+        return results
+
+    def evaluate_batch(self, resume_texts: List[str], jd_text: str,
+                       call: Callable = None) -> List[Tuple[Dict, Dict]]:
+        """
+        Evaluate up to batch_size resumes with one request, then evaluate the
+        resumes missing from its answer one at a time.
+
+        Args:
+            resume_texts: Resume texts (already compacted)
+            jd_text: Job description text
+            call: Optional call(method, resumes, jd_text) that makes each LLM
+                  call (evaluate_all routes them through EvaluationEngine.call_llm)
+
+        Returns:
+            One (candidate_data, evaluation) tuple per resume, in order
+        """
+        call = call or (lambda method, *args: method(*args))
+        results = call(self.request_batch, resume_texts, jd_text)
+
+        outcomes = []
+        for position, resume_text in enumerate(resume_texts):
+            if position not in results:
+                self.stats['retried'] += 1
+                try:
+                    results[position] = call(self.single_evaluator.extract_and_evaluate, resume_text, jd_text)
+                except LLMError as e:
+                    results[position] = failed_evaluation(str(e))
+            outcomes.append(results[position])
+        return outcomes
+
+    def evaluate_all(self, resume_texts: List[str], jd_text: str, engine: EvaluationEngine = None,
+                     on_batch: Callable[[int, int, int], None] = None) -> List[Tuple[Dict, Dict]]:
+        """
+        Evaluate any number of resumes in batches, concurrently and rate limited.
+
+        Args:
+            resume_texts: Resume texts
+            jd_text: Job description text
+            engine: EvaluationEngine for concurrency and rate limits (one is created if None)
+            on_batch: Optional callback(resumes_done, total_resumes, batch_index) per finished batch
+
+        Returns:
+            One (candidate_data, evaluation) tuple per resume, in input order
+        """
+        engine = engine or EvaluationEngine(self)
+        if engine.compactor is not None:
+            resume_texts = [engine.compactor.compact(text)[0] for text in resume_texts]
+
+        batches = [resume_texts[start:start + self.batch_size]
+                   for start in range(0, len(resume_texts), self.batch_size)]
+        done = [0]
+
+        def engine_call(method, resumes, jd):
+            # The batch request and each one-at-a-time retry are separate rate-limited calls
+            text = ''.join(resumes) if isinstance(resumes, list) else resumes
+            return engine.call_llm(method, resumes, jd, prompt_text=text + jd)
+
+        def run_batch(batch: List[str]) -> List[Tuple[Dict, Dict]]:
+            return self.evaluate_batch(batch, jd_text, call=engine_call)
+
+        def batch_finished(index: int, _result, completed: int, total: int):
+            done[0] += len(batches[index])
+            if on_batch is not None:
+                on_batch(done[0], len(resume_texts), index)
+
+        outcomes = []
+        for batch, batch_results in zip(batches, engine.run(batches, run_batch, batch_finished)):
+            outcomes.extend(batch_results or [failed_evaluation("batch request failed")] * len(batch))
+        return outcomes
+
+
+# Example usage (for testing): python -m src.batch_evaluator
+if __name__ == "__main__":
+    import time
+    from src.llm_stub_server import start_stub_server
+
+    server, url = start_stub_server(latency=0.2)
+    resumes = [f"Candidate {i}\ncandidate{i}@example.com\nPython, Django, {2010 + i} - Present" for i in range(20)]
+    evaluator = BatchResumeEvaluator(client=LLMClient(api_key='stub', base_url=url), batch_size=5)
+    engine = EvaluationEngine(evaluator, max_workers=2, requests_per_minute=0, tokens_per_minute=0)
+
+    start = time.perf_counter()
+    evaluated = evaluator.evaluate_all(resumes, "Senior Python Developer", engine=engine)
+    print(f"{len(evaluated)} resumes in {time.perf_counter() - start:.2f}s with {engine.stats['llm_calls']} requests")
+    print(f"First: {evaluated[0][0]['email']} -> {evaluated[0][1]['fit_label']}")
+    print(f"Stats: {evaluator.stats}")
+    server.shutdown()
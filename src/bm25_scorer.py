@@ -0,0 +1,231 @@
+"""
+BM25 Scorer Module
+Optional ranking engine that scores a batch of resumes against one or more JDs
+with a single sparse matrix product. Requires numpy and scipy.
+"""
+
+import json
+import os
+from typing import Optional, Sequence
+
+from src.skill_taxonomy import get_skill_taxonomy
+from src.resume_index import ResumeIndex
+
+# Sparse matrix support is optional (keyword scoring works without it)
+SPARSE_AVAILABLE = False
+try:
+    import numpy as np
+    from scipy import sparse
+    SPARSE_AVAILABLE = True
+except ImportError:
+    print("[INFO] numpy/scipy not installed - BM25 scoring disabled")
+
+DEFAULT_STATS_FILE = os.path.join('data', 'bm25_stats.json')
+
+
+class BM25Scorer:
+    """
+    BM25 over taxonomy skills.
+    Terms are canonical skills, term frequency is how often a resume mentions a
+    skill, and document length is the resume's token count. Corpus statistics
+    (document count, document frequencies, total length) are updated
+    incrementally as resumes are added and can be persisted between runs.
+    Each resume (by content-hash candidate ID) is counted only once.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75, stats_file: str = DEFAULT_STATS_FILE):
+        """
+        Initialize the scorer and load saved corpus statistics.
+
+        Args:
+            k1: Term frequency saturation
+            b: Document length normalization
+            stats_file: Path to the corpus statistics JSON file (None to keep in memory only)
+        """
+        if not SPARSE_AVAILABLE:
+            raise ImportError("BM25Scorer requires numpy and scipy (pip install numpy scipy)")
+
+        self.k1 = k1
+        self.b = b
+        self.stats_file = stats_file
+        self.taxonomy = get_skill_taxonomy()
+        self.terms = list(self.taxonomy.skills)
+        self.term_index = {term: i for i, term in enumerate(self.terms)}
+
+        self.doc_count = 0
+        self.total_length = 0
+        self.doc_freq = np.zeros(len(self.terms), dtype=np.float64)
+        self.counted_ids = set()
+        self._load_stats()
+
+    def _load_stats(self):
+        """Load corpus statistics saved by a previous run"""
+        if not self.stats_file or not os.path.exists(self.stats_file):
+            return
+        try:
+            with open(self.stats_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.doc_count = data.get('doc_count', 0)
+            self.total_length = data.get('total_length', 0)
+            self.counted_ids = set(data.get('doc_ids', []))
+            for term, df in data.get('doc_freq', {}).items():
+                if term in self.term_index:
+                    self.doc_freq[self.term_index[term]] = df
+        except Exception as e:
+            print(f"[ERROR] Failed to load BM25 statistics: {e}")
+
+    def save_stats(self) -> bool:
+        """Persist corpus statistics"""
+        if not self.stats_file:
+            return False
+        try:
+            os.makedirs(os.path.dirname(self.stats_file) or '.', exist_ok=True)
+            data = {
+                'doc_count': self.doc_count,
+                'total_length': self.total_length,
+                'doc_freq': {term: int(self.doc_freq[i]) for i, term in enumerate(self.terms) if self.doc_freq[i]},
+                'doc_ids': sorted(self.counted_ids)
+            }
+            with open(self.stats_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            return True
+        except Exception as e:
+            print(f"[ERROR] Failed to save BM25 statistics: {e}")
+            return False
+
+    def vectorize(self, texts: Sequence[str]):
+        """
+        Turn texts into a sparse term-frequency matrix.
+
+        Args:
+            texts: Resume texts
+
+        Returns:
+            Tuple of (CSR matrix of shape (len(texts), n_terms), array of document lengths)
+        """
+        rows, cols, values = [], [], []
+        lengths = np.zeros(len(texts), dtype=np.float64)
+
+        for row, text in enumerate(texts):
+            counts, lengths[row] = self.taxonomy.matcher.count_skills(text)
+            for skill, count in counts.items():
+                rows.append(row)
+                cols.append(self.term_index[skill])
+                values.append(count)
+
+        matrix = sparse.csr_matrix(
+            (np.asarray(values, dtype=np.float64), (rows, cols)),
+            shape=(len(texts), len(self.terms))
+        )
+        return matrix, lengths
+
+    def add_documents(self, tf_matrix, lengths, doc_ids: Optional[Sequence[str]] = None) -> int:
+        """
+        Add vectorized documents to the corpus statistics.
+
+        Args:
+            tf_matrix: CSR matrix from vectorize()
+            lengths: Document lengths from vectorize()
+            doc_ids: Optional document IDs, one per row; rows whose ID was
+                     already counted (in this or an earlier run) are skipped
+
+        Returns:
+            Number of documents added
+        """
+        if doc_ids is not None:
+            new_rows = []
+            for row, doc_id in enumerate(doc_ids):
+                if doc_id not in self.counted_ids:
+                    self.counted_ids.add(doc_id)
+                    new_rows.append(row)
+            tf_matrix = tf_matrix[new_rows]
+            lengths = lengths[new_rows]
+
+        self.doc_count += tf_matrix.shape[0]
+        self.total_length += int(lengths.sum())
+        # Document frequency counts each term once per document
+        self.doc_freq += np.bincount(tf_matrix.indices, minlength=len(self.terms))
+        return tf_matrix.shape[0]
+
+    def idf(self):
+        """Non-negative BM25 IDF for every term"""
+        n = max(self.doc_count, 1)
+        return np.log1p((n - self.doc_freq + 0.5) / (self.doc_freq + 0.5))
+
+    def query_matrix(self, jd_skill_lists: Sequence):
+        """
+        Build a sparse matrix of JD skills.
+
+        Args:
+            jd_skill_lists: One entry per JD: a list of canonical skills
+                            (weight 1.0 each) or a dict of skill -> weight
+
+        Returns:
+            CSC matrix of shape (n_terms, len(jd_skill_lists))
+        """
+        rows, cols, values = [], [], []
+        for col, skills in enumerate(jd_skill_lists):
+            weights = skills if isinstance(skills, dict) else dict.fromkeys(skills, 1.0)
+            for skill, weight in weights.items():
+                if skill in self.term_index:
+                    rows.append(self.term_index[skill])
+                    cols.append(col)
+                    values.append(weight)
+        return sparse.csc_matrix(
+            (np.asarray(values, dtype=np.float64), (rows, cols)),
+            shape=(len(self.terms), len(jd_skill_lists))
+        )
+
+    def score_batch(self, texts: Sequence[str], jd_skill_lists: Sequence, update_stats: bool = True,
+                    doc_ids: Optional[Sequence[str]] = None):
+        """
+        Score every resume against every JD with one sparse matrix product.
+
+        Args:
+            texts: Resume texts
+            jd_skill_lists: One list of skills (or dict of skill -> weight) per JD
+            update_stats: Add resumes not counted before to the corpus statistics first
+            doc_ids: Candidate IDs of the resumes (default: content hash of each text)
+
+        Returns:
+            Array of shape (len(texts), len(jd_skill_lists)) with scores 0-100,
+            where 100 means every JD skill is mentioned at least once in an
+            average-length resume
+        """
+        tf, lengths = self.vectorize(texts)
+        if update_stats:
+            if doc_ids is None:
+                doc_ids = [ResumeIndex.make_candidate_id(text) for text in texts]
+            self.add_documents(tf, lengths, doc_ids)
+
+        idf = self.idf()
+        avg_length = self.total_length / self.doc_count if self.doc_count else max(lengths.mean(), 1.0)
+
+        # BM25 term weight for every non-zero entry, row by row
+        row_norm = self.k1 * (1 - self.b + self.b * lengths / avg_length)
+        tf_values = tf.data
+        norms = np.repeat(row_norm, np.diff(tf.indptr))
+        weights = tf.copy()
+        weights.data = idf[tf.indices] * tf_values * (self.k1 + 1) / (tf_values + norms)
+
+        query = self.query_matrix(jd_skill_lists)
+        scores = (weights @ query).toarray()
+
+        # Reference score per JD: each JD skill mentioned once in an average-length resume
+        max_scores = query.T @ idf
+        max_scores[max_scores == 0] = 1.0
+        return np.clip(scores / max_scores * 100, 0, 100)
+
+
+# Example usage (for testing): python -m src.bm25_scorer
+if __name__ == "__main__":
+    scorer = BM25Scorer(stats_file=None)
+    resumes = [
+        "Python developer. Python, Django, PostgreSQL, Docker. Python scripting.",
+        "Java engineer with Spring and Kubernetes",
+        "Data analyst: SQL, pandas, numpy, Tableau",
+    ]
+    jds = [["python", "django", "postgresql", "aws"], ["sql", "pandas", "numpy", "python"]]
+    print(scorer.score_batch(resumes, jds).round(1))
+    scorer.score_batch(resumes, jds)
+    print(f"Corpus after scoring the same batch twice: {scorer.doc_count} documents")
@@ -0,0 +1,193 @@
+"""
+Combined Evaluator Module
+Single-call AI evaluation: one structured-output request returns both the
+candidate data (contact details, experience) and the fit evaluation, instead
+of two requests that each send the full resume and JD. Responses are
+schema-checked; if the model's answer can't be parsed or validated, the
+wrapped two-call evaluator is used for that resume.
+"""
+
+import json
+from typing import Dict, Optional, Tuple
+
+from src.llm_client import LLMClient, LLMError
+
+# Keys (and accepted types) of each half of the combined response
+CANDIDATE_SCHEMA = {
+    'name': (str, type(None)),
+    'email': (str, type(None)),
+    'phone': (str, type(None)),
+    'location': (str, type(None)),
+    'total_years_experience': (int, float, type(None)),
+    'relevant_years_experience': (int, float, type(None)),
+    'experience_brief': (str, type(None))
+}
+EVALUATION_SCHEMA = {
+    'fit_score': (int, float),
+    'fit_label': (str,),
+    'reasoning': (str,),
+    'strengths': (list,),
+    'gaps': (list,)
+}
+
+FIT_SCORE_RANGE = (0, 5)
+
+# Shape of the two response objects (shared with the batch evaluator)
+RESPONSE_FORMAT = """"candidate": {
+  "name": string or null,
+  "email": string or null,
+  "phone": string or null,
+  "location": string or null,
+  "total_years_experience": number or null,
+  "relevant_years_experience": number or null (years relevant to this job),
+  "experience_brief": string or null (one or two sentences)
+}
+"evaluation": {
+  "fit_score": integer 0-5 (5 = excellent fit, 0 = not a fit),
+  "fit_label": string ("Excellent Fit", "Strong Fit", "Good Fit", "Moderate Fit", "Weak Fit" or "Not a Fit"),
+  "reasoning": string (two or three sentences),
+  "strengths": list of strings,
+  "gaps": list of strings
+}
+
+Use null for anything the resume doesn't state. Do not add other keys."""
+
+SYSTEM_PROMPT = """You are an expert technical recruiter screening resumes against a job description.
+Respond with a single JSON object with exactly two keys, "candidate" and "evaluation":
+
+""" + RESPONSE_FORMAT
+
+
+class SchemaError(ValueError):
+    """A combined response didn't match the expected schema."""
+
+
+def _check_fields(payload: Dict, schema: Dict, section: str) -> Dict:
+    """Check one section of the response and return only the schema's keys"""
+    if not isinstance(payload, dict):
+        raise SchemaError(f"'{section}' is not an object")
+    checked = {}
+    for key, types in schema.items():
+        value = payload.get(key)
+        if key not in payload and type(None) not in types:
+            raise SchemaError(f"'{section}.{key}' is missing")
+        if not isinstance(value, types) or isinstance(value, bool):
+            raise SchemaError(f"'{section}.{key}' has unexpected type {type(value).__name__}")
+        checked[key] = value
+    return checked
+
+
+def validate_combined(payload: Dict) -> Tuple[Dict, Dict]:
+    """
+    Validate a combined response and split it into its two halves.
+
+    Args:
+        payload: Parsed JSON response
+
+    Returns:
+        Tuple of (candidate_data, evaluation)
+
+    Raises:
+        SchemaError: If a section or required field is missing or mistyped
+    """
+    if not isinstance(payload, dict):
+        raise SchemaError("response is not a JSON object")
+    candidate_data = _check_fields(payload.get('candidate'), CANDIDATE_SCHEMA, 'candidate')
+    evaluation = _check_fields(payload.get('evaluation'), EVALUATION_SCHEMA, 'evaluation')
+
+    low, high = FIT_SCORE_RANGE
+    if not low <= evaluation['fit_score'] <= high:
+        raise SchemaError(f"'evaluation.fit_score' out of range: {evaluation['fit_score']}")
+    evaluation['fit_score'] = int(round(evaluation['fit_score']))
+    evaluation['strengths'] = [str(item) for item in evaluation['strengths']]
+    evaluation['gaps'] = [str(item) for item in evaluation['gaps']]
+    return candidate_data, evaluation
+
+
+class CombinedResumeEvaluator:
+    """
+    Evaluator that extracts candidate data and scores fit in one LLM call.
+    Exposes extract_and_evaluate() for the evaluation engine, plus the usual
+    extract_candidate_data() / evaluate_resume() (served by the fallback evaluator).
+    """
+
+    PROMPT_VERSION = 'combined-1'
+
+    # Tells EvaluationEngine to use extract_and_evaluate()
+    combined_mode = True
+
+    def __init__(self, fallback_evaluator=None, client: LLMClient = None):
+        """
+        Initialize the evaluator.
+
+        Args:
+            fallback_evaluator: Two-call evaluator used when a combined response is unusable
+            client: LLM client (defaults to one configured from the environment)
+        """
+        self.fallback_evaluator = fallback_evaluator
+        self.client = client or LLMClient()
+        self.model = self.client.model
+        self.stats = {'combined': 0, 'fallbacks': 0}
+
+    @staticmethod
+    def build_messages(resume_text: str, jd_text: str):
+        """Chat messages for one combined request"""
+        return [
+            {'role': 'system', 'content': SYSTEM_PROMPT},
+            {'role': 'user', 'content': f"JOB DESCRIPTION:\n{jd_text}\n\nRESUME:\n{resume_text}"}
+        ]
+
+    def extract_and_evaluate(self, resume_text: str, jd_text: str) -> Tuple[Dict, Dict]:
+        """
+        Extract candidate data and evaluate fit with a single request.
+
+        Args:
+            resume_text: Full resume text
+            jd_text: Job description text
+
+        Returns:
+            Tuple of (candidate_data, evaluation)
+
+        Raises:
+            LLMError: If the request itself fails (network, HTTP status)
+        """
+        try:
+            content, _ = self.client.chat(self.build_messages(resume_text, jd_text), json_mode=True)
+            candidate_data, evaluation = validate_combined(json.loads(content))
+            self.stats['combined'] += 1
+            return candidate_data, evaluation
+        except (json.JSONDecodeError, SchemaError) as e:
+            if self.fallback_evaluator is None:
+                raise LLMError(f"Unusable combined response: {e}")
+            print(f"[WARN] Combined response unusable ({e}) - falling back to two calls")
+
+        self.stats['fallbacks'] += 1
+        return (self.fallback_evaluator.extract_candidate_data(resume_text, jd_text),
+                self.fallback_evaluator.evaluate_resume(resume_text, jd_text))
+
+    def extract_candidate_data(self, resume_text: str, jd_text: str = '') -> Optional[Dict]:
+        """Candidate data only (two-call path when a fallback evaluator is set)"""
+        if self.fallback_evaluator is not None:
+            return self.fallback_evaluator.extract_candidate_data(resume_text, jd_text)
+        return self.extract_and_evaluate(resume_text, jd_text)[0]
+
+    def evaluate_resume(self, resume_text: str, jd_text: str) -> Optional[Dict]:
+        """Fit evaluation only (two-call path when a fallback evaluator is set)"""
+        if self.fallback_evaluator is not None:
+            return self.fallback_evaluator.evaluate_resume(resume_text, jd_text)
+        return self.extract_and_evaluate(resume_text, jd_text)[1]
+
+
+# Example usage (for testing): python -m src.combined_evaluator
+if __name__ == "__main__":
+    from src.llm_stub_server import start_stub_server
+
+    server, url = start_stub_server()
+    evaluator = CombinedResumeEvaluator(client=LLMClient(api_key='stub', base_url=url))
+    candidate, result = evaluator.extract_and_evaluate(
+        "Jane Doe\njane@example.com\nPython developer, 2019 - Present", "Senior Python Developer"
+    )
+    print(f"Candidate: {candidate}")
+    print(f"Evaluation: {result}")
+    print(f"Stats: {evaluator.stats}")
+    server.shutdown()
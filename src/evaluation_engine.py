@@ -0,0 +1,359 @@
+"""
+Evaluation Engine Module
+Runs AI resume evaluations concurrently on a thread pool with bounded
+parallelism and token-bucket rate limits (requests and tokens per minute).
+LLM calls pass through a circuit breaker and an AIMD concurrency limit (see
+llm_resilience), so a failing or throttling provider degrades to a fallback
+score instead of stalling the batch. Results come back in input order.
+Progress callbacks run on the calling thread, so Streamlit widgets can be
+updated from them.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.llm_client import LLMClient, LLMError, env_max_retries, estimate_tokens, is_retryable, retry_delay
+from src.llm_resilience import CLOSED, AIMDLimiter, CircuitBreaker, CircuitOpenError
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_REQUESTS_PER_MINUTE = 60
+DEFAULT_TOKENS_PER_MINUTE = 150000
+
+# Allowance for the prompt template and the model's answer, per call
+PROMPT_OVERHEAD_TOKENS = 800
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter: refills continuously at rate_per_minute and
+    holds at most capacity tokens (one minute's worth by default).
+    A rate of 0 or None means unlimited.
+    """
+
+    def __init__(self, rate_per_minute: Optional[float], capacity: float = None):
+        """
+        Create a full bucket.
+
+        Args:
+            rate_per_minute: Tokens added per minute
+            capacity: Maximum burst (defaults to rate_per_minute)
+        """
+        self.rate_per_second = (rate_per_minute or 0) / 60.0
+        self.capacity = capacity or rate_per_minute or 0
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, amount: float = 1) -> float:
+        """
+        Take tokens, waiting until enough are available.
+
+        Args:
+            amount: Tokens needed (capped at the capacity)
+
+        Returns:
+            Seconds spent waiting
+        """
+        if self.rate_per_second <= 0:
+            return 0.0
+
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate_per_second)
+                self.updated_at = now
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return waited
+                wait = (amount - self.tokens) / self.rate_per_second
+            time.sleep(wait)
+            waited += wait
+
+
+def _env_number(name: str, default: float) -> float:
+    """Read a numeric setting from the environment"""
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        print(f"[WARN] Invalid {name} - using {default}")
+        return default
+
+
+class EvaluationEngine:
+    """
+    Rate-limited, concurrent front end for a resume evaluator (any object with
+    extract_candidate_data(resume_text, jd_text) and evaluate_resume(resume_text, jd_text)).
+    Evaluators with combined_mode set are called once per resume through
+    extract_and_evaluate(resume_text, jd_text) instead.
+    """
+
+    def __init__(self, evaluator, max_workers: int = None, requests_per_minute: float = None,
+                 tokens_per_minute: float = None, compactor=None, breaker: CircuitBreaker = None,
+                 limiter: AIMDLimiter = None, max_retries: int = None):
+        """
+        Initialize the engine. Unset limits come from AI_EVAL_CONCURRENCY,
+        LLM_REQUESTS_PER_MINUTE and LLM_TOKENS_PER_MINUTE.
+
+        Args:
+            evaluator: Resume evaluator to call
+            max_workers: Maximum concurrent resumes
+            requests_per_minute: LLM request rate limit (0 = unlimited)
+            tokens_per_minute: LLM token rate limit (0 = unlimited)
+            compactor: Optional ResumeCompactor applied to resume text before the LLM
+            breaker: Circuit breaker for LLM calls (defaults to CircuitBreaker())
+            limiter: Adaptive concurrency limit for LLM calls (defaults to AIMDLimiter(max_workers))
+            max_retries: Retries for throttled (429) and 5xx calls (defaults to LLM_MAX_RETRIES, then 2).
+                         The engine retries these itself, so the evaluator's LLMClient is set to
+                         not retry: waits then happen outside the concurrency limit, and every
+                         429 lowers it
+        """
+        self.evaluator = evaluator
+        self.compactor = compactor
+        self.max_workers = max(1, int(max_workers or _env_number('AI_EVAL_CONCURRENCY', DEFAULT_CONCURRENCY)))
+        self.request_bucket = TokenBucket(
+            requests_per_minute if requests_per_minute is not None
+            else _env_number('LLM_REQUESTS_PER_MINUTE', DEFAULT_REQUESTS_PER_MINUTE)
+        )
+        self.token_bucket = TokenBucket(
+            tokens_per_minute if tokens_per_minute is not None
+            else _env_number('LLM_TOKENS_PER_MINUTE', DEFAULT_TOKENS_PER_MINUTE)
+        )
+        self.breaker = breaker or CircuitBreaker()
+        self.limiter = limiter or AIMDLimiter(self.max_workers)
+        self.max_retries = max(0, max_retries if max_retries is not None else env_max_retries())
+        client = getattr(evaluator, 'client', None)
+        if isinstance(client, LLMClient):
+            client.max_retries = 0
+        self.stats = {'llm_calls': 0, 'rate_limit_wait': 0.0, 'prescreened': 0, 'llm_calls_saved': 0,
+                      'resume_tokens_original': 0, 'resume_tokens_sent': 0, 'fallbacks': 0, 'llm_retries': 0}
+        self._stats_lock = threading.Lock()
+
+    def call_llm(self, method: Callable, *args, prompt_text: str = '') -> Any:
+        """
+        Call an evaluator method once the breaker and rate limits allow it.
+        Calls the evaluator can answer from its cache skip the limits.
+        Throttled (429) and 5xx errors are retried with backoff (Retry-After
+        when given) without holding a concurrency slot. Errors that remain and
+        empty answers count against the circuit breaker; every 429 and slow
+        answers lower the concurrency limit.
+
+        Args:
+            method: Bound evaluator method
+            *args: Method arguments
+            prompt_text: Text sent to the LLM, for the token estimate
+
+        Returns:
+            The method's return value
+
+        Raises:
+            CircuitOpenError: If the breaker is open (the LLM was not called)
+        """
+        # Cached answers (CachedResumeEvaluator) don't reach the provider
+        is_cached = getattr(self.evaluator, 'is_cached', None)
+        if is_cached is not None and is_cached(method.__name__, *args):
+            return method(*args)
+
+        for attempt in range(self.max_retries + 1):
+            if not self.breaker.allow_request():
+                raise CircuitOpenError("LLM circuit is open - provider failing or too slow")
+
+            waited = self.request_bucket.acquire(1)
+            waited += self.token_bucket.acquire(estimate_tokens(prompt_text) + PROMPT_OVERHEAD_TOKENS)
+            with self._stats_lock:
+                self.stats['llm_calls'] += 1
+                self.stats['rate_limit_wait'] += waited
+
+            error = None
+            with self.limiter:
+                start = time.monotonic()
+                try:
+                    result = method(*args)
+                except LLMError as e:
+                    error = e
+                except Exception:
+                    self.breaker.record(False, time.monotonic() - start)
+                    raise
+                latency = time.monotonic() - start
+
+            if error is None:
+                break
+            if error.status_code == 429:
+                self.limiter.on_congestion()
+            # Retried failures don't count against the breaker; a half-open trial isn't retried
+            if (not is_retryable(error.status_code) or attempt == self.max_retries
+                    or self.breaker.state != CLOSED):
+                self.breaker.record(False, latency)
+                raise error
+            wait = retry_delay(attempt, error.retry_after)
+            with self._stats_lock:
+                self.stats['llm_retries'] += 1
+            print(f"[WARN] LLM call failed with status {error.status_code} - retrying in {wait:.1f}s")
+            time.sleep(wait)  # Outside the limiter, so the slot is free while waiting
+
+        # Evaluators that swallow errors signal them with an empty answer
+        success = bool(result) and (not isinstance(result, tuple) or all(result))
+        self.breaker.record(success, latency)
+        if success:
+            self.limiter.on_success(latency)
+        return result
+
+    def get_resilience_stats(self) -> Dict:
+        """Circuit breaker state and the current adaptive concurrency limit"""
+        return {
+            'fallbacks': self.stats['fallbacks'],
+            'breaker': self.breaker.get_stats(),
+            'concurrency_limit': int(self.limiter.limit),
+            'concurrency_decreases': self.limiter.decreases
+        }
+
+    def process_resume(self, resume_text: str, jd_text: str,
+                       prescreen: Callable[[str], Optional[Dict]] = None,
+                       fallback: Callable[[str], Dict] = None) -> Tuple[Dict, Dict]:
+        """
+        Run candidate-data extraction and fit evaluation for one resume.
+        Failures are returned as an error evaluation (or the fallback
+        evaluation) instead of raised.
+
+        Args:
+            resume_text: Full resume text
+            jd_text: Job description text
+            prescreen: Optional cheap check returning an evaluation for resumes
+                       that shouldn't reach the LLM (e.g. KeywordPrescreen)
+            fallback: Optional evaluation used when the LLM fails or the circuit
+                      is open (e.g. KeywordPrescreen.keyword_evaluation)
+
+        Returns:
+            Tuple of (candidate_data, evaluation)
+        """
+        if prescreen is not None:
+            screened = prescreen(resume_text)
+            if screened is not None:
+                with self._stats_lock:
+                    self.stats['prescreened'] += 1
+                    self.stats['llm_calls_saved'] += 1 if getattr(self.evaluator, 'combined_mode', False) else 2
+                return {}, screened
+
+        if self.compactor is not None:
+            resume_text, compaction = self.compactor.compact(resume_text)
+            print(f"[INFO] Compacted resume for LLM: {compaction['original_tokens']} -> "
+                  f"{compaction['compacted_tokens']} tokens ({compaction['ratio']:.0%})")
+            with self._stats_lock:
+                self.stats['resume_tokens_original'] += compaction['original_tokens']
+                self.stats['resume_tokens_sent'] += compaction['compacted_tokens']
+
+        original_text = resume_text
+        prompt_text = resume_text + jd_text
+        try:
+            if getattr(self.evaluator, 'combined_mode', False):
+                candidate_data, evaluation = self.call_llm(self.evaluator.extract_and_evaluate, resume_text, jd_text,
+                                                           prompt_text=prompt_text)
+                return candidate_data or {}, evaluation or {}
+
+            candidate_data = self.call_llm(self.evaluator.extract_candidate_data, resume_text, jd_text,
+                                           prompt_text=prompt_text)
+            evaluation = self.call_llm(self.evaluator.evaluate_resume, resume_text, jd_text,
+                                       prompt_text=prompt_text)
+            return candidate_data or {}, evaluation or {}
+        except Exception as e:
+            if fallback is not None:
+                if not isinstance(e, CircuitOpenError):
+                    print(f"[WARN] AI evaluation failed, using fallback score: {e}")
+                with self._stats_lock:
+                    self.stats['fallbacks'] += 1
+                return {}, fallback(original_text)
+            print(f"[ERROR] AI evaluation failed: {e}")
+            return {}, {
+                'fit_score': 0,
+                'fit_label': 'Evaluation Failed',
+                'reasoning': f"AI evaluation failed: {e}",
+                'strengths': [],
+                'gaps': []
+            }
+
+    def run(self, items: Iterable[Any], task: Callable[[Any], Any],
+            on_result: Callable[[int, Any, int, int], None] = None) -> List[Any]:
+        """
+        Run task over items on the thread pool.
+
+        Args:
+            items: Inputs
+            task: Function applied to each input (runs on a worker thread)
+            on_result: Optional callback(index, result, completed, total), called on
+                       this thread as each task finishes (in completion order)
+
+        Returns:
+            Results in input order (None for tasks that raised)
+        """
+        items = list(items)
+        results = [None] * len(items)
+        completed = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(task, item): index for index, item in enumerate(items)}
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    print(f"[ERROR] Evaluation task {index + 1} failed: {e}")
+                completed += 1
+                if on_result is not None:
+                    on_result(index, results[index], completed, len(items))
+
+        return results
+
+    def evaluate_resumes(self, resume_texts: List[str], jd_text: str,
+                         on_result: Callable[[int, Any, int, int], None] = None,
+                         prescreen: Callable[[str], Optional[Dict]] = None,
+                         fallback: Callable[[str], Dict] = None) -> List[Tuple[Dict, Dict]]:
+        """
+        Evaluate resumes concurrently against one JD.
+
+        Args:
+            resume_texts: Resume texts
+            jd_text: Job description text
+            on_result: Optional progress callback, see run()
+            prescreen: Optional pre-screen, see process_resume()
+            fallback: Optional fallback evaluation, see process_resume()
+
+        Returns:
+            One (candidate_data, evaluation) tuple per resume, in input order
+        """
+        return self.run(resume_texts, lambda text: self.process_resume(text, jd_text, prescreen, fallback), on_result)
+
+
+# Example usage (for testing): python -m src.evaluation_engine
+if __name__ == "__main__":
+    from src.llm_client import LLMClient
+    from src.llm_stub_server import start_stub_server
+
+    class StubEvaluator:
+        """Two-call evaluator against the local stub server."""
+
+        def __init__(self, base_url):
+            self.client = LLMClient(api_key='stub', base_url=base_url)
+
+        def extract_candidate_data(self, resume_text, jd_text):
+            return self.client.chat_json([{'role': 'user', 'content': f"Extract candidate data.\n{resume_text}\n{jd_text}"}])
+
+        def evaluate_resume(self, resume_text, jd_text):
+            return self.client.chat_json([{'role': 'user', 'content': f"Evaluate fit.\n{resume_text}\n{jd_text}"}])
+
+    server, url = start_stub_server(latency=0.25)
+    resumes = [f"Resume {i}: candidate{i}@example.com, Python, Django" for i in range(12)]
+
+    for workers in (1, 4):
+        engine = EvaluationEngine(StubEvaluator(url), max_workers=workers, requests_per_minute=600, tokens_per_minute=0)
+        start = time.perf_counter()
+        evaluated = engine.evaluate_resumes(
+            resumes, "Python developer JD",
+            on_result=lambda index, result, done, total: print(f"  {done}/{total} done (resume {index + 1})")
+        )
+        print(f"{workers} worker(s): {time.perf_counter() - start:.2f}s, {engine.stats['llm_calls']} LLM calls, "
+              f"first score {evaluated[0][1]['fit_score']}")
+    server.shutdown()
@@ -0,0 +1,372 @@
+"""
+Evaluation Jobs Module
+The AI Evaluator pipeline (parse -> keyword pre-screen -> LLM evaluation ->
+save scores) as a queue job. evaluation_worker.py runs these jobs in the
+background; the app can also run one inline. Each candidate's result is
+written to the job queue as soon as it is evaluated.
+"""
+
+import os
+import shutil
+import time
+import traceback
+from typing import Dict
+
+from src.resume_parser import ResumeParser
+from src.jd_matcher import JDMatcher
+from src.resume_index import ResumeIndex
+from src.score_store import NUMPY_AVAILABLE as SCORE_HISTORY_AVAILABLE, ScoreMatrixStore
+from src.score_sketch import ScoreSketchStore, ai_scores_key
+from src.leaderboard import Leaderboard
+from src.evaluation_engine import EvaluationEngine
+from src.llm_cache import CachedResumeEvaluator
+from src.combined_evaluator import CombinedResumeEvaluator
+from src.prescreen import KeywordPrescreen, SCREENED_OUT_LABEL
+from src.resume_compactor import ResumeCompactor
+from src.job_queue import DONE, FAILED
+
+AI_EVALUATION_JOB = 'ai_evaluation'
+
+EVALUATION_FAILED_LABEL = 'Evaluation Failed'
+
+# The app saves each job's uploads to resumes/<job_id>/. They are kept after
+# the job completes (the Review step uploads them to Drive) and pruned later.
+JOB_UPLOADS_ROOT = 'resumes'
+DEFAULT_UPLOAD_RETENTION_HOURS = 24
+
+
+def build_ai_evaluator():
+    """
+    Create the AI Evaluator's evaluator stack: ResumeEvaluator, optionally
+    behind the single-call CombinedResumeEvaluator (AI_EVAL_COMBINED), behind
+    the persistent LLM cache.
+    """
+    from src.resume_evaluator import ResumeEvaluator
+    evaluator = ResumeEvaluator()
+    # Combined mode: one LLM call per resume, falling back to the two-call evaluator
+    if os.getenv('AI_EVAL_COMBINED', 'true').lower() == 'true':
+        evaluator = CombinedResumeEvaluator(fallback_evaluator=evaluator)
+    # Repeat evaluations (reruns, double clicks) are answered from the local LLM cache
+    return CachedResumeEvaluator(evaluator)
+
+
+def combine_result(resume: Dict, candidate_data: Dict, evaluation: Dict, resume_parser: ResumeParser,
+                   jd_text: str) -> Dict:
+    """
+    Combine an AI evaluation with the parser fallbacks into one result row.
+
+    Args:
+        resume: Parsed resume (filename, resume_text, total_years_experience, candidate_id)
+        candidate_data: AI-extracted candidate data
+        evaluation: AI fit evaluation
+        resume_parser: Parser used for fallback extraction
+        jd_text: Job description text
+
+    Returns:
+        Result dictionary as shown on the AI Evaluator page
+    """
+    candidate_data = dict(candidate_data or {})
+    evaluation = evaluation or {}
+    print(f"[DEBUG] Extracted candidate data: {candidate_data}")
+
+    # Fallback: If AI didn't extract name/phone/email, try traditional parser
+    if not candidate_data.get('name') or not candidate_data.get('phone') or not candidate_data.get('email'):
+        print(f"[DEBUG] AI extraction incomplete, trying fallback parser...")
+        fallback_name = resume_parser.extract_name(resume['resume_text'], resume['filename'])
+        fallback_phone = resume_parser.extract_phone(resume['resume_text'])
+        fallback_email = resume_parser.extract_email(resume['resume_text'])
+        fallback_location = resume_parser.extract_location(resume['resume_text'])
+
+        # Use fallback values if AI returned None
+        if not candidate_data.get('name') and fallback_name:
+            candidate_data['name'] = fallback_name
+            print(f"[DEBUG] Used fallback name: {fallback_name}")
+        if not candidate_data.get('phone') and fallback_phone:
+            candidate_data['phone'] = fallback_phone
+            print(f"[DEBUG] Used fallback phone: {fallback_phone}")
+        if not candidate_data.get('email') and fallback_email:
+            candidate_data['email'] = fallback_email
+            print(f"[DEBUG] Used fallback email: {fallback_email}")
+        if not candidate_data.get('location') and fallback_location:
+            candidate_data['location'] = fallback_location
+            print(f"[DEBUG] Used fallback location: {fallback_location}")
+
+    # Fallback: experience from the resume's date ranges if AI didn't return it
+    if candidate_data.get('total_years_experience') is None and resume['total_years_experience'] is not None:
+        candidate_data['total_years_experience'] = resume['total_years_experience']
+        print(f"[DEBUG] Used date-range total experience: {resume['total_years_experience']}")
+    if candidate_data.get('relevant_years_experience') is None and resume['total_years_experience'] is not None:
+        jd_skills = resume_parser.experience_extractor.skill_matcher.find_skills(jd_text)
+        relevant_years = resume_parser.experience_extractor.extract(resume['resume_text'], jd_skills)['relevant_years_experience']
+        candidate_data['relevant_years_experience'] = relevant_years
+        print(f"[DEBUG] Used date-range relevant experience: {relevant_years}")
+
+    print(f"[DEBUG] Evaluation result: fit_score={evaluation.get('fit_score')}, fit_label={evaluation.get('fit_label')}")
+
+    # Combine results
+    result = {
+        'filename': resume['filename'],
+        'candidate_id': resume['candidate_id'],
+        'candidate_name': candidate_data.get('name'),
+        'email': candidate_data.get('email'),
+        'phone': candidate_data.get('phone'),
+        'location': candidate_data.get('location'),
+        'total_years_experience': candidate_data.get('total_years_experience'),
+        'relevant_years_experience': candidate_data.get('relevant_years_experience'),
+        'experience_brief': candidate_data.get('experience_brief'),
+        'fit_score': evaluation.get('fit_score', 0),
+        'fit_label': evaluation.get('fit_label', 'Unknown'),
+        'reasoning': evaluation.get('reasoning', ''),
+        'strengths': evaluation.get('strengths', []),
+        'gaps': evaluation.get('gaps', [])
+    }
+    # Pre-screened and keyword-fallback evaluations carry the keyword score they came from
+    if evaluation.get('keyword_score') is not None:
+        result['keyword_score'] = evaluation['keyword_score']
+    print(f"[DEBUG] Combined result: name={result['candidate_name']}, phone={result['phone']}, email={result['email']}, location={result['location']}, total_yrs={result['total_years_experience']}, relevant_yrs={result['relevant_years_experience']}, exp_brief={result['experience_brief']}, score={result['fit_score']}")
+    return result
+
+
+def save_scores(results, role_id: str, role_name: str):
+    """
+    Record AI scores (0-5, stored as 0-100) in the score history, the role's
+    AI score distribution and its AI leaderboard. All three use the role's AI
+    key (ai_scores_key), apart from its keyword scores.
+
+    Results scored on keywords (pre-screened out, or the keyword fallback when
+    the LLM was unavailable) are kept out of the AI stores: their keyword
+    score (0-100) goes to the role's keyword score history and keyword
+    leaderboard, tagged with its real source, so it never ranks against or
+    replaces an AI score. Failed evaluations are skipped.
+    """
+    ai_results = [r for r in results
+                  if r.get('keyword_score') is None and r['fit_label'] != EVALUATION_FAILED_LABEL]
+    keyword_results = [r for r in results if r.get('keyword_score') is not None]
+
+    # Record scores (0-100) in the local score history
+    if SCORE_HISTORY_AVAILABLE:
+        score_store = ScoreMatrixStore()
+        if ai_results:
+            score_store.set_scores(
+                [r['candidate_id'] for r in ai_results],
+                [ai_scores_key(role_id)],
+                [[r['fit_score'] * 20] for r in ai_results]
+            )
+        if keyword_results:
+            score_store.set_scores(
+                [r['candidate_id'] for r in keyword_results],
+                [role_id],
+                [[r['keyword_score']] for r in keyword_results]
+            )
+
+    # Add the batch to this role's AI score distribution (keyword scores are
+    # only known for the screened-out/fallback subset, which would skew the
+    # role's keyword distribution, so they aren't added there)
+    if ai_results:
+        sketch_store = ScoreSketchStore()
+        sketch_store.record(ai_scores_key(role_id), [r['fit_score'] * 20 for r in ai_results])
+        sketch_store.save()
+
+    # Update this role's leaderboard in place
+    def leaderboard_entry(r):
+        keyword_scored = r.get('keyword_score') is not None
+        if not keyword_scored:
+            source = 'AI Evaluator'
+        elif r['fit_label'] == SCREENED_OUT_LABEL:
+            source = 'Keyword pre-screen'
+        else:
+            source = 'Keyword fallback'
+        return {
+            'role_id': role_id if keyword_scored else ai_scores_key(role_id),
+            'role_name': role_name,
+            'candidate_id': r['candidate_id'],
+            'candidate_name': r['candidate_name'] or r['filename'],
+            'email': r['email'] or '',
+            'score': r['keyword_score'] if keyword_scored else r['fit_score'] * 20,
+            'fit_label': r['fit_label'],
+            'source': source
+        }
+
+    Leaderboard().record_many(leaderboard_entry(r) for r in ai_results + keyword_results)
+
+
+def run_ai_evaluation(queue, job: Dict) -> Dict:
+    """
+    Parse, pre-screen, evaluate and save one AI Evaluator batch.
+
+    Args:
+        queue: JobQueue the job came from (progress and results are written to it)
+        job: Claimed job; payload has files, resumes_folder, jd_file_path, jd_text, role_id, role_name
+
+    Returns:
+        Job summary (parse errors, pre-screen, cache and resilience stats)
+    """
+    job_id = job['job_id']
+    claim_token = job.get('claim_token')
+    payload = job['payload']
+    jd_text = payload['jd_text']
+    files = payload['files']
+    resumes_folder = payload.get('resumes_folder', 'resumes')
+
+    # Parse resumes
+    resume_parser = ResumeParser()
+    resume_index = ResumeIndex()
+    resumes = []
+    parse_errors = []
+    for position, filename in enumerate(files):
+        queue.update_progress(job_id, position, len(files), stage='Parsing resumes', claim_token=claim_token)
+        try:
+            parsed_data = resume_parser.parse_resume(os.path.join(resumes_folder, filename))
+            if parsed_data and parsed_data.get('resume_text'):
+                resumes.append({
+                    'filename': filename,
+                    'resume_text': parsed_data['resume_text'],
+                    'total_years_experience': parsed_data.get('total_years_experience'),
+                    'candidate_id': resume_index.add_candidate(parsed_data, source_file=filename)
+                })
+            else:
+                parse_errors.append(f"{filename}: no text could be extracted")
+        except Exception as e:
+            parse_errors.append(f"{filename}: {e}")
+    resume_index.save()
+
+    if not resumes:
+        raise ValueError("No resumes could be parsed successfully")
+
+    # Evaluate: extraction and evaluation calls run concurrently (rate limited);
+    # resumes below the keyword floor are labeled without an LLM call, and the
+    # keyword score stands in when the LLM fails or its circuit breaker is open
+    evaluator = build_ai_evaluator()
+    engine = EvaluationEngine(evaluator, compactor=ResumeCompactor())
+    prescreen = KeywordPrescreen(JDMatcher(payload['jd_file_path']))
+    results = [None] * len(resumes)
+    queue.update_progress(job_id, 0, len(resumes), stage='Evaluating', claim_token=claim_token)
+
+    def on_evaluated(index, outcome, completed, total):
+        candidate_data, evaluation = outcome or ({}, {})
+        results[index] = combine_result(resumes[index], candidate_data, evaluation, resume_parser, jd_text)
+        queue.add_result(job_id, index, results[index], claim_token=claim_token)
+        queue.update_progress(job_id, completed, total, claim_token=claim_token)
+
+    engine.evaluate_resumes([resume['resume_text'] for resume in resumes], jd_text,
+                            on_result=on_evaluated, prescreen=prescreen, fallback=prescreen.keyword_evaluation)
+    if engine.stats['resume_tokens_original']:
+        print(f"[INFO] Resume compaction: {engine.stats['resume_tokens_original']} -> "
+              f"{engine.stats['resume_tokens_sent']} tokens "
+              f"({engine.stats['resume_tokens_sent'] / engine.stats['resume_tokens_original']:.0%})")
+
+    if not queue.update_progress(job_id, len(resumes), len(resumes), stage='Saving scores', claim_token=claim_token):
+        # Requeued as stale while we ran: its new owner saves the scores
+        raise RuntimeError("Job was requeued and claimed by another worker")
+    save_scores(results, payload['role_id'], payload['role_name'])
+
+    return {
+        'evaluated': len(results),
+        'parse_errors': parse_errors,
+        'prescreen': {
+            'screened_out': engine.stats['prescreened'],
+            'llm_calls_saved': engine.stats['llm_calls_saved'],
+            'floor': prescreen.floor if prescreen.enabled else 0
+        },
+        'cache': evaluator.cache.get_stats(),
+        'resilience': engine.get_resilience_stats()
+    }
+
+
+JOB_HANDLERS = {AI_EVALUATION_JOB: run_ai_evaluation}
+
+
+def job_uploads_folder(job_id: str) -> str:
+    """Folder the app saves a job's uploaded resumes to"""
+    return os.path.join(JOB_UPLOADS_ROOT, job_id)
+
+
+def remove_job_uploads(job: Dict) -> bool:
+    """
+    Delete a job's upload folder (only if it is the job's own resumes/<job_id> folder).
+
+    Returns:
+        True if a folder was removed
+    """
+    folder = job['payload'].get('resumes_folder', '')
+    if os.path.normpath(folder) != os.path.normpath(job_uploads_folder(job['job_id'])) or not os.path.isdir(folder):
+        return False
+    shutil.rmtree(folder, ignore_errors=True)
+    return True
+
+
+def prune_job_uploads(queue, retention_hours: float = None) -> int:
+    """
+    Delete upload folders of jobs that finished (or failed) more than the
+    retention period ago, and of jobs the queue no longer knows.
+
+    Args:
+        queue: JobQueue the jobs belong to
+        retention_hours: How long to keep them (defaults to AI_EVAL_UPLOAD_RETENTION_HOURS, then 24)
+
+    Returns:
+        Number of folders removed
+    """
+    if retention_hours is None:
+        try:
+            retention_hours = float(os.getenv('AI_EVAL_UPLOAD_RETENTION_HOURS', DEFAULT_UPLOAD_RETENTION_HOURS))
+        except ValueError:
+            print(f"[WARN] Invalid AI_EVAL_UPLOAD_RETENTION_HOURS - using {DEFAULT_UPLOAD_RETENTION_HOURS}")
+            retention_hours = DEFAULT_UPLOAD_RETENTION_HOURS
+    if not os.path.isdir(JOB_UPLOADS_ROOT):
+        return 0
+
+    cutoff = time.time() - retention_hours * 3600
+    removed = 0
+    for name in os.listdir(JOB_UPLOADS_ROOT):
+        folder = os.path.join(JOB_UPLOADS_ROOT, name)
+        if not os.path.isdir(folder):
+            continue
+        job = queue.get_job(name)
+        if job is None:
+            # Uploads are saved just before the job is submitted, so only remove old orphans
+            expired = os.path.getmtime(folder) < cutoff
+        else:
+            expired = job['status'] in (DONE, FAILED) and (job['finished_at'] or 0) < cutoff
+        if expired:
+            shutil.rmtree(folder, ignore_errors=True)
+            removed += 1
+    if removed:
+        print(f"[OK] Removed {removed} old job upload folder(s)")
+    return removed
+
+
+def process_job(queue, job: Dict) -> bool:
+    """
+    Run a claimed job and record its outcome.
+
+    Args:
+        queue: JobQueue the job came from
+        job: Claimed job
+
+    Returns:
+        True if the job completed
+    """
+    claim_token = job.get('claim_token')
+    handler = JOB_HANDLERS.get(job['job_type'])
+    if handler is None:
+        if queue.fail(job['job_id'], f"Unknown job type: {job['job_type']}", claim_token=claim_token):
+            remove_job_uploads(job)
+        return False
+
+    print(f"[INFO] Running {job['job_type']} job {job['job_id']}")
+    try:
+        summary = handler(queue, job)
+        if not queue.complete(job['job_id'], summary, claim_token=claim_token):
+            print(f"[WARN] Job {job['job_id']} was requeued while running - result discarded")
+            return False
+        print(f"[OK] Job {job['job_id']} complete")
+        return True
+    except Exception as e:
+        print(f"[ERROR] Job {job['job_id']} failed: {e}")
+        traceback.print_exc()
+        # A failed job has nothing left to save, so its uploads can go now
+        # (unless it was requeued, when its new owner still needs them)
+        if queue.fail(job['job_id'], str(e), claim_token=claim_token):
+            remove_job_uploads(job)
+        return False
@@ -0,0 +1,251 @@
+"""
+Experience Extractor Module
+Deterministic years-of-experience extraction from resume date ranges
+("Jan 2019 – Present", "03/2018 - 06/2020", "2017-2020", "2019 till date").
+Overlapping jobs are merged so parallel roles aren't double counted, and
+ranges in the education section (or next to a degree) are not counted as work.
+"""
+
+import bisect
+import re
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.skill_taxonomy import get_skill_taxonomy
+
+MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+# One side of a range: "Jan 2019", "January, 2019", "01/2019", "2019-01", "2019"
+_MONTH_NAME = r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?'
+_DATE = (
+    r'(?:(?P<{p}mon>' + _MONTH_NAME + r')[\s,\']*(?P<{p}myear>(?:19|20)\d{{2}})'
+    r'|(?P<{p}num>0?[1-9]|1[0-2])\s*[/.-]\s*(?P<{p}nyear>(?:19|20)\d{{2}})'
+    r'|(?P<{p}iyear>(?:19|20)\d{{2}})-(?P<{p}imon>0[1-9]|1[0-2])(?!\d)'
+    r'|(?P<{p}year>(?:19|20)\d{{2}}))'
+)
+_PRESENT = r'(?P<present>present|current|currently|now|till date|to date|ongoing)'
+
+# "2019 - Present", "2019 to 2021", and "2019 till date" (where "till"/"to" is part of the end)
+DATE_RANGE_PATTERN = re.compile(
+    r'(?<![\d/])' + _DATE.format(p='s') + r'\s*'
+    r'(?:(?:-|–|—|to|till|until)\s*(?:' + _PRESENT + r'|' + _DATE.format(p='e') + r')'
+    r'|(?P<present_phrase>(?:till|to|until)\s+date))(?![\d/])',
+    re.IGNORECASE
+)
+
+# Section headings: ranges under an education heading aren't work experience
+EDUCATION_HEADER_PATTERN = re.compile(
+    r'^\s*(?:education(?:al)?(?: qualifications?| details| background)?|academics?(?: details)?|'
+    r'academic qualifications?|qualifications?)\s*:?\s*$',
+    re.IGNORECASE
+)
+SECTION_HEADER_PATTERN = re.compile(
+    r'^\s*(?:(?:professional |work |relevant )?experience|employment(?: history)?|work history|career(?: history)?|'
+    r'projects?|internships?|skills|technical skills|certifications?|achievements|awards|summary|profile|'
+    r'personal details|hobbies|interests)\s*:?\s*$',
+    re.IGNORECASE
+)
+# Degree mentions on the same line as a range ("B.Tech 2012 - 2016")
+DEGREE_PATTERN = re.compile(
+    r'(?<![a-z])(?:b\.?\s?tech|m\.?\s?tech|b\.e\.|m\.e\.|b\.?sc|m\.?sc|bca|mca|bba|mba|ph\.?d|'
+    r'bachelor|master\'?s? (?:of|in|degree)|diploma|hsc|ssc|10th|12th|cgpa|gpa|graduated)(?![a-z])',
+    re.IGNORECASE
+)
+
+
+def _month_index(year: int, month: int) -> int:
+    """Months since year 0 (so intervals are plain integers)"""
+    return year * 12 + (month - 1)
+
+
+def _parse_side(match, prefix: str, is_end: bool) -> Optional[int]:
+    """Convert one side of a matched range to a month index"""
+    group = match.groupdict()
+    if group[prefix + 'mon']:
+        return _month_index(int(group[prefix + 'myear']), MONTHS[group[prefix + 'mon'][:3].lower()])
+    if group[prefix + 'num']:
+        return _month_index(int(group[prefix + 'nyear']), int(group[prefix + 'num']))
+    if group[prefix + 'iyear']:
+        return _month_index(int(group[prefix + 'iyear']), int(group[prefix + 'imon']))
+    if group[prefix + 'year']:
+        # A bare year is taken as January on both sides ("2017-2020" is about 3 years, not 4)
+        return _month_index(int(group[prefix + 'year']), 1)
+    return None
+
+
+def merge_intervals(intervals: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Merge overlapping or touching [start, end] month intervals.
+
+    Args:
+        intervals: (start_month, end_month) pairs
+
+    Returns:
+        Sorted, non-overlapping intervals
+    """
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def total_years(intervals: Iterable[Tuple[int, int]]) -> float:
+    """Total years covered by month intervals (merged first), rounded to 0.1"""
+    months = sum(end - start + 1 for start, end in merge_intervals(intervals))
+    return round(months / 12, 1)
+
+
+class ExperienceExtractor:
+    """
+    Finds employment date ranges in resume text and computes total and
+    per-skill years of experience. A skill is credited with a range when it
+    appears in the text between that range and the next one (the job entry).
+    """
+
+    def __init__(self, today: date = None):
+        """
+        Initialize the extractor.
+
+        Args:
+            today: Date used for "Present" (defaults to today)
+        """
+        self.today = today or date.today()
+        self.skill_matcher = get_skill_taxonomy().matcher
+
+    @staticmethod
+    def education_spans(text: str) -> List[Tuple[int, int]]:
+        """
+        Character spans of education sections: from an education heading to
+        the next recognised section heading (or the end of the text).
+
+        Args:
+            text: Resume text
+
+        Returns:
+            List of (start, end) character offsets
+        """
+        spans = []
+        section_start = None
+        offset = 0
+        for line in text.split('\n'):
+            if EDUCATION_HEADER_PATTERN.match(line):
+                if section_start is None:
+                    section_start = offset
+            elif section_start is not None and SECTION_HEADER_PATTERN.match(line):
+                spans.append((section_start, offset))
+                section_start = None
+            offset += len(line) + 1
+        if section_start is not None:
+            spans.append((section_start, len(text)))
+        return spans
+
+    def find_date_ranges(self, text: str) -> List[Tuple[int, int, int, int]]:
+        """
+        Find all date ranges in the text.
+
+        Args:
+            text: Resume text
+
+        Returns:
+            List of (start_month, end_month, match_start, match_end); months are month indexes
+        """
+        current = _month_index(self.today.year, self.today.month)
+        education = self.education_spans(text)
+        education_starts = [span_start for span_start, _ in education]
+        ranges = []
+        for match in DATE_RANGE_PATTERN.finditer(text):
+            # Skip study periods: inside an education section or on a line naming a degree
+            section = bisect.bisect_right(education_starts, match.start()) - 1
+            if section >= 0 and match.start() < education[section][1]:
+                continue
+            line_start = text.rfind('\n', 0, match.start()) + 1
+            line_end = text.find('\n', match.end())
+            if DEGREE_PATTERN.search(text[line_start:line_end if line_end != -1 else len(text)]):
+                continue
+
+            start = _parse_side(match, 's', is_end=False)
+            present = match.group('present') or match.group('present_phrase')
+            end = current if present else _parse_side(match, 'e', is_end=True)
+            # Skip impossible or future ranges (e.g. "2019-2015", education years far ahead)
+            if start is None or end is None or end < start or start > current:
+                continue
+            ranges.append((start, min(end, current), match.start(), match.end()))
+        return ranges
+
+    def extract(self, text: str, skills_of_interest: Iterable[str] = None) -> Dict:
+        """
+        Compute total and per-skill experience.
+
+        Args:
+            text: Resume text
+            skills_of_interest: Optional skills (e.g. JD keywords) to compute
+                                relevant_years_experience for
+
+        Returns:
+            Dictionary with total_years_experience, relevant_years_experience
+            (None without skills_of_interest), skill_years (skill -> years)
+            and date_ranges (number of ranges found)
+        """
+        ranges = self.find_date_ranges(text)
+        education_starts = [span_start for span_start, _ in self.education_spans(text)]
+
+        # Each job entry spans from its date range to the next one
+        skill_intervals = {}
+        for i, (start, end, match_start, _) in enumerate(ranges):
+            # The entry starts on the line before the dates (job title / company)
+            # and runs until the next entry's dates
+            line_start = text.rfind('\n', 0, match_start)
+            block_start = text.rfind('\n', 0, max(line_start, 0)) + 1
+            if i > 0:
+                block_start = max(block_start, ranges[i - 1][3])
+            block_end = ranges[i + 1][2] if i + 1 < len(ranges) else len(text)
+            # A job entry never runs into the education section
+            next_education = bisect.bisect_right(education_starts, match_start)
+            if next_education < len(education_starts):
+                block_end = min(block_end, education_starts[next_education])
+            for skill in self.skill_matcher.find_skills(text[block_start:block_end]):
+                skill_intervals.setdefault(skill, []).append((start, end))
+
+        skill_years = {skill: total_years(intervals) for skill, intervals in skill_intervals.items()}
+
+        relevant = None
+        if skills_of_interest is not None:
+            wanted = set(skills_of_interest)
+            relevant_intervals = [interval for skill, intervals in skill_intervals.items()
+                                  if skill in wanted for interval in intervals]
+            relevant = total_years(relevant_intervals)
+
+        return {
+            'total_years_experience': total_years((start, end) for start, end, _, _ in ranges) if ranges else None,
+            'relevant_years_experience': relevant,
+            'skill_years': skill_years,
+            'date_ranges': len(ranges)
+        }
+
+
+# Example usage (for testing): python -m src.experience_extractor
+if __name__ == "__main__":
+    sample_resume = """
+    Senior Developer, Acme Corp                 Jan 2021 – Present
+    Python, Django, AWS, Docker
+
+    Developer, Beta Ltd                          03/2018 - 06/2021
+    Java, Spring, SQL
+
+    Freelance                                    2017-2019
+    Python scripting, MySQL
+
+    Education
+    B.Tech, Computer Science                     2012 - 2016
+    """
+    extractor = ExperienceExtractor(today=date(2025, 1, 1))
+    result = extractor.extract(sample_resume, ['python', 'django', 'sql'])
+    print(f"Total: {result['total_years_experience']} years")
+    print(f"Relevant: {result['relevant_years_experience']} years")
+    print(f"Per skill: {result['skill_years']}")
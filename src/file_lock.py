@@ -0,0 +1,100 @@
+"""
+File Lock Module
+Inter-process lock on a sidecar ".lock" file. Held around every
+load -> update -> save of the shared data files (resume index, score matrix,
+score sketches), so concurrent evaluation jobs, the worker and the ingest
+script don't overwrite each other's changes.
+"""
+
+import os
+import time
+
+# fcntl on Linux/macOS, msvcrt on Windows
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+DEFAULT_TIMEOUT_SECONDS = 120
+POLL_SECONDS = 0.05
+
+
+class FileLock:
+    """
+    Exclusive lock usable as a context manager. Also excludes other threads of
+    the same process, since each acquire opens its own lock file handle.
+    """
+
+    def __init__(self, lock_file: str, timeout: float = DEFAULT_TIMEOUT_SECONDS):
+        """
+        Initialize the lock (nothing is locked until it is entered).
+
+        Args:
+            lock_file: Path of the lock file (created if missing)
+            timeout: Seconds to wait for the lock before raising TimeoutError
+        """
+        self.lock_file = lock_file
+        self.timeout = timeout
+        self.handle = None
+
+    def _try_lock(self) -> bool:
+        try:
+            if fcntl is not None:
+                fcntl.flock(self.handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                self.handle.seek(0)
+                msvcrt.locking(self.handle.fileno(), msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+    def __enter__(self):
+        os.makedirs(os.path.dirname(self.lock_file) or '.', exist_ok=True)
+        self.handle = open(self.lock_file, 'a+')
+        deadline = time.monotonic() + self.timeout
+        while not self._try_lock():
+            if time.monotonic() >= deadline:
+                self.handle.close()
+                self.handle = None
+                raise TimeoutError(f"Timed out waiting for lock {self.lock_file}")
+            time.sleep(POLL_SECONDS)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if fcntl is not None:
+                fcntl.flock(self.handle.fileno(), fcntl.LOCK_UN)
+            else:
+                self.handle.seek(0)
+                msvcrt.locking(self.handle.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self.handle.close()
+            self.handle = None
+        return False
+
+
+# Example usage (for testing): python -m src.file_lock
+if __name__ == "__main__":
+    import tempfile
+    import threading
+
+    path = os.path.join(tempfile.mkdtemp(), 'counter.txt')
+    with open(path, 'w') as f:
+        f.write('0')
+
+    def increment():
+        for _ in range(50):
+            with FileLock(path + '.lock'):
+                with open(path) as f:
+                    value = int(f.read())
+                with open(path, 'w') as f:
+                    f.write(str(value + 1))
+
+    threads = [threading.Thread(target=increment) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    with open(path) as f:
+        print(f"Counter: {f.read()} (expected 200)")
@@ -4,15 +4,40 @@ Handles all interactions with Google Sheets API for storing candidate data.
 """
 
 import gspread
+from gspread.utils import rowcol_to_a1
 from google.oauth2.service_account import Credentials
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Any, Callable, List, Dict, Optional
+
+CANDIDATES_MASTER_SHEET = "Candidates_Master"
+
+# API error messages meaning the cached worksheet was deleted, renamed or resized
+STALE_WORKSHEET_MESSAGES = ("unable to parse range", "not found", "exceeds grid limits")
+
+CANDIDATES_MASTER_HEADERS = [
+    "role_id",
+    "role_name",
+    "candidate_name",
+    "phone",
+    "email",
+    "location",
+    "source_portal",
+    "auto_fit_score",
+    "auto_fit_label",
+    "auto_screen_comment",
+    "hr_approved",
+    "created_at",
+    "updated_at",
+    "best_fit_roles"
+]
 
 
 class GoogleSheetsManager:
     """
     Manages Google Sheets operations for the hiring automation system.
-    Creates and updates the Candidates_Master sheet.
+    Creates and updates the Candidates_Master sheet. The worksheet handle and
+    its header map are resolved once and reused, so each read or bulk write is
+    a single API call.
     """
 
     def __init__(self, credentials_path: str):
@@ -35,6 +60,8 @@ class GoogleSheetsManager:
         )
         self.client = gspread.authorize(self.credentials)
         self.sheet = None
+        self.worksheet = None
+        self.header_map = None
 
     def get_or_create_sheet(self, sheet_name: str = "Hiring_Automation_Phase1") -> gspread.Spreadsheet:
         """
@@ -61,53 +88,122 @@ class GoogleSheetsManager:
         """
         Set up the Candidates_Master worksheet with proper headers.
         Creates the worksheet if it doesn't exist, or gets it if it does.
+        The worksheet and its header map are cached (see get_worksheet).
 
         Returns:
             The Candidates_Master worksheet
         """
         try:
             # Try to get existing worksheet
-            worksheet = self.sheet.worksheet("Candidates_Master")
+            worksheet = self.sheet.worksheet(CANDIDATES_MASTER_SHEET)
+            headers = worksheet.row_values(1) or CANDIDATES_MASTER_HEADERS
             print("[OK] Found existing Candidates_Master sheet")
+
+            # Sheets created by older versions lack newer columns (e.g. best_fit_roles)
+            missing = [header for header in CANDIDATES_MASTER_HEADERS if header not in headers]
+            if missing:
+                first_column = len(headers) + 1
+                if worksheet.col_count < len(headers) + len(missing):
+                    worksheet.add_cols(len(headers) + len(missing) - worksheet.col_count)
+                worksheet.update(
+                    f"{rowcol_to_a1(1, first_column)}:{rowcol_to_a1(1, len(headers) + len(missing))}",
+                    [missing]
+                )
+                headers = headers + missing
+                print(f"[OK] Added missing column(s) to Candidates_Master: {', '.join(missing)}")
         except gspread.WorksheetNotFound:
             # Create new worksheet if it doesn't exist
             worksheet = self.sheet.add_worksheet(
-                title="Candidates_Master",
+                title=CANDIDATES_MASTER_SHEET,
                 rows="1000",
-                cols="13"
+                cols="14"
             )
             print("[OK] Created new Candidates_Master sheet")
 
-            # Add headers
-            headers = [
-                "role_id",
-                "role_name",
-                "candidate_name",
-                "phone",
-                "email",
-                "location",
-                "source_portal",
-                "auto_fit_score",
-                "auto_fit_label",
-                "auto_screen_comment",
-                "hr_approved",
-                "created_at",
-                "updated_at"
-            ]
-
             # Write headers to first row
-            worksheet.update('A1:M1', [headers])
+            headers = CANDIDATES_MASTER_HEADERS
+            worksheet.update('A1:N1', [headers])
 
             # Format headers (bold)
-            worksheet.format('A1:M1', {
+            worksheet.format('A1:N1', {
                 "textFormat": {"bold": True},
                 "backgroundColor": {"red": 0.9, "green": 0.9, "blue": 0.9}
             })
 
             print("[OK] Added headers to Candidates_Master sheet")
 
+        self.worksheet = worksheet
+        # Column (1-based) of each header, so rows match the sheet even if columns were moved
+        self.header_map = {header: column for column, header in enumerate(headers, start=1) if header}
         return worksheet
 
+    def get_worksheet(self, refresh: bool = False) -> gspread.Worksheet:
+        """
+        Get the Candidates_Master worksheet, resolving it only on first use.
+
+        Args:
+            refresh: Look the worksheet and headers up again (e.g. after an API error)
+
+        Returns:
+            The Candidates_Master worksheet
+        """
+        if self.worksheet is None or refresh:
+            self.setup_candidates_master_sheet()
+        return self.worksheet
+
+    def invalidate_worksheet(self):
+        """Forget the cached worksheet and headers; the next call resolves them again"""
+        self.worksheet = None
+        self.header_map = None
+
+    @staticmethod
+    def _is_stale_worksheet_error(error: gspread.exceptions.APIError) -> bool:
+        """
+        True for API errors caused by an out-of-date worksheet handle (not found
+        or invalid range). Rate limits (429) and server errors (5xx) are not:
+        the request may already have been applied, so it must not be repeated.
+        """
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+        message = str(error).lower()
+        return status == 404 or (status == 400 and any(text in message for text in STALE_WORKSHEET_MESSAGES))
+
+    def _with_worksheet(self, operation: Callable[[gspread.Worksheet], Any]) -> Any:
+        """
+        Run an operation on the cached worksheet. If the worksheet was renamed,
+        deleted or re-created (not-found / invalid-range errors) the cache is
+        refreshed and the operation retried once; other errors are raised.
+        """
+        try:
+            return operation(self.get_worksheet())
+        except gspread.exceptions.APIError as e:
+            if not self._is_stale_worksheet_error(e):
+                raise
+            print(f"[WARN] Sheets API error ({e}) - refreshing worksheet and retrying")
+            return operation(self.get_worksheet(refresh=True))
+
+    def _build_row(self, candidate_data: Dict, timestamp: str) -> List:
+        """Row values for a candidate, placed by the cached header map"""
+        values = {
+            'role_id': candidate_data.get('role_id', ''),
+            'role_name': candidate_data.get('role_name', ''),
+            'candidate_name': candidate_data.get('candidate_name', ''),
+            'phone': candidate_data.get('phone', ''),
+            'email': candidate_data.get('email', ''),
+            'location': candidate_data.get('location', ''),
+            'source_portal': candidate_data.get('source_portal', 'Local Resume'),
+            'auto_fit_score': candidate_data.get('auto_fit_score', 0),
+            'auto_fit_label': candidate_data.get('auto_fit_label', ''),
+            'auto_screen_comment': candidate_data.get('auto_screen_comment', ''),
+            'hr_approved': 'No',  # hr_approved default value
+            'created_at': timestamp,
+            'updated_at': timestamp,
+            'best_fit_roles': candidate_data.get('best_fit_roles', '')
+        }
+        row_data = [''] * max(self.header_map.values(), default=0)
+        for header, column in self.header_map.items():
+            row_data[column - 1] = values.get(header, '')
+        return row_data
+
     def add_candidate(self, candidate_data: Dict) -> bool:
         """
         Add a single candidate to the Candidates_Master sheet.
@@ -119,30 +215,11 @@ class GoogleSheetsManager:
             True if successful, False otherwise
         """
         try:
-            worksheet = self.setup_candidates_master_sheet()
-
             # Get current timestamp
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-            # Prepare row data (must match header order)
-            row_data = [
-                candidate_data.get('role_id', ''),
-                candidate_data.get('role_name', ''),
-                candidate_data.get('candidate_name', ''),
-                candidate_data.get('phone', ''),
-                candidate_data.get('email', ''),
-                candidate_data.get('location', ''),
-                candidate_data.get('source_portal', 'Local Resume'),
-                candidate_data.get('auto_fit_score', 0),
-                candidate_data.get('auto_fit_label', ''),
-                candidate_data.get('auto_screen_comment', ''),
-                'No',  # hr_approved default value
-                timestamp,  # created_at
-                timestamp   # updated_at
-            ]
-
             # Append the row to the sheet
-            worksheet.append_row(row_data)
+            self._with_worksheet(lambda worksheet: worksheet.append_row(self._build_row(candidate_data, timestamp)))
             print(f"[OK] Added candidate: {candidate_data.get('candidate_name', 'Unknown')}")
             return True
 
@@ -152,8 +229,8 @@ class GoogleSheetsManager:
 
     def add_multiple_candidates(self, candidates_list: List[Dict]) -> int:
         """
-        Add multiple candidates to the Candidates_Master sheet in batch.
-        More efficient than adding one by one.
+        Add multiple candidates to the Candidates_Master sheet in batch
+        (one API call once the worksheet is cached).
 
         Args:
             candidates_list: List of candidate dictionaries
@@ -162,33 +239,17 @@ class GoogleSheetsManager:
             Number of candidates successfully added
         """
         try:
-            worksheet = self.setup_candidates_master_sheet()
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-            # Prepare all rows
-            rows_data = []
-            for candidate_data in candidates_list:
-                row_data = [
-                    candidate_data.get('role_id', ''),
-                    candidate_data.get('role_name', ''),
-                    candidate_data.get('candidate_name', ''),
-                    candidate_data.get('phone', ''),
-                    candidate_data.get('email', ''),
-                    candidate_data.get('location', ''),
-                    candidate_data.get('source_portal', 'Local Resume'),
-                    candidate_data.get('auto_fit_score', 0),
-                    candidate_data.get('auto_fit_label', ''),
-                    candidate_data.get('auto_screen_comment', ''),
-                    'No',  # hr_approved
-                    timestamp,  # created_at
-                    timestamp   # updated_at
-                ]
-                rows_data.append(row_data)
-
             # Batch append all rows
-            worksheet.append_rows(rows_data)
-            print(f"[OK] Added {len(rows_data)} candidates to the sheet")
-            return len(rows_data)
+            def append(worksheet):
+                rows_data = [self._build_row(candidate_data, timestamp) for candidate_data in candidates_list]
+                worksheet.append_rows(rows_data)
+                return len(rows_data)
+
+            added = self._with_worksheet(append)
+            print(f"[OK] Added {added} candidates to the sheet")
+            return added
 
         except Exception as e:
             print(f"[ERROR] Error adding candidates: {str(e)}")
@@ -203,15 +264,13 @@ class GoogleSheetsManager:
             List of candidate dictionaries with hr_approved = 'Yes'
         """
         try:
-            worksheet = self.setup_candidates_master_sheet()
-
             # Get all records as list of dictionaries
-            all_records = worksheet.get_all_records()
+            all_records = self._with_worksheet(lambda worksheet: worksheet.get_all_records())
 
             # Filter for approved candidates
             approved_candidates = [
                 record for record in all_records
-                if record.get('hr_approved', '').strip().lower() == 'yes'
+                if str(record.get('hr_approved', '')).strip().lower() == 'yes'
             ]
 
             print(f"[OK] Found {len(approved_candidates)} approved candidates")
@@ -221,6 +280,30 @@ class GoogleSheetsManager:
             print(f"[ERROR] Error retrieving approved candidates: {str(e)}")
             return []
 
+    def set_approval(self, row_numbers: List[int], approved: bool) -> int:
+        """
+        Set hr_approved for several sheet rows in one API call.
+
+        Args:
+            row_numbers: Sheet row numbers (header is row 1)
+            approved: True for 'Yes', False for 'No'
+
+        Returns:
+            Number of rows updated
+        """
+        if not row_numbers:
+            return 0
+
+        def update(worksheet):
+            column = self.header_map['hr_approved']
+            worksheet.batch_update([
+                {'range': rowcol_to_a1(row_number, column), 'values': [['Yes' if approved else 'No']]}
+                for row_number in row_numbers
+            ])
+            return len(row_numbers)
+
+        return self._with_worksheet(update)
+
     def get_sheet_url(self) -> Optional[str]:
         """
         Get the URL of the Google Sheet for easy access.
@@ -241,8 +324,8 @@ if __name__ == "__main__":
     # Create/get the sheet
     sheet = manager.get_or_create_sheet("Hiring_Automation_Phase1")
 
-    # Setup Candidates_Master worksheet
-    manager.setup_candidates_master_sheet()
+    # Resolve the Candidates_Master worksheet (cached for later calls)
+    manager.get_worksheet()
 
     # Test adding a candidate
     test_candidate = {
@@ -0,0 +1,116 @@
+"""
+JD Cache Module
+Process-wide cache of compiled job descriptions, keyed by JD content hash and
+skill taxonomy hash, so constructing a JDMatcher for an unchanged JD skips
+keyword extraction. Kept out of jd_matcher.py because the app reloads that
+module on every run.
+"""
+
+import hashlib
+import os
+import threading
+from typing import Callable, Dict
+
+# (jd content hash, taxonomy hash) -> compiled JD
+_compiled_jds = {}
+# normalized JD file path -> content hash it was last compiled from
+_path_hashes = {}
+_cache_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0}
+
+
+def jd_content_hash(jd_text: str) -> str:
+    """SHA-256 of the JD text"""
+    return hashlib.sha256(jd_text.encode('utf-8')).hexdigest()
+
+
+def _copy_compiled(compiled: Dict) -> Dict:
+    """Copy the mutable parts so callers can't alter the cached entry"""
+    return {
+        'keywords': list(compiled['keywords']),
+        'weights': dict(compiled['weights']),
+        'experience_years': compiled['experience_years']
+    }
+
+
+def get_compiled_jd(jd_text: str, taxonomy_hash: str, compile_fn: Callable[[str], Dict],
+                    jd_path: str = None) -> Dict:
+    """
+    Get the compiled form of a JD, compiling it on first use.
+
+    Args:
+        jd_text: Job description text
+        taxonomy_hash: Content hash of the skill taxonomy used to compile it
+        compile_fn: Function compiling JD text (JDMatcher.compile_jd)
+        jd_path: Optional JD file path, so invalidate_jd() can drop the entry
+
+    Returns:
+        Dictionary with keywords, weights and experience_years
+    """
+    content_hash = jd_content_hash(jd_text)
+    key = (content_hash, taxonomy_hash)
+
+    with _cache_lock:
+        compiled = _compiled_jds.get(key)
+        if jd_path:
+            _path_hashes[os.path.normpath(jd_path)] = content_hash
+        if compiled is not None:
+            _stats['hits'] += 1
+            return _copy_compiled(compiled)
+        _stats['misses'] += 1
+
+    compiled = compile_fn(jd_text)
+
+    with _cache_lock:
+        _compiled_jds[key] = compiled
+    return _copy_compiled(compiled)
+
+
+def invalidate_jd(jd_path: str) -> bool:
+    """
+    Drop the cached compilation of a JD file (call after editing or deleting it).
+    Other JDs stay compiled.
+
+    Args:
+        jd_path: JD file path
+
+    Returns:
+        True if an entry was removed
+    """
+    with _cache_lock:
+        content_hash = _path_hashes.pop(os.path.normpath(jd_path), None)
+        if content_hash is None:
+            return False
+        stale_keys = [key for key in _compiled_jds if key[0] == content_hash]
+        for key in stale_keys:
+            del _compiled_jds[key]
+    if stale_keys:
+        print(f"[INFO] Invalidated compiled JD: {jd_path}")
+    return bool(stale_keys)
+
+
+def clear_jd_cache():
+    """Drop every cached JD"""
+    with _cache_lock:
+        _compiled_jds.clear()
+        _path_hashes.clear()
+
+
+def get_jd_cache_stats() -> Dict:
+    """Get cache size and hit/miss counts"""
+    with _cache_lock:
+        return {'entries': len(_compiled_jds), **_stats}
+
+
+# Example usage (for testing): python -m src.jd_cache
+if __name__ == "__main__":
+    # Use the package module (this file runs as __main__, a separate copy)
+    from src.jd_cache import get_jd_cache_stats, invalidate_jd
+    from src.jd_matcher import JDMatcher
+
+    jd_path = 'jd_library/senior_python_developer.txt'
+    JDMatcher(jd_path)
+    JDMatcher(jd_path)
+    print(get_jd_cache_stats())
+    invalidate_jd(jd_path)
+    print(get_jd_cache_stats())
@@ -3,8 +3,111 @@ Job Description Matcher Module
 Performs keyword-based matching between resume and JD to assess candidate fit.
 """
 
+import heapq
 import re
-from typing import Dict, List, Tuple
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from src.jd_cache import get_compiled_jd
+from src.skill_taxonomy import get_skill_taxonomy
+
+# JD section headers, by section type. Preferred is checked first because
+# headers like "Preferred Qualifications" also contain a required word.
+PREFERRED_SECTION_HEADERS = ('nice to have', 'nice-to-have', 'good to have', 'preferred', 'bonus', 'desirable', 'plus')
+REQUIRED_SECTION_HEADERS = ('requirement', 'required', 'must have', 'must-have', 'qualification', 'skills',
+                            'what you need', 'what we need', 'minimum')
+GENERAL_SECTION_HEADERS = ('responsibilit', 'about', 'overview', 'description', 'duties', 'what you will do',
+                           "what you'll do", 'benefits', 'perks', 'what we offer')
+
+# Phrases that mark a single line as preferred even inside a required section
+PREFERRED_LINE_MARKERS = ('is a plus', 'nice to have', 'good to have', 'preferred', 'bonus')
+
+# Keyword weight by the section it appears in (the highest wins)
+SECTION_WEIGHTS = {'required': 1.0, 'general': 0.75, 'preferred': 0.5}
+
+# "3+ years of experience", "5+ years of Python development experience"
+EXPERIENCE_PATTERN = re.compile(r'(\d+)\+?\s*(?:years?|yrs?)(?:\s+of)?(?:\s+[\w/+#.-]+){0,3}?\s+experience')
+
+# Percentile-based labels (FIT_LABEL_MODE=percentile): share of the role's
+# past scores a score must reach, and how many past scores are needed first
+PERCENTILE_LABEL_CUTOFFS = ((0.9, "Strong Fit"), (0.7, "Good Fit"), (0.4, "Moderate Fit"))
+MIN_DISTRIBUTION_SCORES = 30
+
+# Evidence kept per matched keyword, and snippet context on each side of a match
+EVIDENCE_PER_KEYWORD = 3
+SNIPPET_CONTEXT_CHARS = 40
+
+
+class MatchEvidence(NamedTuple):
+    """Where a JD keyword was found in a resume."""
+    keyword: str
+    start: int
+    end: int
+    snippet: str
+
+
+class CandidateEvaluation(NamedTuple):
+    """Immutable result of evaluating one resume against a JD."""
+    candidate_name: str
+    score: int
+    label: str
+    comment: str
+    matched: Tuple[str, ...]
+    missing: Tuple[str, ...]
+    evidence: Tuple[MatchEvidence, ...]
+
+
+class TopKSelector:
+    """
+    Streaming top-K selection with a bounded min-heap.
+    Results can be pushed while they are still being produced and the current
+    leaderboard read at any time. Ties keep arrival order (earlier first), so
+    the leaderboard is stable as more results come in.
+    """
+
+    def __init__(self, k: int = 50, key: Callable[[Any], float] = None):
+        """
+        Create an empty selector.
+
+        Args:
+            k: Number of items to keep
+            key: Function returning an item's score (defaults to the item itself)
+        """
+        self.k = k
+        self.key = key or (lambda item: item)
+        self.seen = 0
+        self._heap = []  # (score, -arrival, item); the root is the current K-th best
+
+    def push(self, item: Any) -> bool:
+        """
+        Offer one item.
+
+        Args:
+            item: Result to consider
+
+        Returns:
+            True if the item is currently in the top K
+        """
+        entry = (self.key(item), -self.seen, item)
+        self.seen += 1
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+            return True
+        if self.k > 0 and entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+            return True
+        return False
+
+    def extend(self, items: Iterable[Any]):
+        """Offer several items"""
+        for item in items:
+            self.push(item)
+
+    def results(self) -> List[Any]:
+        """Get the current top K, best first"""
+        return [item for _, _, item in sorted(self._heap, key=lambda entry: entry[:2], reverse=True)]
+
+    def __len__(self) -> int:
+        return len(self._heap)
 
 
 class JDMatcher:
@@ -20,8 +123,20 @@ class JDMatcher:
         Args:
             jd_file_path: Path to the job description text file
         """
+        self.taxonomy = get_skill_taxonomy()
+        self.skill_matcher = self.taxonomy.matcher
         self.jd_text = self.load_jd(jd_file_path)
-        self.jd_keywords = self.extract_keywords(self.jd_text)
+
+        # Compile the JD once per content/taxonomy version; every candidate is
+        # scored against this structure
+        compiled = get_compiled_jd(self.jd_text, self.taxonomy.content_hash, self.compile_jd, jd_file_path)
+        self.jd_keywords = compiled['keywords']
+        self.keyword_weights = compiled['weights']
+        self.experience_years = compiled['experience_years']
+        self.total_weight = sum(self.keyword_weights.values())
+
+        # Role score distribution (KLLSketch) for percentile-based labels
+        self.score_distribution = None
 
     def load_jd(self, file_path: str) -> str:
         """
@@ -42,6 +157,102 @@ class JDMatcher:
             print(f"[ERROR] Error loading JD file: {str(e)}")
             return ""
 
+    def classify_section_header(self, line: str) -> Optional[str]:
+        """
+        Decide whether a JD line is a section header.
+
+        Args:
+            line: One line of the JD
+
+        Returns:
+            'required', 'preferred' or 'general' for a header line, None otherwise
+        """
+        stripped = line.strip()
+        if not stripped or stripped[0] in '-*•' or len(stripped.split()) > 6:
+            return None
+
+        name = stripped.strip('#').strip().lower()
+        has_colon = name.endswith(':')
+        name = name.rstrip(':').strip()
+
+        # Without a colon, only lines that start like a known header count
+        matches = (lambda header: header in name) if has_colon else name.startswith
+        if any(matches(header) for header in PREFERRED_SECTION_HEADERS):
+            return 'preferred'
+        if any(matches(header) for header in REQUIRED_SECTION_HEADERS):
+            return 'required'
+        if has_colon or any(matches(header) for header in GENERAL_SECTION_HEADERS):
+            return 'general'
+        return None
+
+    def parse_jd_sections(self, text: str) -> List[Tuple[str, str]]:
+        """
+        Split a JD into lines tagged with the section they belong to.
+        Text before the first header is 'general'; a line inside a required
+        section that says e.g. "is a plus" is tagged 'preferred'.
+
+        Args:
+            text: JD text
+
+        Returns:
+            List of (section_type, line) for every non-header line
+        """
+        section = 'general'
+        tagged_lines = []
+        for line in text.split('\n'):
+            header = self.classify_section_header(line)
+            if header:
+                section = header
+                continue
+            line_lower = line.lower()
+            if section != 'preferred' and any(marker in line_lower for marker in PREFERRED_LINE_MARKERS):
+                tagged_lines.append(('preferred', line))
+            else:
+                tagged_lines.append((section, line))
+        return tagged_lines
+
+    def compile_jd(self, text: str) -> Dict:
+        """
+        Compile a JD into weighted keywords.
+        A keyword's weight is the weight of the strongest section it appears in
+        times its taxonomy weight.
+
+        Args:
+            text: JD text
+
+        Returns:
+            Dictionary with 'keywords' (list), 'weights' (keyword -> weight) and
+            'experience_years' (all years-of-experience figures, in order)
+        """
+        weights = {}
+        experience = []  # (section_weight, years)
+
+        for section, line in self.parse_jd_sections(text):
+            section_weight = SECTION_WEIGHTS[section]
+            for skill in self.skill_matcher.find_skills(line):
+                weight = section_weight * self.taxonomy.get_weight(skill)
+                weights[skill] = max(weights.get(skill, 0.0), weight)
+            for years in EXPERIENCE_PATTERN.findall(line.lower()):
+                experience.append((section_weight, int(years)))
+
+        # Keywords in skill-list order
+        keywords = [skill for skill in self.skill_matcher.skills if skill in weights]
+
+        # Experience requirement: first figure from the strongest section
+        if experience:
+            section_weight, years = max(experience, key=lambda item: item[0])
+            experience_keyword = f"{years}+ years experience"
+            keywords.append(experience_keyword)
+            weights[experience_keyword] = section_weight
+
+        required_count = sum(1 for keyword in keywords if weights[keyword] >= SECTION_WEIGHTS['required'])
+        print(f"[OK] Extracted {len(keywords)} keywords from JD ({required_count} required)")
+        return {
+            'keywords': keywords,
+            'weights': {keyword: weights[keyword] for keyword in keywords},
+            'experience_years': [years for _, years in experience]
+        }
+
     def extract_keywords(self, text: str) -> List[str]:
         """
         Extract important keywords from text.
@@ -53,66 +264,29 @@ class JDMatcher:
         Returns:
             List of keywords (lowercase, unique)
         """
-        # Convert to lowercase for matching
-        text_lower = text.lower()
-
-        # Common technical keywords and skills patterns
-        # You can extend this list based on your domain
-        common_skills = [
-            # Programming languages
-            'python', 'java', 'javascript', 'c\\+\\+', 'c#', 'ruby', 'php', 'go', 'rust',
-            'swift', 'kotlin', 'typescript', 'scala', 'r programming',
-
-            # Web frameworks
-            'django', 'flask', 'fastapi', 'react', 'angular', 'vue', 'node.js', 'express',
-            'spring', 'asp.net', 'laravel', 'rails',
-
-            # Databases
-            'sql', 'mysql', 'postgresql', 'mongodb', 'oracle', 'redis', 'cassandra',
-            'dynamodb', 'elasticsearch',
-
-            # Cloud & DevOps
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'terraform',
-            'ansible', 'ci/cd', 'devops', 'linux',
-
-            # Data Science & ML
-            'machine learning', 'deep learning', 'data science', 'nlp', 'computer vision',
-            'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy', 'jupyter',
-
-            # Other technical
-            'api', 'rest', 'graphql', 'microservices', 'agile', 'scrum', 'git',
-            'testing', 'unit testing', 'integration testing',
-
-            # Soft skills
-            'communication', 'leadership', 'team player', 'problem solving',
-            'analytical', 'collaboration'
-        ]
-
-        # Find all skill keywords present in the text
-        found_keywords = []
-        for skill in common_skills:
-            # Use word boundary for better matching
-            pattern = r'\b' + skill + r'\b'
-            if re.search(pattern, text_lower):
-                # Clean up the keyword (remove regex characters)
-                clean_skill = skill.replace('\\+\\+', '++').replace('\\', '')
-                found_keywords.append(clean_skill)
-
-        # Also extract years of experience mentioned
-        experience_pattern = r'(\d+)\+?\s*(?:years?|yrs?)\s+(?:of\s+)?experience'
-        exp_matches = re.findall(experience_pattern, text_lower)
-        if exp_matches:
-            found_keywords.append(f"{exp_matches[0]}+ years experience")
-
-        # Remove duplicates while preserving order
-        unique_keywords = list(dict.fromkeys(found_keywords))
-
-        print(f"[OK] Extracted {len(unique_keywords)} keywords from JD")
-        return unique_keywords
+        return self.compile_jd(text)['keywords']
+
+    def get_skill_keywords(self) -> List[str]:
+        """
+        Get the JD keywords that are taxonomy skills (excludes e.g. "5+ years experience").
+
+        Returns:
+            List of canonical skill names
+        """
+        return [keyword for keyword in self.jd_keywords if keyword in self.taxonomy.skills]
+
+    def get_skill_weights(self) -> Dict[str, float]:
+        """
+        Get the JD's taxonomy skills with their weights (the BM25 query for this JD).
+
+        Returns:
+            Dictionary of canonical skill -> weight
+        """
+        return {skill: self.keyword_weights[skill] for skill in self.get_skill_keywords()}
 
     def calculate_match_score(self, resume_text: str) -> Tuple[int, List[str], List[str]]:
         """
-        Calculate how well a resume matches the JD based on keyword overlap.
+        Calculate how well a resume matches the JD based on weighted keyword overlap.
 
         Args:
             resume_text: Full text of the candidate's resume
@@ -120,30 +294,71 @@ class JDMatcher:
         Returns:
             Tuple of (match_score, matched_keywords, missing_keywords)
         """
-        resume_lower = resume_text.lower()
+        resume_skills = set(self.skill_matcher.find_skills(resume_text))
+        return self.score_resume_skills(resume_skills, resume_text)
+
+    def score_resume_skills(self, resume_skills: set, resume_text: str) -> Tuple[int, List[str], List[str]]:
+        """
+        Score a resume whose skills were already extracted.
+        Lets one skill extraction be reused across several JDs.
+
+        Args:
+            resume_skills: Set of canonical skills found in the resume
+            resume_text: Full resume text (only used for non-skill keywords)
+
+        Returns:
+            Tuple of (match_score, matched_keywords, missing_keywords)
+        """
+        resume_lower = None
 
         matched_keywords = []
         missing_keywords = []
 
-        # Check each JD keyword against the resume
+        # Check each JD keyword against the skills found in the resume.
+        # Keywords outside the skill list (e.g. "5+ years experience") fall back to a regex.
         for keyword in self.jd_keywords:
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            if re.search(pattern, resume_lower):
+            if keyword in resume_skills:
                 matched_keywords.append(keyword)
-            else:
-                missing_keywords.append(keyword)
-
-        # Calculate percentage match
-        if len(self.jd_keywords) > 0:
-            match_score = int((len(matched_keywords) / len(self.jd_keywords)) * 100)
+                continue
+            if keyword not in self.taxonomy.skills:
+                if resume_lower is None:
+                    resume_lower = resume_text.lower()
+                if re.search(r'\b' + re.escape(keyword) + r'\b', resume_lower):
+                    matched_keywords.append(keyword)
+                    continue
+            missing_keywords.append(keyword)
+
+        # Calculate weighted percentage match
+        if self.total_weight > 0:
+            matched_weight = sum(self.keyword_weights[keyword] for keyword in matched_keywords)
+            match_score = int(matched_weight / self.total_weight * 100)
         else:
             match_score = 0
 
         return match_score, matched_keywords, missing_keywords
 
+    def use_score_distribution(self, sketch) -> bool:
+        """
+        Label candidates by percentile within the role's past scores instead of
+        fixed cutoffs. Ignored until the role has enough scores.
+
+        Args:
+            sketch: KLLSketch of the role's scores (from ScoreSketchStore), or None
+
+        Returns:
+            True if percentile labels are now in use
+        """
+        if sketch is None or sketch.n < MIN_DISTRIBUTION_SCORES:
+            self.score_distribution = None
+            return False
+        self.score_distribution = sketch
+        return True
+
     def get_fit_label(self, score: int) -> str:
         """
         Convert numerical score to a fit label.
+        Uses fixed 70/50/30 cutoffs, or the score's percentile within the role
+        when a score distribution is set (see use_score_distribution).
 
         Args:
             score: Match score (0-100)
@@ -151,6 +366,13 @@ class JDMatcher:
         Returns:
             Fit label (Strong Fit, Good Fit, Moderate Fit, Weak Fit)
         """
+        if self.score_distribution is not None:
+            percentile = self.score_distribution.rank(score)
+            for cutoff, label in PERCENTILE_LABEL_CUTOFFS:
+                if percentile >= cutoff:
+                    return label
+            return "Weak Fit"
+
         if score >= 70:
             return "Strong Fit"
         elif score >= 50:
@@ -182,68 +404,152 @@ class JDMatcher:
             top_matched = matched[:5]
             comment_parts.append(f"Key skills: {', '.join(top_matched)}.")
 
-        # Add missing critical skills (top 3)
+        # Add missing critical skills (top 3, required ones first)
         if missing and score < 70:
-            top_missing = missing[:3]
+            top_missing = sorted(missing, key=lambda keyword: -self.keyword_weights.get(keyword, 1.0))[:3]
             comment_parts.append(f"Missing: {', '.join(top_missing)}.")
 
         return " ".join(comment_parts)
 
-    def evaluate_candidate(self, candidate_info: Dict) -> Dict:
+    def make_snippet(self, resume_text: str, start: int, end: int) -> str:
         """
-        Evaluate a candidate against the JD and add fit assessment.
+        Cut a single-line snippet around a match.
 
         Args:
-            candidate_info: Dictionary containing candidate information including resume_text
+            resume_text: Full resume text
+            start: Match start offset
+            end: Match end offset
 
         Returns:
-            Updated candidate_info with fit score and labels
+            Snippet with the surrounding context (whitespace collapsed)
         """
-        resume_text = candidate_info.get('resume_text', '')
+        left = max(0, start - SNIPPET_CONTEXT_CHARS)
+        right = min(len(resume_text), end + SNIPPET_CONTEXT_CHARS)
+        snippet = ' '.join(resume_text[left:right].split())
+        return ('...' if left > 0 else '') + snippet + ('...' if right < len(resume_text) else '')
 
-        if not resume_text:
-            print("[ERROR] No resume text available for matching")
-            candidate_info['auto_fit_score'] = 0
-            candidate_info['auto_fit_label'] = "Cannot Evaluate"
-            candidate_info['auto_screen_comment'] = "No resume text found"
-            return candidate_info
+    def match_with_evidence(self, resume_text: str) -> Tuple[int, List[str], List[str], List[MatchEvidence]]:
+        """
+        Score a resume and collect where each JD keyword was found, in one matching pass.
+
+        Args:
+            resume_text: Full resume text
+
+        Returns:
+            Tuple of (match_score, matched_keywords, missing_keywords, evidence)
+        """
+        jd_keywords = set(self.jd_keywords)
+        occurrences = {}
+        for match in self.skill_matcher.find_matches(resume_text):
+            if match.skill in jd_keywords:
+                occurrences.setdefault(match.skill, []).append((match.start, match.end))
+
+        score, matched, missing = self.score_resume_skills(set(occurrences), resume_text)
+
+        evidence = []
+        resume_lower = None
+        for keyword in matched:
+            spans = occurrences.get(keyword)
+            if spans is None:
+                # Keyword outside the taxonomy, matched by regex
+                if resume_lower is None:
+                    resume_lower = resume_text.lower()
+                pattern = r'\b' + re.escape(keyword) + r'\b'
+                spans = [m.span() for m in re.finditer(pattern, resume_lower)]
+            for start, end in spans[:EVIDENCE_PER_KEYWORD]:
+                evidence.append(MatchEvidence(keyword, start, end, self.make_snippet(resume_text, start, end)))
+
+        evidence.sort(key=lambda item: item.start)
+        return score, matched, missing, evidence
+
+    def evaluate_batch(self, resumes: Iterable[Dict], scores: List[Optional[int]] = None) -> List[CandidateEvaluation]:
+        """
+        Evaluate parsed resumes without modifying them, so the same resumes
+        can be evaluated against several JDs.
 
-        # Calculate match
-        score, matched, missing = self.calculate_match_score(resume_text)
+        Args:
+            resumes: Parsed candidate dictionaries including resume_text
+            scores: Optional precomputed scores (e.g. from BM25Scorer), one per
+                    resume; None entries use keyword overlap
 
-        # Get fit label
-        fit_label = self.get_fit_label(score)
+        Returns:
+            One CandidateEvaluation per resume, in input order
+        """
+        evaluations = []
+        for i, resume in enumerate(resumes):
+            resume_text = resume.get('resume_text', '')
+            candidate_name = resume.get('candidate_name', 'Unknown')
+
+            if not resume_text:
+                evaluations.append(CandidateEvaluation(
+                    candidate_name, 0, "Cannot Evaluate", "No resume text found", (), tuple(self.jd_keywords), ()
+                ))
+                continue
+
+            score, matched, missing, evidence = self.match_with_evidence(resume_text)
+            if scores is not None and scores[i] is not None:
+                score = scores[i]
+
+            evaluations.append(CandidateEvaluation(
+                candidate_name,
+                score,
+                self.get_fit_label(score),
+                self.generate_screening_comment(score, matched, missing),
+                tuple(matched),
+                tuple(missing),
+                tuple(evidence)
+            ))
+        return evaluations
+
+    def evaluate_candidate(self, candidate_info: Dict, score: Optional[int] = None) -> Dict:
+        """
+        Evaluate a candidate against the JD and add fit assessment.
+        The input dictionary is left unchanged.
 
-        # Generate comment
-        comment = self.generate_screening_comment(score, matched, missing)
+        Args:
+            candidate_info: Dictionary containing candidate information including resume_text
+            score: Precomputed score (e.g. from BM25Scorer); keyword overlap is used if None
 
-        # Update candidate info
-        candidate_info['auto_fit_score'] = score
-        candidate_info['auto_fit_label'] = fit_label
-        candidate_info['auto_screen_comment'] = comment
+        Returns:
+            Copy of candidate_info with fit score and labels, without resume_text
+            (no need to store it in the sheet)
+        """
+        evaluation = self.evaluate_batch([candidate_info], [score])[0]
+        if evaluation.label == "Cannot Evaluate":
+            print("[ERROR] No resume text available for matching")
 
-        print(f"[OK] Evaluated {candidate_info['candidate_name']}: {score}% ({fit_label})")
+        evaluated = {key: value for key, value in candidate_info.items() if key != 'resume_text'}
+        evaluated['auto_fit_score'] = evaluation.score
+        evaluated['auto_fit_label'] = evaluation.label
+        evaluated['auto_screen_comment'] = evaluation.comment
 
-        # Remove resume_text before returning (no need to store in sheet)
-        if 'resume_text' in candidate_info:
-            del candidate_info['resume_text']
+        if evaluation.label != "Cannot Evaluate":
+            print(f"[OK] Evaluated {evaluation.candidate_name}: {evaluation.score}% ({evaluation.label})")
 
-        return candidate_info
+        return evaluated
 
-    def evaluate_multiple_candidates(self, candidates_list: List[Dict]) -> List[Dict]:
+    def evaluate_multiple_candidates(self, candidates_list: List[Dict], scorer=None) -> List[Dict]:
         """
         Evaluate multiple candidates against the JD.
 
         Args:
             candidates_list: List of candidate dictionaries
+            scorer: Optional BM25Scorer; when given, the whole batch is scored
+                    with one sparse matrix product instead of keyword overlap
 
         Returns:
             List of evaluated candidates with fit scores
         """
+        scores = [None] * len(candidates_list)
+        if scorer is not None and candidates_list:
+            texts = [candidate.get('resume_text', '') for candidate in candidates_list]
+            batch_scores = scorer.score_batch(texts, [self.get_skill_weights()])
+            scores = [int(round(value)) for value in batch_scores[:, 0]]
+
         evaluated_candidates = []
 
-        for candidate in candidates_list:
-            evaluated = self.evaluate_candidate(candidate)
+        for candidate, score in zip(candidates_list, scores):
+            evaluated = self.evaluate_candidate(candidate, score)
             evaluated_candidates.append(evaluated)
 
         return evaluated_candidates
@@ -286,3 +592,7 @@ if __name__ == "__main__":
     print(f"Score: {evaluated['auto_fit_score']}")
     print(f"Label: {evaluated['auto_fit_label']}")
     print(f"Comment: {evaluated['auto_screen_comment']}")
+
+    # Evidence for reviewers (the input dictionary is unchanged)
+    for item in matcher.evaluate_batch([test_candidate])[0].evidence:
+        print(f"  {item.keyword:15} [{item.start}:{item.end}] {item.snippet}")
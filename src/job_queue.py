@@ -0,0 +1,319 @@
+"""
+Job Queue Module
+Local SQLite-backed job queue for long-running work (AI Evaluator batches).
+The Streamlit app submits jobs and polls them; evaluation_worker.py claims and
+runs them in a separate process. Per-item results are stored as they finish,
+so progress survives reruns, closed tabs and app restarts.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_QUEUE_FILE = os.path.join('data', 'jobs.db')
+
+# Job states
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+# Running jobs without a heartbeat for this long belong to a dead worker
+STALE_JOB_SECONDS = 600
+
+
+class JobQueue:
+    """
+    Persistent job queue shared by the app and worker processes.
+    """
+
+    def __init__(self, db_file: str = DEFAULT_QUEUE_FILE):
+        """
+        Open (or create) the queue database.
+
+        Args:
+            db_file: Path to the SQLite file
+        """
+        self.db_file = db_file
+        self.lock = threading.Lock()
+        os.makedirs(os.path.dirname(db_file) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(db_file, timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        with self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    job_type TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    stage TEXT DEFAULT '',
+                    done INTEGER DEFAULT 0,
+                    total INTEGER DEFAULT 0,
+                    summary TEXT,
+                    error TEXT,
+                    owner TEXT DEFAULT '',
+                    worker_id TEXT,
+                    claim_token TEXT,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    heartbeat_at REAL,
+                    finished_at REAL
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at)")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS job_results (
+                    job_id TEXT NOT NULL,
+                    item_index INTEGER NOT NULL,
+                    result TEXT NOT NULL,
+                    PRIMARY KEY (job_id, item_index)
+                )
+            """)
+
+    @staticmethod
+    def _to_job(row: sqlite3.Row) -> Optional[Dict]:
+        """Convert a jobs row to a dictionary with decoded JSON fields"""
+        if row is None:
+            return None
+        job = dict(row)
+        job['payload'] = json.loads(job['payload'])
+        job['summary'] = json.loads(job['summary']) if job['summary'] else {}
+        return job
+
+    @staticmethod
+    def new_job_id() -> str:
+        """A fresh job ID (for callers that need it before submitting, e.g. for an upload folder)"""
+        return uuid.uuid4().hex[:12]
+
+    def submit(self, job_type: str, payload: Dict, owner: str = '', job_id: str = None) -> str:
+        """
+        Add a job to the queue.
+
+        Args:
+            job_type: Handler name (see evaluation_jobs.JOB_HANDLERS)
+            payload: JSON-serializable job parameters
+            owner: Who submitted it (e.g. the signed-in user's email)
+            job_id: ID to use (from new_job_id()); a new one is made if None
+
+        Returns:
+            The job ID
+        """
+        job_id = job_id or self.new_job_id()
+        with self.lock, self.conn:
+            self.conn.execute("""
+                INSERT INTO jobs (job_id, job_type, payload, status, owner, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (job_id, job_type, json.dumps(payload), QUEUED, owner or '', time.time()))
+        print(f"[OK] Queued {job_type} job {job_id}")
+        return job_id
+
+    def claim(self, worker_id: str, job_id: str = None) -> Optional[Dict]:
+        """
+        Atomically take the oldest queued job (or a specific one).
+
+        Args:
+            worker_id: Identifier of the claiming worker
+            job_id: Claim only this job
+
+        Returns:
+            The claimed job, or None if there is nothing to do
+        """
+        token = uuid.uuid4().hex
+        now = time.time()
+        with self.lock, self.conn:
+            # A single UPDATE is atomic, so two workers can't claim the same job
+            if job_id:
+                self.conn.execute("""
+                    UPDATE jobs SET status = ?, worker_id = ?, claim_token = ?, started_at = ?, heartbeat_at = ?
+                    WHERE job_id = ? AND status = ?
+                """, (RUNNING, worker_id, token, now, now, job_id, QUEUED))
+            else:
+                self.conn.execute("""
+                    UPDATE jobs SET status = ?, worker_id = ?, claim_token = ?, started_at = ?, heartbeat_at = ?
+                    WHERE job_id = (SELECT job_id FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1)
+                    AND status = ?
+                """, (RUNNING, worker_id, token, now, now, QUEUED, QUEUED))
+            row = self.conn.execute("SELECT * FROM jobs WHERE claim_token = ?", (token,)).fetchone()
+        return self._to_job(row)
+
+    def update_progress(self, job_id: str, done: int, total: int, stage: str = None,
+                        claim_token: str = None) -> bool:
+        """
+        Record progress (also serves as the worker's heartbeat).
+
+        Args:
+            job_id: Job ID
+            done: Items finished
+            total: Items in the job
+            stage: Optional stage name
+            claim_token: Only update if the job still holds this claim (see claim())
+
+        Returns:
+            False if the job was requeued and claimed by someone else since
+        """
+        with self.lock, self.conn:
+            cursor = self.conn.execute("""
+                UPDATE jobs SET done = ?, total = ?, stage = COALESCE(?, stage), heartbeat_at = ?
+                WHERE job_id = ? AND (? IS NULL OR claim_token = ?)
+            """, (done, total, stage, time.time(), job_id, claim_token, claim_token))
+        return cursor.rowcount > 0
+
+    def add_result(self, job_id: str, index: int, result: Dict, claim_token: str = None) -> bool:
+        """
+        Store the result for one item of a job.
+
+        Args:
+            job_id: Job ID
+            index: Item position in the job
+            result: JSON-serializable result
+            claim_token: Only store it if the job still holds this claim (see complete())
+
+        Returns:
+            False if the job was requeued and the result was discarded
+        """
+        with self.lock, self.conn:
+            # Checked in the same statement, so a requeue can't slip in between
+            cursor = self.conn.execute("""
+                INSERT OR REPLACE INTO job_results (job_id, item_index, result)
+                SELECT ?, ?, ? WHERE ? IS NULL OR EXISTS (
+                    SELECT 1 FROM jobs WHERE job_id = ? AND claim_token = ?
+                )
+            """, (job_id, index, json.dumps(result), claim_token, job_id, claim_token))
+        return cursor.rowcount > 0
+
+    def get_results(self, job_id: str) -> List[Dict]:
+        """All item results stored so far, in item order"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT result FROM job_results WHERE job_id = ? ORDER BY item_index", (job_id,)
+            ).fetchall()
+        return [json.loads(row['result']) for row in rows]
+
+    def get_new_results(self, job_id: str, after: int = 0) -> Tuple[List[Tuple[int, Dict]], int]:
+        """
+        Results stored since a previous call, in the order they finished.
+
+        Args:
+            job_id: Job ID
+            after: Cursor returned by the previous call (0 for everything)
+
+        Returns:
+            Tuple of ([(item_index, result), ...], new cursor)
+        """
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT rowid, item_index, result FROM job_results WHERE job_id = ? AND rowid > ? ORDER BY rowid",
+                (job_id, after)
+            ).fetchall()
+        cursor = rows[-1]['rowid'] if rows else after
+        return [(row['item_index'], json.loads(row['result'])) for row in rows], cursor
+
+    def complete(self, job_id: str, summary: Dict = None, claim_token: str = None) -> bool:
+        """
+        Mark a job as finished.
+
+        Args:
+            job_id: Job ID
+            summary: JSON-serializable job summary
+            claim_token: Only finish the job if it still holds this claim, so a
+                         worker whose job was requeued as stale can't overwrite it
+
+        Returns:
+            True if the job was updated
+        """
+        with self.lock, self.conn:
+            cursor = self.conn.execute("""
+                UPDATE jobs SET status = ?, stage = 'Complete', summary = ?, finished_at = ?
+                WHERE job_id = ? AND (? IS NULL OR claim_token = ?)
+            """, (DONE, json.dumps(summary or {}), time.time(), job_id, claim_token, claim_token))
+        return cursor.rowcount > 0
+
+    def fail(self, job_id: str, error: str, claim_token: str = None) -> bool:
+        """
+        Mark a job as failed.
+
+        Args:
+            job_id: Job ID
+            error: Error message
+            claim_token: Only fail the job if it still holds this claim (see complete())
+
+        Returns:
+            True if the job was updated
+        """
+        with self.lock, self.conn:
+            cursor = self.conn.execute("""
+                UPDATE jobs SET status = ?, error = ?, finished_at = ?
+                WHERE job_id = ? AND (? IS NULL OR claim_token = ?)
+            """, (FAILED, error, time.time(), job_id, claim_token, claim_token))
+        return cursor.rowcount > 0
+
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        """Look up a job by ID"""
+        with self.lock:
+            row = self.conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._to_job(row)
+
+    def list_jobs(self, owner: str = None, limit: int = 10) -> List[Dict]:
+        """
+        Most recent jobs, newest first.
+
+        Args:
+            owner: Only jobs submitted by this owner
+            limit: Maximum number of jobs
+        """
+        query = "SELECT * FROM jobs"
+        params: List[Any] = []
+        if owner:
+            query += " WHERE owner = ?"
+            params.append(owner)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+        with self.lock:
+            rows = self.conn.execute(query, params).fetchall()
+        return [self._to_job(row) for row in rows]
+
+    def requeue_stale(self, max_age_seconds: float = STALE_JOB_SECONDS) -> int:
+        """
+        Put running jobs whose worker stopped sending heartbeats back in the queue.
+        Their old claim token is cleared, so the stale worker can no longer
+        report progress or finish them.
+
+        Returns:
+            Number of jobs requeued
+        """
+        with self.lock, self.conn:
+            cursor = self.conn.execute("""
+                UPDATE jobs SET status = ?, worker_id = NULL, claim_token = NULL
+                WHERE status = ? AND heartbeat_at < ?
+            """, (QUEUED, RUNNING, time.time() - max_age_seconds))
+        if cursor.rowcount:
+            print(f"[WARN] Requeued {cursor.rowcount} stale job(s)")
+        return cursor.rowcount
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+
+
+# Example usage (for testing): python -m src.job_queue
+if __name__ == "__main__":
+    import tempfile
+
+    queue = JobQueue(os.path.join(tempfile.mkdtemp(), 'jobs.db'))
+    first = queue.submit('demo', {'files': ['a.pdf', 'b.pdf']}, owner='recruiter@example.com')
+    queue.submit('demo', {'files': ['c.pdf']})
+
+    job = queue.claim('worker-1')
+    print(f"Claimed {job['job_id']} (first: {job['job_id'] == first}) with payload {job['payload']}")
+    for index, name in enumerate(job['payload']['files']):
+        queue.add_result(job['job_id'], index, {'filename': name, 'fit_score': index + 3})
+        queue.update_progress(job['job_id'], index + 1, 2, stage='Evaluating')
+    queue.complete(job['job_id'], {'evaluated': 2})
+
+    print(f"Job: {queue.get_job(first)['status']}, results: {queue.get_results(first)}")
+    print(f"Next claim: {queue.claim('worker-2')['payload']}, then: {queue.claim('worker-2')}")
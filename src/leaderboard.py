@@ -0,0 +1,194 @@
+"""
+Leaderboard Module
+Persistent per-role ranking of candidates, updated in place as evaluations arrive.
+Backed by SQLite: the (role_id, score) B-tree index keeps each role sorted, so
+an upsert is O(log n) and reading the top K never scans the whole role.
+"""
+
+import os
+import sqlite3
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from src.score_sketch import AI_SCORES_SUFFIX
+
+DEFAULT_LEADERBOARD_FILE = os.path.join('data', 'leaderboard.db')
+
+
+class Leaderboard:
+    """
+    Ranked candidates per role. A candidate has at most one entry per role;
+    re-evaluating replaces the previous score. AI Evaluator scores are ranked
+    under the role's AI key (score_sketch.ai_scores_key), apart from its
+    keyword scores, which are on a different scale.
+    """
+
+    def __init__(self, db_file: str = DEFAULT_LEADERBOARD_FILE):
+        """
+        Open (or create) the leaderboard database.
+
+        Args:
+            db_file: Path to the SQLite file
+        """
+        self.db_file = db_file
+        os.makedirs(os.path.dirname(db_file) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(db_file, timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._create_tables()
+
+    def _create_tables(self):
+        """Create the table and ranking index if they don't exist"""
+        with self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS leaderboard (
+                    role_id TEXT NOT NULL,
+                    candidate_id TEXT NOT NULL,
+                    role_name TEXT,
+                    candidate_name TEXT,
+                    email TEXT,
+                    score REAL NOT NULL,
+                    fit_label TEXT,
+                    source TEXT,
+                    updated_at TEXT,
+                    PRIMARY KEY (role_id, candidate_id)
+                )
+            """)
+            # Ties rank by earlier evaluation first
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_leaderboard_rank
+                ON leaderboard (role_id, score DESC, updated_at)
+            """)
+            # Older versions ranked AI scores under the plain role ID: move them to the AI key
+            self.conn.execute("""
+                UPDATE leaderboard SET role_id = role_id || ? WHERE source = 'AI Evaluator'
+                AND role_id NOT LIKE '%' || ? AND NOT EXISTS (
+                    SELECT 1 FROM leaderboard AS ai
+                    WHERE ai.role_id = leaderboard.role_id || ? AND ai.candidate_id = leaderboard.candidate_id
+                )
+            """, (AI_SCORES_SUFFIX, AI_SCORES_SUFFIX, AI_SCORES_SUFFIX))
+            self.conn.execute("DELETE FROM leaderboard WHERE source = 'AI Evaluator' AND role_id NOT LIKE '%' || ?",
+                              (AI_SCORES_SUFFIX,))
+
+    def record(self, role_id: str, candidate_id: str, score: float, candidate_name: str = '',
+               email: str = '', fit_label: str = '', role_name: str = '', source: str = '') -> bool:
+        """
+        Insert or update one candidate's score for a role.
+
+        Args:
+            role_id: Role identifier
+            candidate_id: Candidate identifier (ResumeIndex.make_candidate_id)
+            score: Score (0-100)
+            candidate_name: Candidate name for display
+            email: Candidate email for display
+            fit_label: Fit label for display
+            role_name: Role name for display
+            source: Where the evaluation came from (e.g. 'AI Evaluator')
+
+        Returns:
+            True if successful, False otherwise
+        """
+        return self.record_many([{
+            'role_id': role_id, 'candidate_id': candidate_id, 'score': score,
+            'candidate_name': candidate_name, 'email': email, 'fit_label': fit_label,
+            'role_name': role_name, 'source': source
+        }]) == 1
+
+    def record_many(self, entries: Iterable[Dict]) -> int:
+        """
+        Insert or update several entries in one transaction.
+
+        Args:
+            entries: Dictionaries with the same fields as record()
+
+        Returns:
+            Number of entries written
+        """
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        rows = [
+            (
+                entry['role_id'], entry['candidate_id'], entry.get('role_name', ''),
+                entry.get('candidate_name', ''), entry.get('email', ''), float(entry['score']),
+                entry.get('fit_label', ''), entry.get('source', ''), timestamp
+            )
+            for entry in entries if entry.get('candidate_id')
+        ]
+        try:
+            with self.conn:
+                self.conn.executemany("""
+                    INSERT INTO leaderboard
+                        (role_id, candidate_id, role_name, candidate_name, email, score, fit_label, source, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (role_id, candidate_id) DO UPDATE SET
+                        role_name = excluded.role_name,
+                        candidate_name = excluded.candidate_name,
+                        email = excluded.email,
+                        score = excluded.score,
+                        fit_label = excluded.fit_label,
+                        source = excluded.source,
+                        updated_at = excluded.updated_at
+                """, rows)
+            return len(rows)
+        except Exception as e:
+            print(f"[ERROR] Failed to update leaderboard: {e}")
+            return 0
+
+    def top(self, role_id: str, top_k: int = 20, min_score: float = None) -> List[Dict]:
+        """
+        Get the best candidates for a role, best first.
+
+        Args:
+            role_id: Role identifier
+            top_k: Number of candidates to return
+            min_score: Optional minimum score
+
+        Returns:
+            List of entry dictionaries with a 1-based rank
+        """
+        rows = self.conn.execute("""
+            SELECT * FROM leaderboard
+            WHERE role_id = ? AND score >= ?
+            ORDER BY score DESC, updated_at
+            LIMIT ?
+        """, (role_id, min_score if min_score is not None else float('-inf'), top_k)).fetchall()
+        return [{'rank': rank, **dict(row)} for rank, row in enumerate(rows, 1)]
+
+    def get_rank(self, role_id: str, candidate_id: str) -> Optional[int]:
+        """Get a candidate's 1-based rank for a role, or None if not ranked"""
+        row = self.conn.execute(
+            "SELECT score, updated_at FROM leaderboard WHERE role_id = ? AND candidate_id = ?",
+            (role_id, candidate_id)
+        ).fetchone()
+        if row is None:
+            return None
+        ahead = self.conn.execute("""
+            SELECT COUNT(*) FROM leaderboard
+            WHERE role_id = ? AND (score > ? OR (score = ? AND updated_at < ?))
+        """, (role_id, row['score'], row['score'], row['updated_at'])).fetchone()[0]
+        return ahead + 1
+
+    def get_roles(self) -> List[Dict]:
+        """Get every role on the leaderboard with its name and candidate count"""
+        rows = self.conn.execute("""
+            SELECT role_id, MAX(role_name) AS role_name, COUNT(*) AS candidates
+            FROM leaderboard GROUP BY role_id ORDER BY role_id
+        """).fetchall()
+        return [dict(row) for row in rows]
+
+    def remove_candidate(self, candidate_id: str) -> int:
+        """Remove a candidate from every role; returns the number of entries removed"""
+        with self.conn:
+            return self.conn.execute("DELETE FROM leaderboard WHERE candidate_id = ?", (candidate_id,)).rowcount
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+
+
+# Example usage (for testing): python -m src.leaderboard
+if __name__ == "__main__":
+    leaderboard = Leaderboard()
+    for role in leaderboard.get_roles():
+        print(f"\n{role['role_name'] or role['role_id']} ({role['candidates']} candidates):")
+        for entry in leaderboard.top(role['role_id'], top_k=5):
+            print(f"  #{entry['rank']} {entry['candidate_name']}  {entry['score']:.0f}")
@@ -0,0 +1,300 @@
+"""
+LLM Cache Module
+On-disk (SQLite) cache of AI evaluator responses, so re-evaluating the same
+resume against the same JD doesn't pay for the LLM again. Keys include the
+normalized resume hash, JD hash, model and prompt version. Entries expire
+after a TTL and the least recently used ones are evicted past a size limit.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.combined_evaluator import SchemaError, validate_combined
+
+DEFAULT_CACHE_FILE = os.path.join('data', 'llm_cache.db')
+DEFAULT_TTL_HOURS = 24 * 7
+DEFAULT_MAX_ENTRIES = 5000
+
+# Bump when the evaluator prompts change so old answers aren't reused
+DEFAULT_PROMPT_VERSION = '1'
+
+# Evaluations with this label are error placeholders, never cached
+EVALUATION_FAILED_LABEL = 'Evaluation Failed'
+
+
+def text_hash(text: str) -> str:
+    """SHA-256 of text with whitespace normalized (re-extracted PDFs hash the same)"""
+    normalized = re.sub(r'\s+', ' ', text or '').strip()
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+class LLMCache:
+    """
+    Key/value store for JSON-serializable LLM results with TTL and LRU eviction.
+    Safe to share between the evaluation engine's worker threads.
+    """
+
+    def __init__(self, cache_file: str = DEFAULT_CACHE_FILE, ttl_hours: float = None, max_entries: int = None):
+        """
+        Open (or create) the cache.
+
+        Args:
+            cache_file: Path to the SQLite file
+            ttl_hours: Entry lifetime (defaults to LLM_CACHE_TTL_HOURS, then 7 days)
+            max_entries: Size limit (defaults to LLM_CACHE_MAX_ENTRIES, then 5000)
+        """
+        self.cache_file = cache_file
+        if ttl_hours is None:
+            try:
+                ttl_hours = float(os.getenv('LLM_CACHE_TTL_HOURS', DEFAULT_TTL_HOURS))
+            except ValueError:
+                print(f"[WARN] Invalid LLM_CACHE_TTL_HOURS - using {DEFAULT_TTL_HOURS}")
+                ttl_hours = DEFAULT_TTL_HOURS
+        if max_entries is None:
+            try:
+                max_entries = int(os.getenv('LLM_CACHE_MAX_ENTRIES', DEFAULT_MAX_ENTRIES))
+            except ValueError:
+                print(f"[WARN] Invalid LLM_CACHE_MAX_ENTRIES - using {DEFAULT_MAX_ENTRIES}")
+                max_entries = DEFAULT_MAX_ENTRIES
+        self.ttl_seconds = float(ttl_hours) * 3600
+        self.max_entries = int(max_entries)
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(cache_file) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(cache_file, timeout=30, check_same_thread=False)
+        with self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used_at REAL NOT NULL
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used ON llm_cache (last_used_at)")
+            # Lifetime hit/miss counters across sessions
+            self.conn.execute("CREATE TABLE IF NOT EXISTS llm_cache_stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+
+    @staticmethod
+    def make_key(method: str, resume_text: str, jd_text: str, model: str, prompt_version: str) -> str:
+        """
+        Build the cache key for one evaluator call.
+
+        Args:
+            method: Evaluator method name
+            resume_text: Resume text
+            jd_text: Job description text
+            model: LLM model name
+            prompt_version: Prompt template version
+
+        Returns:
+            Hex key
+        """
+        parts = [method, text_hash(resume_text), text_hash(jd_text), model or '', prompt_version or '']
+        return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()
+
+    def _count(self, name: str):
+        self.conn.execute("""
+            INSERT INTO llm_cache_stats (name, value) VALUES (?, 1)
+            ON CONFLICT (name) DO UPDATE SET value = value + 1
+        """, (name,))
+
+    def peek(self, key: str) -> Optional[Any]:
+        """Get a live value without counting a hit or miss or touching its LRU time"""
+        with self.lock:
+            row = self.conn.execute("SELECT value, created_at FROM llm_cache WHERE cache_key = ?", (key,)).fetchone()
+        if row is None or time.time() - row[1] > self.ttl_seconds:
+            return None
+        return json.loads(row[0])
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None if missing or expired"""
+        now = time.time()
+        with self.lock, self.conn:
+            row = self.conn.execute(
+                "SELECT value, created_at FROM llm_cache WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl_seconds:
+                if row is not None:
+                    self.conn.execute("DELETE FROM llm_cache WHERE cache_key = ?", (key,))
+                self.misses += 1
+                self._count('misses')
+                return None
+            self.conn.execute("UPDATE llm_cache SET last_used_at = ? WHERE cache_key = ?", (now, key))
+            self.hits += 1
+            self._count('hits')
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any):
+        """Store a value, evicting expired and least recently used entries past max_entries"""
+        now = time.time()
+        try:
+            with self.lock, self.conn:
+                self.conn.execute("""
+                    INSERT OR REPLACE INTO llm_cache (cache_key, value, created_at, last_used_at)
+                    VALUES (?, ?, ?, ?)
+                """, (key, json.dumps(value), now, now))
+                self.conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+                excess = self.conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0] - self.max_entries
+                if excess > 0:
+                    self.conn.execute("""
+                        DELETE FROM llm_cache WHERE cache_key IN (
+                            SELECT cache_key FROM llm_cache ORDER BY last_used_at LIMIT ?
+                        )
+                    """, (excess,))
+        except Exception as e:
+            print(f"[WARN] Could not write LLM cache: {e}")
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any],
+                       is_valid: Callable[[Any], bool] = bool) -> Any:
+        """
+        Return the cached value, or compute, store and return it.
+
+        Args:
+            key: Cache key
+            compute: Produces the value on a miss
+            is_valid: Only values passing this check are stored or served from
+                      the cache (default: non-empty), so failures aren't reused
+
+        Returns:
+            The cached or computed value
+        """
+        value = self.get(key)
+        if value is None or not is_valid(value):
+            value = compute()
+            if is_valid(value):
+                self.set(key, value)
+        return value
+
+    def get_stats(self) -> Dict:
+        """Hit/miss counts for this session and lifetime, plus the number of entries"""
+        with self.lock:
+            lifetime = dict(self.conn.execute("SELECT name, value FROM llm_cache_stats").fetchall())
+            entries = self.conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        session_total = self.hits + self.misses
+        lifetime_total = lifetime.get('hits', 0) + lifetime.get('misses', 0)
+        return {
+            'entries': entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / session_total if session_total else 0.0,
+            'lifetime_hits': lifetime.get('hits', 0),
+            'lifetime_misses': lifetime.get('misses', 0),
+            'lifetime_hit_rate': lifetime.get('hits', 0) / lifetime_total if lifetime_total else 0.0
+        }
+
+    def clear(self):
+        """Remove every cached entry"""
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM llm_cache")
+
+
+class CachedResumeEvaluator:
+    """
+    Drop-in wrapper around a resume evaluator (extract_candidate_data /
+    evaluate_resume) that answers repeated calls from an LLMCache.
+    """
+
+    def __init__(self, evaluator, cache: LLMCache = None, model: str = None, prompt_version: str = None):
+        """
+        Wrap an evaluator.
+
+        Args:
+            evaluator: Evaluator to call on cache misses
+            cache: LLMCache (a default one is opened if None)
+            model: Model name for the key (defaults to evaluator.model, then OPENAI_MODEL)
+            prompt_version: Prompt version for the key. Defaults to LLM_PROMPT_VERSION
+                            (then '1'), prefixed with evaluator.PROMPT_VERSION when the
+                            evaluator has one (e.g. 'combined-1:1'), so bumping either
+                            the evaluator's prompts or the env var invalidates old answers
+        """
+        self.evaluator = evaluator
+        self.cache = cache or LLMCache()
+        self.model = model or getattr(evaluator, 'model', None) or os.getenv('OPENAI_MODEL', '')
+        if not prompt_version:
+            prompt_version = os.getenv('LLM_PROMPT_VERSION', DEFAULT_PROMPT_VERSION)
+            evaluator_version = getattr(evaluator, 'PROMPT_VERSION', None)
+            if evaluator_version:
+                prompt_version = f"{evaluator_version}:{prompt_version}"
+        self.prompt_version = str(prompt_version)
+
+    def _key(self, method: str, resume_text: str, jd_text: str) -> str:
+        return LLMCache.make_key(method, resume_text, jd_text, self.model, self.prompt_version)
+
+    @staticmethod
+    def is_cacheable(method: str, value: Any) -> bool:
+        """
+        Whether an evaluator answer is worth caching: no empty parts, no
+        "Evaluation Failed" placeholder, and combined answers must pass the
+        combined schema (validate_combined).
+        """
+        if method == 'extract_and_evaluate':
+            if not isinstance(value, (list, tuple)) or len(value) != 2 or not all(value):
+                return False
+            candidate_data, evaluation = value
+            try:
+                validate_combined({'candidate': dict(candidate_data), 'evaluation': dict(evaluation)})
+            except (SchemaError, TypeError, ValueError):
+                return False
+            return evaluation.get('fit_label') != EVALUATION_FAILED_LABEL
+        return bool(value) and not (isinstance(value, dict) and value.get('fit_label') == EVALUATION_FAILED_LABEL)
+
+    def _cached_call(self, method: str, resume_text: str, jd_text: str) -> Any:
+        return self.cache.get_or_compute(
+            self._key(method, resume_text, jd_text),
+            lambda: getattr(self.evaluator, method)(resume_text, jd_text),
+            is_valid=lambda value: self.is_cacheable(method, value)
+        )
+
+    def is_cached(self, method: str, resume_text: str, jd_text: str) -> bool:
+        """True if a call would be answered from the cache (used to skip rate limiting)"""
+        return self.is_cacheable(method, self.cache.peek(self._key(method, resume_text, jd_text)))
+
+    def extract_candidate_data(self, resume_text: str, jd_text: str = '') -> Dict:
+        """Cached evaluator.extract_candidate_data"""
+        return self._cached_call('extract_candidate_data', resume_text, jd_text)
+
+    def evaluate_resume(self, resume_text: str, jd_text: str) -> Dict:
+        """Cached evaluator.evaluate_resume"""
+        return self._cached_call('evaluate_resume', resume_text, jd_text)
+
+    def extract_and_evaluate(self, resume_text: str, jd_text: str) -> Tuple[Dict, Dict]:
+        """Cached evaluator.extract_and_evaluate (combined single-call evaluators)"""
+        candidate_data, evaluation = self._cached_call('extract_and_evaluate', resume_text, jd_text)
+        return candidate_data, evaluation
+
+    def __getattr__(self, name):
+        # Anything else (e.g. other evaluator methods) goes to the wrapped evaluator
+        return getattr(self.evaluator, name)
+
+
+# Example usage (for testing): python -m src.llm_cache
+if __name__ == "__main__":
+    import tempfile
+
+    class CountingEvaluator:
+        calls = 0
+
+        def extract_candidate_data(self, resume_text, jd_text):
+            CountingEvaluator.calls += 1
+            return {'name': 'Jane Doe'}
+
+        def evaluate_resume(self, resume_text, jd_text):
+            CountingEvaluator.calls += 1
+            return {'fit_score': 4}
+
+    cache_path = os.path.join(tempfile.mkdtemp(), 'llm_cache.db')
+    cached = CachedResumeEvaluator(CountingEvaluator(), LLMCache(cache_path), model='demo')
+    for _ in range(3):
+        cached.extract_candidate_data("Jane  Doe\nPython", "JD")
+        cached.evaluate_resume("Jane Doe Python", "JD")
+    print(f"Evaluator calls: {CountingEvaluator.calls}, cache stats: {cached.cache.get_stats()}")
@@ -0,0 +1,180 @@
+"""
+LLM Client Module
+Minimal OpenAI-compatible chat completions client over requests.
+Honours OPENAI_BASE_URL, so the local stub (src/llm_stub_server.py) or any
+compatible gateway can stand in for the provider.
+"""
+
+import json
+import os
+import random
+import time
+from typing import Dict, List, Tuple
+
+import requests
+
+DEFAULT_BASE_URL = 'https://api.openai.com/v1'
+DEFAULT_MODEL = 'gpt-4o-mini'
+
+# Retries for throttled (429) and server error (5xx) responses
+DEFAULT_MAX_RETRIES = 2
+RETRY_BACKOFF_SECONDS = 0.5
+MAX_RETRY_WAIT_SECONDS = 30
+
+
+class LLMError(Exception):
+    """
+    An LLM request failed (status_code is None for network errors and timeouts;
+    retry_after holds the server's Retry-After seconds, if it sent one).
+    """
+
+    def __init__(self, message: str, status_code: int = None, retry_after: float = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def env_max_retries() -> int:
+    """Retries for 429 and 5xx responses from LLM_MAX_RETRIES (default 2)"""
+    try:
+        return int(os.getenv('LLM_MAX_RETRIES', DEFAULT_MAX_RETRIES))
+    except ValueError:
+        print(f"[WARN] Invalid LLM_MAX_RETRIES - using {DEFAULT_MAX_RETRIES}")
+        return DEFAULT_MAX_RETRIES
+
+
+def is_retryable(status_code: int) -> bool:
+    """Throttled (429) and server error (5xx) responses are worth retrying"""
+    return status_code is not None and (status_code == 429 or status_code >= 500)
+
+
+def retry_delay(attempt: int, retry_after: float = None) -> float:
+    """
+    Seconds to wait before a retry: the server's Retry-After when given, else
+    exponential backoff with jitter.
+
+    Args:
+        attempt: Retry number (0 for the first retry)
+        retry_after: Retry-After seconds from the response
+    """
+    wait = retry_after if retry_after is not None else RETRY_BACKOFF_SECONDS * 2 ** attempt * random.uniform(0.5, 1.5)
+    return min(max(wait, 0.0), MAX_RETRY_WAIT_SECONDS)
+
+
+def _retry_after(response: requests.Response) -> float:
+    """Retry-After header in seconds, or None"""
+    try:
+        return float(response.headers.get('Retry-After', ''))
+    except ValueError:
+        return None
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for rate limiting (about 4 characters per token)"""
+    return len(text) // 4 + 1
+
+
+class LLMClient:
+    """
+    Sends chat completion requests and returns the message content.
+    """
+
+    def __init__(self, api_key: str = None, base_url: str = None, model: str = None, timeout: float = 60,
+                 max_retries: int = None):
+        """
+        Initialize the client.
+
+        Args:
+            api_key: API key (defaults to OPENAI_API_KEY)
+            base_url: API base URL (defaults to OPENAI_BASE_URL, then the OpenAI API)
+            model: Model name (defaults to OPENAI_MODEL, then gpt-4o-mini)
+            timeout: Request timeout in seconds
+            max_retries: Retries for 429 and 5xx responses, with exponential
+                         backoff (defaults to LLM_MAX_RETRIES, then 2; 0 disables).
+                         EvaluationEngine sets it to 0 and retries itself.
+        """
+        self.api_key = api_key or os.getenv('OPENAI_API_KEY', '')
+        self.base_url = (base_url or os.getenv('OPENAI_BASE_URL') or DEFAULT_BASE_URL).rstrip('/')
+        self.model = model or os.getenv('OPENAI_MODEL') or DEFAULT_MODEL
+        self.timeout = timeout
+        self.max_retries = max(0, max_retries if max_retries is not None else env_max_retries())
+        self.session = requests.Session()
+
+    def chat(self, messages: List[Dict], json_mode: bool = True, temperature: float = 0,
+             max_tokens: int = None) -> Tuple[str, Dict]:
+        """
+        Send one chat completion request. Throttled (429) and server error
+        (5xx) responses are retried up to max_retries times before failing.
+
+        Args:
+            messages: Chat messages ({'role', 'content'})
+            json_mode: Ask for a JSON object response
+            temperature: Sampling temperature
+            max_tokens: Optional output token limit
+
+        Returns:
+            Tuple of (message content, usage dictionary)
+
+        Raises:
+            LLMError: On HTTP errors (after retries), timeouts or malformed responses
+        """
+        payload = {'model': self.model, 'messages': messages, 'temperature': temperature}
+        if json_mode:
+            payload['response_format'] = {'type': 'json_object'}
+        if max_tokens:
+            payload['max_tokens'] = max_tokens
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.session.post(
+                    f"{self.base_url}/chat/completions",
+                    json=payload,
+                    headers={'Authorization': f"Bearer {self.api_key}"},
+                    timeout=self.timeout
+                )
+            except requests.exceptions.Timeout:
+                raise LLMError("LLM request timed out")
+            except requests.exceptions.RequestException as e:
+                raise LLMError(f"LLM request failed: {e}")
+
+            if not is_retryable(response.status_code) or attempt == self.max_retries:
+                break
+            wait = retry_delay(attempt, _retry_after(response))
+            print(f"[WARN] LLM API returned status code {response.status_code} - retrying in {wait:.1f}s")
+            time.sleep(wait)
+
+        if response.status_code != 200:
+            raise LLMError(f"LLM API returned status code: {response.status_code}", response.status_code,
+                           _retry_after(response))
+
+        try:
+            data = response.json()
+            return data['choices'][0]['message']['content'], data.get('usage', {})
+        except Exception as e:
+            raise LLMError(f"Malformed LLM response: {e}")
+
+    def chat_json(self, messages: List[Dict], **kwargs) -> Dict:
+        """
+        Send a chat completion request and parse the JSON object it returns.
+
+        Raises:
+            LLMError: On request failure or if the content isn't a JSON object
+        """
+        content, _ = self.chat(messages, json_mode=True, **kwargs)
+        try:
+            parsed = json.loads(content)
+        except json.JSONDecodeError as e:
+            raise LLMError(f"LLM returned invalid JSON: {e}")
+        if not isinstance(parsed, dict):
+            raise LLMError("LLM returned JSON that is not an object")
+        return parsed
+
+
+# Example usage (for testing): python -m src.llm_client
+if __name__ == "__main__":
+    from src.llm_stub_server import start_stub_server
+
+    server, base_url = start_stub_server()
+    client = LLMClient(api_key='stub', base_url=base_url)
+    print(client.chat_json([{'role': 'user', 'content': 'Resume: Jane Doe, jane@example.com, Python'}]))
+    server.shutdown()
@@ -0,0 +1,235 @@
+"""
+LLM Resilience Module
+Keeps AI evaluation moving when the LLM provider degrades:
+- CircuitBreaker tracks the recent error rate and latency percentiles and,
+  when either is too high, fails calls immediately (callers fall back to the
+  keyword score) instead of letting every resume wait for a timeout.
+- AIMDLimiter adapts the number of concurrent LLM calls: +1 after a window of
+  healthy calls, halved on 429 throttling or slow responses.
+"""
+
+import math
+import os
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+from src.llm_client import LLMError
+
+# Breaker states
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+DEFAULT_WINDOW = 20
+DEFAULT_MIN_CALLS = 5
+DEFAULT_ERROR_RATE = 0.5
+DEFAULT_P95_SECONDS = 45.0
+DEFAULT_COOLDOWN_SECONDS = 30.0
+DEFAULT_LATENCY_TARGET_SECONDS = 15.0
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a numeric setting from the environment"""
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        print(f"[WARN] Invalid {name} - using {default}")
+        return default
+
+
+def percentile(values, q: float) -> Optional[float]:
+    """Nearest-rank percentile (q between 0 and 1) of a list of numbers"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+
+class CircuitOpenError(LLMError):
+    """The circuit breaker is open; the LLM was not called."""
+
+
+class CircuitBreaker:
+    """
+    Error-rate and latency circuit breaker over a sliding window of calls.
+    Closed: calls pass. Open: calls are rejected until the cooldown ends.
+    Half-open: one trial call decides whether to close or re-open.
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW, min_calls: int = DEFAULT_MIN_CALLS,
+                 error_rate: float = None, p95_seconds: float = None, cooldown_seconds: float = None):
+        """
+        Initialize the breaker. Unset thresholds come from LLM_BREAKER_ERROR_RATE,
+        LLM_BREAKER_P95_SECONDS and LLM_BREAKER_COOLDOWN_SECONDS.
+
+        Args:
+            window: Number of recent calls considered
+            min_calls: Calls needed in the window before the breaker can trip
+            error_rate: Error fraction that trips the breaker
+            p95_seconds: 95th percentile latency that trips the breaker (0 = ignore latency)
+            cooldown_seconds: Time the breaker stays open before a trial call
+        """
+        self.window = deque(maxlen=window)
+        self.min_calls = min_calls
+        self.error_rate = error_rate if error_rate is not None else _env_float('LLM_BREAKER_ERROR_RATE', DEFAULT_ERROR_RATE)
+        self.p95_seconds = p95_seconds if p95_seconds is not None else _env_float('LLM_BREAKER_P95_SECONDS', DEFAULT_P95_SECONDS)
+        self.cooldown_seconds = (cooldown_seconds if cooldown_seconds is not None
+                                 else _env_float('LLM_BREAKER_COOLDOWN_SECONDS', DEFAULT_COOLDOWN_SECONDS))
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.trial_in_flight = False
+        self.trips = 0
+        self.rejected = 0
+        self.lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Whether a call may go to the LLM now"""
+        with self.lock:
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.cooldown_seconds:
+                self.state = HALF_OPEN
+                self.trial_in_flight = False
+            if self.state == CLOSED:
+                return True
+            if self.state == HALF_OPEN and not self.trial_in_flight:
+                self.trial_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record(self, success: bool, latency: float):
+        """
+        Record the outcome of a call that was allowed through.
+
+        Args:
+            success: False for errors and unusable (empty) answers
+            latency: Seconds the call took
+        """
+        with self.lock:
+            if self.state == HALF_OPEN:
+                self.trial_in_flight = False
+                if success and not self._too_slow([latency]):
+                    self.state = CLOSED
+                    self.window.clear()
+                    print("[OK] LLM circuit closed - provider recovered")
+                else:
+                    self._open("trial call failed")
+                return
+
+            self.window.append((success, latency))
+            if len(self.window) < self.min_calls or self.state != CLOSED:
+                return
+            errors = sum(1 for ok, _ in self.window if not ok)
+            if errors / len(self.window) >= self.error_rate:
+                self._open(f"error rate {errors}/{len(self.window)}")
+            elif self._too_slow([seconds for _, seconds in self.window]):
+                self._open(f"p95 latency {percentile([s for _, s in self.window], 0.95):.1f}s")
+
+    def _too_slow(self, latencies) -> bool:
+        return bool(self.p95_seconds) and percentile(latencies, 0.95) > self.p95_seconds
+
+    def _open(self, reason: str):
+        """Trip the breaker (lock held)"""
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        self.trips += 1
+        print(f"[WARN] LLM circuit opened ({reason}) - using keyword scores for {self.cooldown_seconds:g}s")
+
+    def get_stats(self) -> Dict:
+        """Current state, error rate and latency percentiles over the window"""
+        with self.lock:
+            latencies = [seconds for _, seconds in self.window]
+            errors = sum(1 for ok, _ in self.window if not ok)
+            return {
+                'state': self.state,
+                'trips': self.trips,
+                'rejected': self.rejected,
+                'error_rate': errors / len(self.window) if self.window else 0.0,
+                'p50_latency': percentile(latencies, 0.5),
+                'p95_latency': percentile(latencies, 0.95)
+            }
+
+
+class AIMDLimiter:
+    """
+    Concurrency limiter with additive-increase / multiplicative-decrease.
+    Use as a context manager around each LLM call.
+    """
+
+    def __init__(self, max_limit: int, min_limit: int = 1, initial: int = None, latency_target: float = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_limit: Highest allowed concurrency (e.g. the worker count)
+            min_limit: Lowest concurrency
+            initial: Starting concurrency (defaults to max_limit)
+            latency_target: Calls slower than this count as congestion
+                            (defaults to LLM_LATENCY_TARGET_SECONDS, then 15; 0 = ignore latency)
+        """
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.limit = float(initial or self.max_limit)
+        self.latency_target = (latency_target if latency_target is not None
+                               else _env_float('LLM_LATENCY_TARGET_SECONDS', DEFAULT_LATENCY_TARGET_SECONDS))
+        self.in_flight = 0
+        self.decreases = 0
+        self.last_decrease = 0.0
+        self.condition = threading.Condition()
+
+    def __enter__(self):
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        with self.condition:
+            self.in_flight -= 1
+            self.condition.notify_all()
+        return False
+
+    def on_success(self, latency: float):
+        """Healthy call: grow by about one slot per limit-many calls; slow call: shrink"""
+        if self.latency_target and latency > self.latency_target:
+            self.on_congestion()
+            return
+        with self.condition:
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+            self.condition.notify_all()
+
+    def on_congestion(self):
+        """Throttled (429) or slow call: halve the limit, at most once per in-flight round"""
+        with self.condition:
+            now = time.monotonic()
+            # Calls already in flight when we backed off report the same congestion
+            if now - self.last_decrease < 1.0:
+                return
+            self.last_decrease = now
+            self.limit = max(self.min_limit, self.limit / 2)
+            self.decreases += 1
+        print(f"[WARN] LLM congestion - concurrency reduced to {int(self.limit)}")
+
+
+# Example usage (for testing): python -m src.llm_resilience
+if __name__ == "__main__":
+    import random
+
+    breaker = CircuitBreaker(window=10, min_calls=5, error_rate=0.5, p95_seconds=0, cooldown_seconds=0.2)
+    rng = random.Random(1)
+    for call in range(30):
+        if call == 20:
+            time.sleep(0.25)  # Provider recovers after the cooldown
+        healthy = call < 8 or call >= 20
+        if breaker.allow_request():
+            breaker.record(healthy or rng.random() < 0.2, 0.1)
+    print(f"Breaker: {breaker.get_stats()}")
+
+    limiter = AIMDLimiter(max_limit=8, initial=2, latency_target=1.0)
+    for _ in range(20):
+        limiter.on_success(0.2)
+    print(f"After 20 fast calls: limit {limiter.limit:.1f}")
+    limiter.on_congestion()
+    print(f"After a 429: limit {limiter.limit:.1f}")
@@ -0,0 +1,189 @@
+"""
+LLM Stub Server Module
+Local OpenAI-compatible /v1/chat/completions server for running the AI
+Evaluator and the evaluation engine offline. Answers are deterministic and
+derived from the prompt text, and every response carries both the
+candidate-data and the evaluation fields, so any prompt layout gets a usable reply
+(prompts asking for "candidate" and "evaluation" objects get them nested, and
+batched prompts with "### RESUME <id>" sections get one result per resume).
+It can also inject faults (random 500s and 429s) to exercise the circuit
+breaker and adaptive concurrency in llm_resilience.
+
+Usage:
+    python -m src.llm_stub_server [port] [error_rate] [throttle_rate]
+    then set OPENAI_BASE_URL=http://127.0.0.1:<port>/v1
+"""
+
+import hashlib
+import json
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Tuple
+
+EMAIL_PATTERN = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}')
+PHONE_PATTERN = re.compile(r'\+?\d[\d\s().-]{8,}\d')
+
+BATCH_RESUME_PATTERN = re.compile(r'^### RESUME (\S+)$', re.MULTILINE)
+
+FIT_LABELS = {5: "Excellent Fit", 4: "Strong Fit", 3: "Good Fit", 2: "Moderate Fit", 1: "Weak Fit", 0: "Not a Fit"}
+
+
+def stub_parts(prompt: str) -> Tuple[Dict, Dict]:
+    """Deterministic (candidate data, evaluation) derived from the text"""
+    digest = int(hashlib.sha256(prompt.encode('utf-8')).hexdigest(), 16)
+    score = digest % 6
+    email = EMAIL_PATTERN.search(prompt)
+    phone = PHONE_PATTERN.search(prompt)
+    candidate = {
+        'name': f"Candidate {digest % 10000:04d}",
+        'email': email.group(0) if email else None,
+        'phone': phone.group(0).strip() if phone else None,
+        'location': None,
+        'total_years_experience': digest % 15,
+        'relevant_years_experience': digest % (digest % 15 + 1),
+        'experience_brief': "Stub experience summary"
+    }
+    evaluation = {
+        'fit_score': score,
+        'fit_label': FIT_LABELS[score],
+        'reasoning': "Stub evaluation (offline LLM stand-in)",
+        'strengths': ["Stub strength"],
+        'gaps': ["Stub gap"]
+    }
+    return candidate, evaluation
+
+
+def stub_answer(prompt: str) -> Dict:
+    """
+    Build a deterministic answer for a prompt.
+
+    Args:
+        prompt: All message contents joined together
+
+    Returns:
+        Dictionary with candidate data and evaluation fields
+    """
+    sections = BATCH_RESUME_PATTERN.split(prompt)
+    if '"results"' in prompt and len(sections) > 1:
+        # sections = [preamble + JD, id1, resume1, id2, resume2, ...]
+        results = []
+        for resume_id, resume_text in zip(sections[1::2], sections[2::2]):
+            candidate, evaluation = stub_parts(resume_text)
+            results.append({'id': resume_id, 'candidate': candidate, 'evaluation': evaluation})
+        return {'results': results}
+
+    candidate, evaluation = stub_parts(prompt)
+    if '"candidate"' in prompt and '"evaluation"' in prompt:
+        return {'candidate': candidate, 'evaluation': evaluation}
+    return {**candidate, **evaluation}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Handles OpenAI-style chat completion requests (latency and fault rates are read from the server)."""
+
+    def do_GET(self):
+        if self.path.rstrip('/').endswith('/models'):
+            self._send(200, {'object': 'list', 'data': [{'id': 'stub-model', 'object': 'model'}]})
+        else:
+            self._send(404, {'error': {'message': 'Not found'}})
+
+    def do_POST(self):
+        if not self.path.rstrip('/').endswith('/chat/completions'):
+            self._send(404, {'error': {'message': 'Not found'}})
+            return
+
+        length = int(self.headers.get('Content-Length', 0))
+        try:
+            request = json.loads(self.rfile.read(length) or b'{}')
+        except json.JSONDecodeError:
+            self._send(400, {'error': {'message': 'Invalid JSON'}})
+            return
+
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        with self.server.fault_lock:
+            roll = self.server.fault_random.random()
+        if roll < self.server.error_rate:
+            self._send(500, {'error': {'message': 'Injected server error'}})
+            return
+        if roll < self.server.error_rate + self.server.throttle_rate:
+            self._send(429, {'error': {'message': 'Injected rate limit'}}, {'Retry-After': '1'})
+            return
+
+        prompt = "\n".join(str(message.get('content', '')) for message in request.get('messages', []))
+        content = json.dumps(stub_answer(prompt))
+        prompt_tokens = len(prompt) // 4 + 1
+        completion_tokens = len(content) // 4 + 1
+        self._send(200, {
+            'id': 'chatcmpl-stub',
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': request.get('model', 'stub-model'),
+            'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': content}, 'finish_reason': 'stop'}],
+            'usage': {
+                'prompt_tokens': prompt_tokens,
+                'completion_tokens': completion_tokens,
+                'total_tokens': prompt_tokens + completion_tokens
+            }
+        })
+
+    def _send(self, status: int, body: Dict, headers: Dict = None):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # Keep test output quiet
+
+
+def start_stub_server(port: int = 0, latency: float = 0.0, error_rate: float = 0.0,
+                      throttle_rate: float = 0.0, seed: int = None) -> Tuple[ThreadingHTTPServer, str]:
+    """
+    Start the stub server on a background thread.
+
+    Args:
+        port: Port to listen on (0 picks a free port)
+        latency: Seconds to wait before answering (simulates provider latency)
+        error_rate: Fraction of completions answered with HTTP 500
+        throttle_rate: Fraction of completions answered with HTTP 429
+        seed: Random seed for repeatable fault injection
+
+    Returns:
+        Tuple of (server, base URL ending in /v1); call server.shutdown() to stop it
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', port), StubHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.error_rate = error_rate
+    server.throttle_rate = throttle_rate
+    server.fault_random = random.Random(seed)
+    server.fault_lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+
+# Run standalone: python -m src.llm_stub_server [port] [error_rate] [throttle_rate]
+if __name__ == "__main__":
+    stub_port = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+    stub_error_rate = float(sys.argv[2]) if len(sys.argv) > 2 else 0.0
+    stub_throttle_rate = float(sys.argv[3]) if len(sys.argv) > 3 else 0.0
+    stub_server, stub_url = start_stub_server(stub_port, error_rate=stub_error_rate,
+                                              throttle_rate=stub_throttle_rate)
+    if stub_error_rate or stub_throttle_rate:
+        print(f"[INFO] Injecting faults: {stub_error_rate:.0%} errors, {stub_throttle_rate:.0%} throttled")
+    print(f"[OK] Stub LLM server running - set OPENAI_BASE_URL={stub_url}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        stub_server.shutdown()
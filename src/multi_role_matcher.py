@@ -0,0 +1,165 @@
+"""
+Multi-Role Matcher Module
+Scores each resume against every active role in one matching pass,
+producing a resume x role score matrix and the best-fit role(s) per candidate.
+"""
+
+import os
+from typing import Dict, List, Tuple
+
+from src.jd_matcher import JDMatcher
+from src.skill_taxonomy import get_skill_taxonomy
+
+
+def collect_active_roles(role_manager, jd_library_path: str = 'jd_library') -> List[Dict]:
+    """
+    Collect active roles from the RoleManager plus any JD library files
+    that aren't registered as a role yet.
+
+    Args:
+        role_manager: RoleManager instance
+        jd_library_path: Folder with JD text files
+
+    Returns:
+        List of role dictionaries with role_id, role_name and jd_file
+    """
+    roles = [dict(role) for role in role_manager.get_active_roles()]
+    # Inactive roles stay excluded rather than coming back as unregistered files
+    registered_files = {os.path.normpath(role['jd_file']) for role in role_manager.roles}
+
+    if os.path.exists(jd_library_path):
+        for jd_file in sorted(os.listdir(jd_library_path)):
+            jd_path = os.path.join(jd_library_path, jd_file)
+            if not jd_file.endswith('.txt') or os.path.normpath(jd_path) in registered_files:
+                continue
+            roles.append(role_manager.get_role_for_jd(jd_path))
+
+    return roles
+
+
+class MultiRoleMatcher:
+    """
+    Holds one compiled JDMatcher per role.
+    Each resume's skills are extracted once and then scored against every role
+    with set lookups only.
+    """
+
+    def __init__(self, roles: List[Dict]):
+        """
+        Load and compile the JD of every role.
+
+        Args:
+            roles: List of role dictionaries with role_id, role_name and jd_file
+        """
+        self.skill_matcher = get_skill_taxonomy().matcher
+        self.roles = []
+        self.matchers = []
+
+        for role in roles:
+            if not os.path.exists(role['jd_file']):
+                print(f"[WARN] Skipping role {role['role_id']}: JD file '{role['jd_file']}' not found")
+                continue
+            self.roles.append(role)
+            self.matchers.append(JDMatcher(role['jd_file']))
+
+        print(f"[OK] Multi-role matcher ready for {len(self.roles)} role(s)")
+
+    def score_resume(self, resume_text: str) -> List[Tuple[int, List[str], List[str]]]:
+        """
+        Score one resume against every role.
+
+        Args:
+            resume_text: Full resume text
+
+        Returns:
+            One (match_score, matched_keywords, missing_keywords) tuple per role
+        """
+        resume_skills = set(self.skill_matcher.find_skills(resume_text))
+        return [matcher.score_resume_skills(resume_skills, resume_text) for matcher in self.matchers]
+
+    def evaluate_candidates(self, candidates_list: List[Dict], max_best_roles: int = 3,
+                            scorer=None) -> Tuple[List[Dict], List[List[int]]]:
+        """
+        Evaluate candidates against all roles and assign each to its best-fit role.
+
+        Args:
+            candidates_list: Parsed candidate dictionaries including resume_text
+            max_best_roles: How many roles to list in best_fit_roles
+            scorer: Optional BM25Scorer; when given, every resume is scored against
+                    every role with one sparse matrix product instead of keyword overlap
+
+        Returns:
+            Tuple of (evaluated candidates, score matrix with one row per
+            candidate and one column per role in self.roles)
+        """
+        evaluated_candidates = []
+        score_matrix = []
+
+        # BM25 scores for all resumes with text x all roles (matched/missing still come from keywords)
+        bm25_rows = {}
+        if scorer is not None and self.roles:
+            with_text = [i for i, candidate in enumerate(candidates_list) if candidate.get('resume_text')]
+            if with_text:
+                batch_scores = scorer.score_batch(
+                    [candidates_list[i]['resume_text'] for i in with_text],
+                    [matcher.get_skill_weights() for matcher in self.matchers]
+                )
+                bm25_rows = {i: [int(round(value)) for value in row] for i, row in zip(with_text, batch_scores)}
+
+        for position, candidate in enumerate(candidates_list):
+            resume_text = candidate.get('resume_text', '')
+            evaluated = {key: value for key, value in candidate.items() if key != 'resume_text'}
+
+            if not resume_text or not self.roles:
+                evaluated['auto_fit_score'] = 0
+                evaluated['auto_fit_label'] = "Cannot Evaluate"
+                evaluated['auto_screen_comment'] = "No resume text found" if not resume_text else "No active roles"
+                evaluated['best_fit_roles'] = ''
+                evaluated_candidates.append(evaluated)
+                score_matrix.append([0] * len(self.roles))
+                continue
+
+            role_results = self.score_resume(resume_text)
+            if position in bm25_rows:
+                role_results = [(score, matched, missing)
+                                for score, (_, matched, missing) in zip(bm25_rows[position], role_results)]
+            scores = [score for score, _, _ in role_results]
+            score_matrix.append(scores)
+
+            # Rank roles by score (ties keep role order)
+            ranked = sorted(range(len(scores)), key=lambda i: -scores[i])
+            best = ranked[0]
+            best_score, matched, missing = role_results[best]
+            best_matcher = self.matchers[best]
+
+            evaluated['role_id'] = self.roles[best]['role_id']
+            evaluated['role_name'] = self.roles[best]['role_name']
+            evaluated['auto_fit_score'] = best_score
+            evaluated['auto_fit_label'] = best_matcher.get_fit_label(best_score)
+            evaluated['auto_screen_comment'] = best_matcher.generate_screening_comment(best_score, matched, missing)
+            evaluated['role_scores'] = {role['role_id']: score for role, score in zip(self.roles, scores)}
+            evaluated['best_fit_roles'] = ", ".join(
+                f"{self.roles[i]['role_name']} ({scores[i]}%)"
+                for i in ranked[:max_best_roles] if scores[i] > 0
+            )
+
+            print(f"[OK] Evaluated {evaluated.get('candidate_name', 'Unknown')}: "
+                  f"best fit {evaluated['role_name']} ({best_score}%)")
+            evaluated_candidates.append(evaluated)
+
+        return evaluated_candidates, score_matrix
+
+
+# Example usage (for testing): python -m src.multi_role_matcher
+if __name__ == "__main__":
+    from src.role_manager import RoleManager
+
+    multi_matcher = MultiRoleMatcher(collect_active_roles(RoleManager()))
+    sample = {
+        'candidate_name': 'Jane Doe',
+        'resume_text': "Data analyst with SQL, pandas, numpy and Python. Built Django REST APIs on AWS."
+    }
+    evaluated, matrix = multi_matcher.evaluate_candidates([sample])
+    print(f"Roles: {[role['role_name'] for role in multi_matcher.roles]}")
+    print(f"Scores: {matrix[0]}")
+    print(f"Best fit: {evaluated[0]['best_fit_roles']}")
@@ -0,0 +1,114 @@
+"""
+Pre-screen Module
+Cheap keyword pre-screen in front of the AI Evaluator. Every resume is first
+scored with the JDMatcher keyword score; resumes below a floor get a
+"Screened Out" evaluation straight away and never reach the LLM. The same
+keyword score stands in for the AI evaluation when the LLM is unavailable.
+"""
+
+import os
+from typing import Dict, Optional
+
+DEFAULT_PRESCREEN_FLOOR = 10
+
+SCREENED_OUT_LABEL = "Screened Out"
+KEYWORD_ONLY_SUFFIX = " (keyword only)"
+
+# Missing JD skills listed as gaps on a screened-out evaluation
+MAX_LISTED_GAPS = 5
+
+
+class KeywordPrescreen:
+    """
+    Callable pre-screen for EvaluationEngine: returns an evaluation for resumes
+    below the floor, or None for resumes that should go to the LLM.
+    """
+
+    def __init__(self, matcher, floor: float = None):
+        """
+        Initialize the pre-screen.
+
+        Args:
+            matcher: JDMatcher for the role
+            floor: Minimum keyword score (0-100) to reach the LLM
+                   (defaults to AI_PRESCREEN_FLOOR, then 10; 0 disables)
+        """
+        self.matcher = matcher
+        if floor is None:
+            try:
+                floor = float(os.getenv('AI_PRESCREEN_FLOOR', DEFAULT_PRESCREEN_FLOOR))
+            except ValueError:
+                print(f"[WARN] Invalid AI_PRESCREEN_FLOOR - using {DEFAULT_PRESCREEN_FLOOR}")
+                floor = DEFAULT_PRESCREEN_FLOOR
+        self.floor = floor
+
+    @property
+    def enabled(self) -> bool:
+        """False when the floor is 0 or the JD has no keywords to screen on"""
+        return self.floor > 0 and self.matcher.total_weight > 0
+
+    def __call__(self, resume_text: str) -> Optional[Dict]:
+        """
+        Screen one resume.
+
+        Args:
+            resume_text: Full resume text
+
+        Returns:
+            Evaluation dictionary if the resume is screened out, else None
+        """
+        if not self.enabled:
+            return None
+
+        score, matched, missing = self.matcher.calculate_match_score(resume_text)
+        if score >= self.floor:
+            return None
+
+        return {
+            'fit_score': 0,
+            'fit_label': SCREENED_OUT_LABEL,
+            'reasoning': (f"Keyword pre-screen: {score}/100 against the JD, below the floor of "
+                          f"{self.floor:g}. Not sent for AI evaluation."),
+            'strengths': matched,
+            'gaps': [f"No mention of {keyword}" for keyword in missing[:MAX_LISTED_GAPS]],
+            'keyword_score': score
+        }
+
+    def keyword_evaluation(self, resume_text: str) -> Dict:
+        """
+        Keyword-only evaluation, used in place of the AI evaluation when the
+        LLM fails or its circuit breaker is open.
+
+        Args:
+            resume_text: Full resume text
+
+        Returns:
+            Evaluation dictionary (fit_score 0-5 from the 0-100 keyword score)
+        """
+        score, matched, missing = self.matcher.calculate_match_score(resume_text)
+        return {
+            'fit_score': round(score / 20),
+            'fit_label': self.matcher.get_fit_label(score) + KEYWORD_ONLY_SUFFIX,
+            'reasoning': (f"AI evaluation unavailable - keyword match {score}/100 against the JD. "
+                          f"Re-run the evaluation for an AI assessment."),
+            'strengths': matched,
+            'gaps': [f"No mention of {keyword}" for keyword in missing[:MAX_LISTED_GAPS]],
+            'keyword_score': score
+        }
+
+
+# Example usage (for testing): python -m src.prescreen
+if __name__ == "__main__":
+    import tempfile
+    from src.jd_matcher import JDMatcher
+
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+        f.write("Senior Python Developer\nRequirements:\n- Python, Django, PostgreSQL, Docker, AWS\n")
+
+    prescreen = KeywordPrescreen(JDMatcher(f.name), floor=20)
+    for text in ("Python and Django developer with PostgreSQL and Docker on AWS",
+                 "Pastry chef with ten years of bakery experience"):
+        outcome = prescreen(text)
+        print(f"{text[:40]!r}: {'sent to LLM' if outcome is None else outcome['reasoning']}")
+    print(f"Fallback: {prescreen.keyword_evaluation('Python and Django developer')['fit_label']}")
+    os.unlink(f.name)
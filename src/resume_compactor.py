@@ -0,0 +1,269 @@
+"""
+Resume Compactor Module
+Shrinks resume text before it goes into an LLM prompt: normalizes whitespace,
+drops page numbers, repeated page headers/footers and duplicate paragraphs, then
+fits the result into a token budget by keeping the sections the evaluator
+needs (contact details, summary, skills, experience) ahead of the rest.
+"""
+
+import os
+import re
+from collections import Counter
+from typing import Dict, List, Set, Tuple
+
+from src.llm_client import estimate_tokens
+
+# Try to import tiktoken for exact token counts (optional)
+TIKTOKEN_AVAILABLE = False
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    pass
+
+TIKTOKEN_ENCODING = 'cl100k_base'
+# Loaded on first use: tiktoken downloads the encoding file the first time
+_encoding = None
+_encoding_failed = False
+
+DEFAULT_TOKEN_BUDGET = 3000
+
+# Lines this short that repeat this often at page edges are page headers/footers
+BOILERPLATE_MAX_CHARS = 80
+BOILERPLATE_MIN_REPEATS = 3
+# Lines at the top and bottom of each page that may be a header/footer
+PAGE_EDGE_LINES = 2
+
+PAGE_NUMBER_PATTERN = re.compile(r'^(?:page\s*)?-?\s*\d{1,3}\s*(?:(?:of|/)\s*\d{1,3})?\s*-?$', re.IGNORECASE)
+
+# Section header keywords, most important first; unknown sections rank after these
+SECTION_PRIORITIES = (
+    ('summary', ('summary', 'profile', 'objective', 'about me')),
+    ('skills', ('skill', 'technologies', 'tech stack', 'competenc', 'expertise', 'tools')),
+    ('experience', ('experience', 'employment', 'work history', 'career')),
+    ('projects', ('project',)),
+    ('education', ('education', 'academic', 'qualification')),
+    ('certifications', ('certification', 'certificate', 'course', 'training', 'award', 'achievement')),
+)
+LOW_PRIORITY_SECTIONS = ('hobbies', 'hobby', 'interests', 'references', 'declaration', 'personal details',
+                         'personal information', 'languages known', 'extra-curricular', 'extracurricular')
+
+
+def get_encoding():
+    """
+    The tiktoken encoding, loaded on first call. Returns None when tiktoken
+    isn't installed or the encoding can't be loaded (e.g. offline).
+    """
+    global _encoding, _encoding_failed
+    if _encoding is None and TIKTOKEN_AVAILABLE and not _encoding_failed:
+        try:
+            _encoding = tiktoken.get_encoding(TIKTOKEN_ENCODING)
+        except Exception as e:
+            _encoding_failed = True
+            print(f"[WARN] Could not load tiktoken encoding ({e}) - estimating token counts")
+    return _encoding
+
+
+def count_tokens(text: str) -> int:
+    """Token count (tiktoken if available, otherwise a character estimate)"""
+    encoding = get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return estimate_tokens(text)
+
+
+class ResumeCompactor:
+    """
+    Compacts resume text to a token budget for LLM evaluation.
+    """
+
+    def __init__(self, token_budget: int = None):
+        """
+        Initialize the compactor.
+
+        Args:
+            token_budget: Maximum resume tokens per prompt
+                          (defaults to RESUME_TOKEN_BUDGET, then 3000; 0 = clean up only)
+        """
+        if token_budget is None:
+            try:
+                token_budget = int(os.getenv('RESUME_TOKEN_BUDGET', DEFAULT_TOKEN_BUDGET))
+            except ValueError:
+                print(f"[WARN] Invalid RESUME_TOKEN_BUDGET - using {DEFAULT_TOKEN_BUDGET}")
+                token_budget = DEFAULT_TOKEN_BUDGET
+        self.token_budget = token_budget
+
+    @staticmethod
+    def normalize_lines(text: str) -> List[str]:
+        """Collapse runs of spaces, strip lines and squeeze blank lines to one"""
+        lines = []
+        for raw_line in text.replace('\r', '\n').split('\n'):
+            line = re.sub(r'[ \t\f\v ]+', ' ', raw_line).strip()
+            if line or (lines and lines[-1]):
+                lines.append(line)
+        while lines and not lines[-1]:
+            lines.pop()
+        return lines
+
+    @staticmethod
+    def page_edge_lines(lines: List[str]) -> Set[int]:
+        """
+        Indices of the first and last PAGE_EDGE_LINES non-blank lines of each
+        page, where pages are split at page-number lines (text without page
+        numbers is one page).
+        """
+        pages = [[]]
+        for index, line in enumerate(lines):
+            if line and PAGE_NUMBER_PATTERN.match(line):
+                pages.append([])
+            elif line:
+                pages[-1].append(index)
+        return {index for page in pages for index in page[:PAGE_EDGE_LINES] + page[-PAGE_EDGE_LINES:]}
+
+    def remove_boilerplate(self, lines: List[str]) -> List[str]:
+        """
+        Drop page numbers, page headers/footers (short lines repeated at page
+        edges, after their first occurrence) and repeated paragraphs. Short
+        lines inside a page, such as job titles or "Responsibilities:", are
+        always kept.
+
+        Args:
+            lines: Normalized lines
+
+        Returns:
+            Remaining lines
+        """
+        edges = {index for index in self.page_edge_lines(lines)
+                 if len(lines[index]) <= BOILERPLATE_MAX_CHARS and not self.is_section_header(lines[index])}
+        counts = Counter(lines[index].lower() for index in edges)
+        repeated = {line for line, count in counts.items() if count >= BOILERPLATE_MIN_REPEATS}
+
+        kept = []
+        seen_repeated = set()
+        seen_paragraphs = set()
+        for index, line in enumerate(lines):
+            key = line.lower()
+            if line and PAGE_NUMBER_PATTERN.match(line):
+                continue
+            if index in edges and key in repeated:
+                if key in seen_repeated:
+                    continue
+                seen_repeated.add(key)
+            elif len(line) > BOILERPLATE_MAX_CHARS:
+                # Long lines repeated verbatim are duplicated paragraphs (e.g. OCR of overlapping pages)
+                if key in seen_paragraphs:
+                    continue
+                seen_paragraphs.add(key)
+            if line or (kept and kept[-1]):
+                kept.append(line)
+        return kept
+
+    @staticmethod
+    def section_priority(header: str) -> int:
+        """Rank of a section header (lower = kept first)"""
+        header = header.lower()
+        if any(keyword in header for keyword in LOW_PRIORITY_SECTIONS):
+            return len(SECTION_PRIORITIES) + 2
+        for rank, (_, keywords) in enumerate(SECTION_PRIORITIES, 1):
+            if any(keyword in header for keyword in keywords):
+                return rank
+        return len(SECTION_PRIORITIES) + 1
+
+    @staticmethod
+    def is_section_header(line: str) -> bool:
+        """Short line that names a resume section (e.g. 'WORK EXPERIENCE', 'Skills:')"""
+        stripped = line.rstrip(':').strip()
+        if not stripped or len(stripped) > 40 or len(stripped.split()) > 4 or stripped[-1] in '.,;':
+            return False
+        lowered = stripped.lower()
+        keywords = [keyword for _, group in SECTION_PRIORITIES for keyword in group] + list(LOW_PRIORITY_SECTIONS)
+        return any(keyword in lowered for keyword in keywords) and (stripped.isupper() or stripped.istitle()
+                                                                   or line.endswith(':'))
+
+    def split_sections(self, lines: List[str]) -> List[Tuple[int, List[str]]]:
+        """
+        Split lines into (priority, lines) sections. Everything before the first
+        header (name and contact details) gets top priority.
+        """
+        sections = [(0, [])]
+        for line in lines:
+            if self.is_section_header(line):
+                sections.append((self.section_priority(line), [line]))
+            else:
+                sections[-1][1].append(line)
+        return [(priority, section) for priority, section in sections if any(section)]
+
+    def fit_to_budget(self, sections: List[Tuple[int, List[str]]]) -> List[str]:
+        """
+        Keep sections in priority order until the budget runs out; the section
+        that doesn't fit is cut line by line. Output keeps the original order.
+        """
+        remaining = self.token_budget
+        kept = {}
+        for index in sorted(range(len(sections)), key=lambda i: sections[i][0]):
+            if remaining <= 0:
+                break
+            section_lines = sections[index][1]
+            section_tokens = count_tokens('\n'.join(section_lines))
+            if section_tokens <= remaining:
+                kept[index] = section_lines
+                remaining -= section_tokens
+                continue
+            partial = []
+            for line in section_lines:
+                line_tokens = count_tokens(line) + 1
+                if line_tokens > remaining:
+                    break
+                partial.append(line)
+                remaining -= line_tokens
+            # A section header with nothing under it isn't worth keeping
+            has_header = self.is_section_header(section_lines[0])
+            if any(partial[1:] if has_header else partial):
+                kept[index] = partial
+            break
+
+        lines = [line for index in sorted(kept) for line in kept[index]]
+        while lines and not lines[-1]:
+            lines.pop()
+        return lines
+
+    def compact(self, text: str) -> Tuple[str, Dict]:
+        """
+        Compact resume text for an LLM prompt.
+
+        Args:
+            text: Full resume text
+
+        Returns:
+            Tuple of (compacted text, stats with original_tokens, compacted_tokens and ratio)
+        """
+        original_tokens = count_tokens(text or '')
+        lines = self.remove_boilerplate(self.normalize_lines(text or ''))
+        compacted = '\n'.join(lines)
+        if self.token_budget and count_tokens(compacted) > self.token_budget:
+            compacted = '\n'.join(self.fit_to_budget(self.split_sections(lines)))
+
+        compacted_tokens = count_tokens(compacted)
+        return compacted, {
+            'original_tokens': original_tokens,
+            'compacted_tokens': compacted_tokens,
+            'ratio': compacted_tokens / original_tokens if original_tokens else 1.0
+        }
+
+
+# Example usage (for testing): python -m src.resume_compactor
+if __name__ == "__main__":
+    page = ("Jane Doe   |   jane@example.com   |   +91 98765 43210\n\n\n"
+            "SUMMARY\nBackend engineer with 8 years of Python.\n\n"
+            "SKILLS\nPython, Django, PostgreSQL, Docker, AWS\n\n"
+            "EXPERIENCE\n" + "Built and scaled payment APIs serving millions of requests per day.\n" * 3 +
+            "\nHOBBIES\nChess, trekking, photography\n\n"
+            "Confidential - Jane Doe Resume\nPage {n} of 4\n")
+    resume_text = "\n".join(page.format(n=n) for n in range(1, 5))
+
+    for budget in (0, 60):
+        text, stats = ResumeCompactor(token_budget=budget).compact(resume_text)
+        print(f"Budget {budget or 'none'}: {stats['original_tokens']} -> {stats['compacted_tokens']} tokens "
+              f"({stats['ratio']:.0%}), tokenizer: {'tiktoken' if get_encoding() else 'estimate'}")
+        print(text)
+        print('-' * 40)
@@ -0,0 +1,260 @@
+"""
+Resume Index Module
+Persistent inverted index (skill -> candidate IDs) over parsed resumes,
+so a new JD can be matched against the whole corpus without re-parsing files.
+"""
+
+import hashlib
+import heapq
+import json
+import os
+import re
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from src.file_lock import FileLock
+from src.skill_bitset import DEFAULT_BITSET_FILE, NUMPY_AVAILABLE, SkillBitsetIndex
+from src.skill_taxonomy import get_skill_taxonomy
+
+DEFAULT_INDEX_FILE = os.path.join('data', 'resume_index.json')
+
+
+class ResumeIndex:
+    """
+    Inverted index from canonical skill to the candidates whose resume mentions it.
+    Stores each candidate's contact details and skills (never the resume text),
+    so searching is posting-list counting only.
+    """
+
+    def __init__(self, index_file: str = DEFAULT_INDEX_FILE, bitset_file: str = DEFAULT_BITSET_FILE):
+        """
+        Load the index from disk (an empty index if the file doesn't exist yet).
+
+        Args:
+            index_file: Path to the index JSON file
+            bitset_file: Path to the packed skill bitsets (written when numpy is available)
+        """
+        self.index_file = index_file
+        self.bitset_file = bitset_file
+        self.taxonomy = get_skill_taxonomy()
+        self.candidates = {}  # candidate_id -> {candidate_name, email, ..., skills}
+        self.postings = {}    # skill -> set of candidate_ids
+        # Changes made since loading, replayed onto the file's current contents at save time
+        self._added = {}
+        self._removed = set()
+        self._load()
+
+    def _read(self) -> Dict:
+        """Read the candidates stored in the index file"""
+        if not os.path.exists(self.index_file):
+            return {}
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"[ERROR] Failed to load resume index: {e}")
+            return {}
+
+        if data.get('taxonomy_hash') != self.taxonomy.content_hash:
+            print("[WARN] Resume index was built with a different skill taxonomy - re-ingest resumes to refresh it")
+        return data.get('candidates', {})
+
+    def _set_candidates(self, candidates: Dict):
+        """Replace the candidates and rebuild the posting lists from their skills"""
+        self.candidates = candidates
+        self.postings = {}
+        for candidate_id, candidate in candidates.items():
+            for skill in candidate['skills']:
+                self.postings.setdefault(skill, set()).add(candidate_id)
+
+    def _load(self):
+        """Load candidates and posting lists from the index file"""
+        self._set_candidates(self._read())
+
+    def save(self) -> bool:
+        """
+        Write the index to disk atomically. Under a file lock, the candidates
+        added or removed since loading are applied to the file's current
+        contents, so candidates saved meanwhile by another job are kept.
+        """
+        try:
+            with FileLock(self.index_file + '.lock'):
+                candidates = self._read()
+                for candidate_id in self._removed:
+                    candidates.pop(candidate_id, None)
+                candidates.update(self._added)
+                self._set_candidates(candidates)
+
+                data = {
+                    'taxonomy_version': self.taxonomy.version,
+                    'taxonomy_hash': self.taxonomy.content_hash,
+                    'candidates': self.candidates,
+                    'postings': {skill: sorted(ids) for skill, ids in self.postings.items()}
+                }
+                temp_path = f"{self.index_file}.{os.getpid()}.tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f)
+                os.replace(temp_path, self.index_file)
+
+                # Keep the packed bitsets in sync for vectorized re-ranking
+                if NUMPY_AVAILABLE:
+                    SkillBitsetIndex.from_resume_index(self).save(self.bitset_file)
+        except Exception as e:
+            print(f"[ERROR] Failed to save resume index: {e}")
+            return False
+
+        self._added = {}
+        self._removed = set()
+        return True
+
+    def load_bitsets(self):
+        """
+        Load the packed skill bitsets for this index, rebuilding them if stale.
+
+        Returns:
+            SkillBitsetIndex, or None if numpy is not installed
+        """
+        if not NUMPY_AVAILABLE:
+            return None
+        bitsets = SkillBitsetIndex.load(self.bitset_file)
+        if bitsets is None or bitsets.candidate_ids != list(self.candidates):
+            bitsets = SkillBitsetIndex.from_resume_index(self)
+        return bitsets
+
+    @staticmethod
+    def make_candidate_id(resume_text: str) -> str:
+        """
+        Build a stable candidate ID from the resume content.
+        Re-uploading the same resume maps to the same ID.
+
+        Args:
+            resume_text: Full resume text
+
+        Returns:
+            16-character hex ID
+        """
+        normalized = re.sub(r'\s+', ' ', resume_text).strip().lower()
+        return hashlib.sha1(normalized.encode('utf-8')).hexdigest()[:16]
+
+    def add_candidate(self, candidate_info: Dict, source_file: str = '') -> Optional[str]:
+        """
+        Add (or refresh) a parsed resume in the index.
+
+        Args:
+            candidate_info: Parsed candidate dictionary including resume_text
+            source_file: Optional resume filename
+
+        Returns:
+            Candidate ID, or None if there is no resume text
+        """
+        resume_text = candidate_info.get('resume_text', '')
+        if not resume_text:
+            return None
+
+        candidate_id = self.make_candidate_id(resume_text)
+        if candidate_id in self.candidates:
+            self.remove_candidate(candidate_id)
+
+        skills = self.taxonomy.matcher.find_skills(resume_text)
+        self.candidates[candidate_id] = {
+            'candidate_name': candidate_info.get('candidate_name', ''),
+            'email': candidate_info.get('email') or '',
+            'phone': candidate_info.get('phone') or '',
+            'location': candidate_info.get('location') or '',
+            'source_file': source_file,
+            'skills': skills,
+            'indexed_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+        for skill in skills:
+            self.postings.setdefault(skill, set()).add(candidate_id)
+        self._added[candidate_id] = self.candidates[candidate_id]
+        self._removed.discard(candidate_id)
+
+        return candidate_id
+
+    def remove_candidate(self, candidate_id: str) -> bool:
+        """Remove a candidate and its postings"""
+        candidate = self.candidates.pop(candidate_id, None)
+        if candidate is None:
+            return False
+        self._added.pop(candidate_id, None)
+        self._removed.add(candidate_id)
+        for skill in candidate['skills']:
+            posting = self.postings.get(skill)
+            if posting is not None:
+                posting.discard(candidate_id)
+                if not posting:
+                    del self.postings[skill]
+        return True
+
+    def search(self, query_skills: Iterable[str], top_k: int = 50, bitsets=None) -> List[Dict]:
+        """
+        Rank candidates by how many of the query skills they have.
+        Only the posting lists of the query skills are touched, or, when
+        bitsets are given, every candidate is scored with one vectorized AND.
+
+        Args:
+            query_skills: Canonical skills required by the JD
+            top_k: Number of candidates to return
+            bitsets: Optional SkillBitsetIndex from load_bitsets()
+
+        Returns:
+            List of candidate dictionaries with candidate_id, match_score (0-100)
+            and matched_skills, best first
+        """
+        query_skills = list(dict.fromkeys(query_skills))
+        if not query_skills:
+            return []
+
+        if bitsets is not None:
+            top = bitsets.top_k(query_skills, top_k)
+        else:
+            counts = Counter()
+            for skill in query_skills:
+                counts.update(self.postings.get(skill, ()))
+            # Highest score first, ties broken by candidate ID (as in SkillBitsetIndex.top_k)
+            scores = ((candidate_id, count * 100 // len(query_skills)) for candidate_id, count in counts.items())
+            top = heapq.nsmallest(top_k, (item for item in scores if item[1] > 0),
+                                  key=lambda item: (-item[1], item[0]))
+
+        results = []
+        for candidate_id, score in top:
+            candidate = self.candidates[candidate_id]
+            skill_set = set(candidate['skills'])
+            results.append({
+                'candidate_id': candidate_id,
+                **{key: value for key, value in candidate.items() if key != 'skills'},
+                'match_score': score,
+                'matched_skills': [skill for skill in query_skills if skill in skill_set]
+            })
+        return results
+
+    def search_jd(self, jd_text: str, top_k: int = 50, bitsets=None) -> List[Dict]:
+        """
+        Rank indexed candidates against a job description.
+
+        Args:
+            jd_text: Job description text
+            top_k: Number of candidates to return
+            bitsets: Optional SkillBitsetIndex from load_bitsets()
+
+        Returns:
+            Same as search()
+        """
+        return self.search(self.taxonomy.matcher.find_skills(jd_text), top_k, bitsets)
+
+    def get_candidate_count(self) -> int:
+        """Get number of indexed candidates"""
+        return len(self.candidates)
+
+
+# Example usage (for testing): python -m src.resume_index
+if __name__ == "__main__":
+    index = ResumeIndex()
+    print(f"Indexed candidates: {index.get_candidate_count()}")
+
+    with open('jd_library/senior_python_developer.txt', 'r', encoding='utf-8') as f:
+        jd = f.read()
+    for result in index.search_jd(jd, top_k=10):
+        print(f"{result['match_score']:3d}%  {result['candidate_name']}  ({', '.join(result['matched_skills'])})")
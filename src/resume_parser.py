@@ -13,6 +13,8 @@ import PyPDF2
 import docx
 import phonenumbers
 
+from src.experience_extractor import ExperienceExtractor
+
 # Try to import local OCR libraries (faster if available)
 LOCAL_OCR_AVAILABLE = False
 try:
@@ -35,7 +37,7 @@ CLOUD_OCR_AVAILABLE = True
 class ResumeParser:
     """
     Parses resume files (PDF and DOCX) to extract candidate information.
-    Extracts: name, email, phone, and location (best effort).
+    Extracts: name, email, phone, location (best effort) and years of experience.
     """
 
     def __init__(self):
@@ -59,6 +61,9 @@ class ResumeParser:
             'Remote', 'Willing to relocate'
         ]
 
+        # Deterministic years-of-experience from employment date ranges
+        self.experience_extractor = ExperienceExtractor()
+
     def extract_text_from_pdf(self, file_path: str) -> str:
         """
         Extract text content from a PDF file.
@@ -383,6 +388,10 @@ class ResumeParser:
             'resume_text': text  # Store full text for JD matching
         }
 
+        experience = self.experience_extractor.extract(text)
+        candidate_info['total_years_experience'] = experience['total_years_experience']
+        candidate_info['skill_years'] = experience['skill_years']
+
         return candidate_info
 
     def parse_multiple_resumes(self, folder_path: str) -> list:
@@ -68,6 +68,25 @@ class RoleManager:
                 return role
         return None
 
+    def get_role_for_jd(self, jd_file: str) -> Dict:
+        """
+        Get the stable role for a JD file: the registered role that uses it,
+        or a role derived from the filename (JD_<STEM>) for unregistered files.
+        Every store (leaderboard, score history, score distributions) is keyed
+        on this role_id, so the same JD always maps to the same role.
+        """
+        target = os.path.normpath(jd_file)
+        for role in self.roles:
+            if os.path.normpath(role.get('jd_file', '')) == target:
+                return role
+        stem = os.path.splitext(os.path.basename(jd_file))[0]
+        return {
+            'role_id': f"JD_{stem.upper()}",
+            'role_name': stem.replace('_', ' ').title(),
+            'jd_file': jd_file,
+            'active': True
+        }
+
     def get_role_by_name(self, role_name: str) -> Optional[Dict]:
         """Get role by name"""
         for role in self.roles:
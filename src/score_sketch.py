@@ -0,0 +1,256 @@
+"""
+Score Sketch Module
+Per-role score distributions kept as mergeable KLL quantile sketches, so fit
+labels can be percentile-based without rescanning historical candidates.
+Sketches built by separate processes are merged when saved. Keyword scores
+(0-100) are kept under the role_id; AI Evaluator scores (0-5, stored x20) use
+a separate key (ai_scores_key) because the two scales don't compare.
+"""
+
+import json
+import math
+import os
+import random
+from typing import Dict, Iterable, List, Optional
+
+from src.file_lock import FileLock
+
+DEFAULT_SKETCH_FILE = os.path.join('data', 'score_sketches.json')
+
+# Sketch accuracy parameter: rank error is roughly 1.7 / k (about 1% for k=200)
+DEFAULT_K = 200
+
+# Capacity shrink factor between compactor levels
+_CAPACITY_DECAY = 2 / 3
+
+# Suffix of the keys holding a role's AI Evaluator scores
+AI_SCORES_SUFFIX = ':ai'
+
+
+def ai_scores_key(role_id: str) -> str:
+    """Key for a role's AI Evaluator scores, separate from its keyword scores"""
+    return f"{role_id}{AI_SCORES_SUFFIX}"
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch over a stream of numbers.
+    Level h holds items that each stand for 2^h original values. When a level
+    fills up it is sorted and every other item (random offset) is promoted,
+    so memory stays O(k) however many scores are added.
+    """
+
+    def __init__(self, k: int = DEFAULT_K, seed: int = None):
+        """
+        Create an empty sketch.
+
+        Args:
+            k: Accuracy parameter (larger = more accurate, more memory)
+            seed: Optional seed for the compaction coin flips
+        """
+        self.k = k
+        self.n = 0
+        self.compactors = [[]]
+        self._rng = random.Random(seed)
+
+    def _capacity(self, level: int) -> int:
+        """Maximum number of items level can hold before compacting"""
+        depth = len(self.compactors) - level - 1
+        return max(2, int(math.ceil(self.k * _CAPACITY_DECAY ** depth)))
+
+    def _size(self) -> int:
+        return sum(len(compactor) for compactor in self.compactors)
+
+    def _max_size(self) -> int:
+        return sum(self._capacity(level) for level in range(len(self.compactors)))
+
+    def _compress(self):
+        """Compact full levels until the sketch is back under its size budget"""
+        while self._size() >= self._max_size():
+            for level, compactor in enumerate(self.compactors):
+                if len(compactor) < self._capacity(level):
+                    continue
+                if level + 1 == len(self.compactors):
+                    self.compactors.append([])
+                compactor.sort()
+                # An odd item out stays at this level
+                leftover = [compactor.pop()] if len(compactor) % 2 else []
+                offset = self._rng.randint(0, 1)
+                self.compactors[level + 1].extend(compactor[offset::2])
+                self.compactors[level] = leftover
+                break
+
+    def update(self, value: float):
+        """Add one value"""
+        self.compactors[0].append(float(value))
+        self.n += 1
+        if len(self.compactors[0]) >= self._capacity(0):
+            self._compress()
+
+    def update_many(self, values: Iterable[float]):
+        """Add several values"""
+        for value in values:
+            self.update(value)
+
+    def merge(self, other: 'KLLSketch'):
+        """
+        Merge another sketch into this one (e.g. one built by a parallel worker).
+
+        Args:
+            other: Sketch to merge; it is left unchanged
+        """
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append([])
+        for level, compactor in enumerate(other.compactors):
+            self.compactors[level].extend(compactor)
+        self.n += other.n
+        self._compress()
+
+    def _weighted_items(self) -> List[tuple]:
+        """All retained items as sorted (value, weight) pairs"""
+        return sorted(
+            (value, 1 << level)
+            for level, compactor in enumerate(self.compactors)
+            for value in compactor
+        )
+
+    def rank(self, value: float) -> float:
+        """
+        Estimate the fraction of values <= value.
+
+        Args:
+            value: Score to look up
+
+        Returns:
+            Fraction between 0 and 1 (0 for an empty sketch)
+        """
+        total = 0
+        below = 0
+        for level, compactor in enumerate(self.compactors):
+            weight = 1 << level
+            total += weight * len(compactor)
+            below += weight * sum(1 for item in compactor if item <= value)
+        return below / total if total else 0.0
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate the value at quantile q.
+
+        Args:
+            q: Quantile between 0 and 1 (0.5 = median)
+
+        Returns:
+            Estimated value, or None for an empty sketch
+        """
+        items = self._weighted_items()
+        if not items:
+            return None
+        total = sum(weight for _, weight in items)
+        target = q * total
+        cumulative = 0
+        for value, weight in items:
+            cumulative += weight
+            if cumulative >= target:
+                return value
+        return items[-1][0]
+
+    def to_dict(self) -> Dict:
+        """Serialize for JSON storage"""
+        return {'k': self.k, 'n': self.n, 'compactors': self.compactors}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'KLLSketch':
+        """Rebuild a sketch saved with to_dict()"""
+        sketch = cls(k=data.get('k', DEFAULT_K))
+        sketch.n = data.get('n', 0)
+        sketch.compactors = [list(compactor) for compactor in data.get('compactors', [[]])] or [[]]
+        return sketch
+
+
+class ScoreSketchStore:
+    """
+    One KLLSketch per role, persisted as JSON.
+    Scores recorded in this process are kept as separate delta sketches and
+    merged into whatever is on disk at save time, under a file lock, so
+    concurrent writers (evaluation jobs and ingest_resumes.py) don't overwrite
+    each other's scores.
+    """
+
+    def __init__(self, sketch_file: str = DEFAULT_SKETCH_FILE):
+        """
+        Load the saved sketches.
+
+        Args:
+            sketch_file: Path to the sketch JSON file
+        """
+        self.sketch_file = sketch_file
+        self.sketches = self._read()
+        self._deltas = {}
+
+    def _read(self) -> Dict[str, KLLSketch]:
+        """Read every role's sketch from disk"""
+        if not os.path.exists(self.sketch_file):
+            return {}
+        try:
+            with open(self.sketch_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return {role_id: KLLSketch.from_dict(sketch) for role_id, sketch in data.items()}
+        except Exception as e:
+            print(f"[ERROR] Failed to load score sketches: {e}")
+            return {}
+
+    def get(self, role_id: str) -> Optional[KLLSketch]:
+        """Get a role's score distribution, or None if it has no scores yet"""
+        return self.sketches.get(role_id)
+
+    def record(self, role_id: str, scores: Iterable[float]):
+        """
+        Add scores to a role's distribution (call save() to persist).
+
+        Args:
+            role_id: Role identifier
+            scores: Scores (0-100)
+        """
+        scores = list(scores)
+        self._deltas.setdefault(role_id, KLLSketch()).update_many(scores)
+        self.sketches.setdefault(role_id, KLLSketch()).update_many(scores)
+
+    def save(self) -> bool:
+        """Merge this process's new scores into the file on disk, atomically"""
+        if not self._deltas:
+            return True
+        try:
+            # Locked so two writers can't both read the old file and drop each other's scores
+            with FileLock(self.sketch_file + '.lock'):
+                merged = self._read()
+                for role_id, delta in self._deltas.items():
+                    merged.setdefault(role_id, KLLSketch()).merge(delta)
+
+                temp_path = f"{self.sketch_file}.{os.getpid()}.tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump({role_id: sketch.to_dict() for role_id, sketch in merged.items()}, f)
+                os.replace(temp_path, self.sketch_file)
+
+            self.sketches = merged
+            self._deltas = {}
+            return True
+        except Exception as e:
+            print(f"[ERROR] Failed to save score sketches: {e}")
+            return False
+
+
+# Example usage (for testing): python -m src.score_sketch
+if __name__ == "__main__":
+    rng = random.Random(0)
+    scores = [min(100, max(0, rng.gauss(45, 15))) for _ in range(100000)]
+
+    # Two "workers" each sketch half the scores, then merge
+    worker_a, worker_b = KLLSketch(), KLLSketch()
+    worker_a.update_many(scores[:50000])
+    worker_b.update_many(scores[50000:])
+    worker_a.merge(worker_b)
+
+    exact = sorted(scores)
+    for q in (0.1, 0.5, 0.9):
+        print(f"q={q}: sketch {worker_a.quantile(q):.1f}  exact {exact[int(q * len(exact))]:.1f}")
+    print(f"Retained {sum(len(c) for c in worker_a.compactors)} of {worker_a.n} values")
@@ -0,0 +1,211 @@
+"""
+Score Store Module
+Persists candidate x role scores in a memory-mapped NumPy matrix, so historical
+scores can be read (zero-copy) by the app and scripts without Google Sheets.
+Requires numpy.
+"""
+
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.file_lock import FileLock
+
+# numpy is optional (score history is simply not recorded without it)
+NUMPY_AVAILABLE = False
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    print("[INFO] numpy not installed - score history disabled")
+
+DEFAULT_STORE_DIR = os.path.join('data', 'score_matrix')
+
+
+class ScoreMatrixStore:
+    """
+    float32 matrix on disk: one row per candidate, one column per role.
+    Unscored cells are NaN. The file is allocated with spare capacity that
+    doubles as rows/columns are appended, so appends rarely rewrite it.
+    """
+
+    def __init__(self, store_dir: str = DEFAULT_STORE_DIR, readonly: bool = False):
+        """
+        Open (or create) the score matrix.
+
+        Args:
+            store_dir: Folder holding scores.npy and meta.json
+            readonly: Open the matrix read-only (for the app and reporting scripts)
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("ScoreMatrixStore requires numpy (pip install numpy)")
+
+        self.store_dir = store_dir
+        self.readonly = readonly
+        self.matrix_file = os.path.join(store_dir, 'scores.npy')
+        self.meta_file = os.path.join(store_dir, 'meta.json')
+        self.lock_file = os.path.join(store_dir, '.lock')
+
+        self.candidate_ids = []
+        self.role_ids = []
+        self.candidate_rows = {}
+        self.role_cols = {}
+        self.matrix = None
+        self._load()
+
+    def _load(self):
+        """Load the metadata and memory-map the matrix"""
+        self.candidate_ids, self.role_ids, self.matrix = [], [], None
+        if os.path.exists(self.meta_file) and os.path.exists(self.matrix_file):
+            try:
+                with open(self.meta_file, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                self.candidate_ids = meta.get('candidate_ids', [])
+                self.role_ids = meta.get('role_ids', [])
+                self.matrix = np.load(self.matrix_file, mmap_mode='r' if self.readonly else 'r+')
+            except Exception as e:
+                print(f"[ERROR] Failed to open score matrix: {e}")
+                self.candidate_ids, self.role_ids, self.matrix = [], [], None
+
+        self.candidate_rows = {candidate_id: i for i, candidate_id in enumerate(self.candidate_ids)}
+        self.role_cols = {role_id: j for j, role_id in enumerate(self.role_ids)}
+
+    def _save_meta(self):
+        """Write row/column labels atomically"""
+        temp_path = self.meta_file + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'candidate_ids': self.candidate_ids, 'role_ids': self.role_ids}, f)
+        os.replace(temp_path, self.meta_file)
+
+    def _ensure_capacity(self, rows: int, cols: int):
+        """Grow the backing file (doubling) if it can't hold rows x cols"""
+        if self.readonly:
+            raise PermissionError("Score matrix is open read-only")
+
+        current = self.matrix.shape if self.matrix is not None else (0, 0)
+        if rows <= current[0] and cols <= current[1]:
+            return
+
+        new_shape = (max(rows, current[0] * 2, 64), max(cols, current[1] * 2, 8))
+        os.makedirs(self.store_dir, exist_ok=True)
+        temp_path = self.matrix_file + '.tmp.npy'
+        grown = np.lib.format.open_memmap(temp_path, mode='w+', dtype=np.float32, shape=new_shape)
+        grown[:] = np.nan
+        if self.matrix is not None:
+            grown[:current[0], :current[1]] = self.matrix
+        grown.flush()
+        del grown
+
+        self.matrix = None
+        os.replace(temp_path, self.matrix_file)
+        self.matrix = np.load(self.matrix_file, mmap_mode='r+')
+
+    def _rows_for(self, candidate_ids: Iterable[str]) -> List[int]:
+        """Get row indices, appending unknown candidates"""
+        rows = []
+        for candidate_id in candidate_ids:
+            if candidate_id not in self.candidate_rows:
+                self.candidate_rows[candidate_id] = len(self.candidate_ids)
+                self.candidate_ids.append(candidate_id)
+            rows.append(self.candidate_rows[candidate_id])
+        return rows
+
+    def _cols_for(self, role_ids: Iterable[str]) -> List[int]:
+        """Get column indices, appending unknown roles"""
+        cols = []
+        for role_id in role_ids:
+            if role_id not in self.role_cols:
+                self.role_cols[role_id] = len(self.role_ids)
+                self.role_ids.append(role_id)
+            cols.append(self.role_cols[role_id])
+        return cols
+
+    def set_scores(self, candidate_ids: List[str], role_ids: List[str], scores) -> bool:
+        """
+        Write a block of scores, appending new candidates/roles as needed.
+        Runs under the store's file lock and re-reads the matrix first, so rows
+        and columns appended by another process are kept.
+
+        Args:
+            candidate_ids: Row labels
+            role_ids: Column labels
+            scores: Array-like of shape (len(candidate_ids), len(role_ids))
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with FileLock(self.lock_file):
+                self._load()
+                rows = self._rows_for(candidate_ids)
+                cols = self._cols_for(role_ids)
+                self._ensure_capacity(len(self.candidate_ids), len(self.role_ids))
+                self.matrix[np.ix_(rows, cols)] = np.asarray(scores, dtype=np.float32)
+                self.matrix.flush()
+                self._save_meta()
+            return True
+        except Exception as e:
+            print(f"[ERROR] Failed to save scores: {e}")
+            return False
+
+    def set_score(self, candidate_id: str, role_id: str, score: float) -> bool:
+        """Write a single score"""
+        return self.set_scores([candidate_id], [role_id], [[score]])
+
+    @property
+    def scores(self):
+        """Zero-copy view of the used part of the matrix (candidates x roles)"""
+        if self.matrix is None:
+            return np.empty((0, 0), dtype=np.float32)
+        return self.matrix[:len(self.candidate_ids), :len(self.role_ids)]
+
+    def get_score(self, candidate_id: str, role_id: str) -> Optional[float]:
+        """Get one score, or None if it was never computed"""
+        row = self.candidate_rows.get(candidate_id)
+        col = self.role_cols.get(role_id)
+        if row is None or col is None:
+            return None
+        value = self.matrix[row, col]
+        return None if np.isnan(value) else float(value)
+
+    def get_candidate_scores(self, candidate_id: str) -> Dict[str, float]:
+        """Get every recorded score of a candidate, keyed by role_id"""
+        row = self.candidate_rows.get(candidate_id)
+        if row is None:
+            return {}
+        values = self.scores[row]
+        return {role_id: float(v) for role_id, v in zip(self.role_ids, values) if not np.isnan(v)}
+
+    def leaderboard(self, role_id: str, top_k: int = 20, min_score: float = None) -> List[Tuple[str, float]]:
+        """
+        Get the best-scoring candidates for a role.
+
+        Args:
+            role_id: Role to rank
+            top_k: Number of candidates to return
+            min_score: Optional minimum score filter
+
+        Returns:
+            List of (candidate_id, score), best first
+        """
+        col = self.role_cols.get(role_id)
+        if col is None or not self.candidate_ids:
+            return []
+
+        column = np.nan_to_num(self.scores[:, col], nan=-np.inf)
+        if min_score is not None:
+            column = np.where(column >= min_score, column, -np.inf)
+        k = min(top_k, len(column))
+        top = np.argpartition(-column, k - 1)[:k]
+        top = top[np.lexsort((top, -column[top]))]
+        return [(self.candidate_ids[i], float(column[i])) for i in top if np.isfinite(column[i])]
+
+
+# Example usage (for testing): python -m src.score_store
+if __name__ == "__main__":
+    store = ScoreMatrixStore(readonly=True)
+    print(f"Score matrix: {len(store.candidate_ids)} candidates x {len(store.role_ids)} roles")
+    for role in store.role_ids:
+        print(f"\nTop 5 for {role}:")
+        for candidate_id, score in store.leaderboard(role, top_k=5):
+            print(f"  {candidate_id}  {score:.0f}")
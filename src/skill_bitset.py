@@ -0,0 +1,203 @@
+"""
+Skill Bitset Module
+Packs each candidate's skills into a fixed-width bitset over the taxonomy,
+so scoring a JD against every candidate is a vectorized AND + popcount.
+Requires numpy.
+"""
+
+import os
+from typing import Iterable, List, Tuple
+
+from src.skill_taxonomy import get_skill_taxonomy
+
+# numpy is optional (posting-list search works without it)
+NUMPY_AVAILABLE = False
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    print("[INFO] numpy not installed - bitset scoring disabled")
+
+DEFAULT_BITSET_FILE = os.path.join('data', 'skill_bitsets.npz')
+
+
+def _popcount_rows(words):
+    """Count set bits per row of a uint64 array"""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words).sum(axis=1, dtype=np.int64)
+    # numpy < 2.0: count bits byte by byte with a lookup table
+    table = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+    return table[words.view(np.uint8)].sum(axis=1, dtype=np.int64)
+
+
+class SkillBitsetIndex:
+    """
+    Candidates x taxonomy bit matrix stored as packed uint64 words.
+    Bit i of a row is set when the candidate has taxonomy skill i.
+    """
+
+    def __init__(self):
+        """Create an empty bitset index over the current taxonomy."""
+        if not NUMPY_AVAILABLE:
+            raise ImportError("SkillBitsetIndex requires numpy (pip install numpy)")
+
+        self.taxonomy = get_skill_taxonomy()
+        self.skill_bits = {skill: i for i, skill in enumerate(self.taxonomy.skills)}
+        self.n_words = max(1, (len(self.skill_bits) + 63) // 64)
+        self.candidate_ids = []
+        self.bits = np.zeros((0, self.n_words), dtype=np.uint64)
+
+    def encode(self, skills: Iterable[str]):
+        """
+        Encode a skill list as a packed bitset.
+
+        Args:
+            skills: Canonical skill names (unknown skills are ignored)
+
+        Returns:
+            uint64 array of length n_words
+        """
+        flags = np.zeros(self.n_words * 64, dtype=bool)
+        for skill in skills:
+            bit = self.skill_bits.get(skill)
+            if bit is not None:
+                flags[bit] = True
+        return np.packbits(flags, bitorder='little').view('<u8').astype(np.uint64)
+
+    def add_candidates(self, candidates: Iterable[Tuple[str, Iterable[str]]]):
+        """
+        Append candidates to the bit matrix.
+
+        Args:
+            candidates: Iterable of (candidate_id, skills)
+        """
+        new_ids = []
+        new_rows = []
+        for candidate_id, skills in candidates:
+            new_ids.append(candidate_id)
+            new_rows.append(self.encode(skills))
+        if new_rows:
+            self.candidate_ids.extend(new_ids)
+            self.bits = np.vstack([self.bits, np.vstack(new_rows)])
+
+    def score(self, jd_skills: Iterable[str]):
+        """
+        Score every candidate against a JD.
+
+        Args:
+            jd_skills: Canonical skills required by the JD
+
+        Returns:
+            int array of scores (0-100), one per candidate
+        """
+        jd_bits = self.encode(jd_skills)
+        required = int(_popcount_rows(jd_bits[np.newaxis, :])[0])
+        if required == 0 or not self.candidate_ids:
+            return np.zeros(len(self.candidate_ids), dtype=np.int64)
+        matched = _popcount_rows(self.bits & jd_bits)
+        return matched * 100 // required
+
+    def top_k(self, jd_skills: Iterable[str], k: int = 50) -> List[Tuple[str, int]]:
+        """
+        Get the best-scoring candidates for a JD. Same results as the
+        ResumeIndex posting-list search: only candidates with a score above 0,
+        highest score first, ties broken by candidate ID.
+
+        Args:
+            jd_skills: Canonical skills required by the JD
+            k: Number of candidates to return
+
+        Returns:
+            List of (candidate_id, score), best first
+        """
+        scores = self.score(jd_skills)
+        hits = np.flatnonzero(scores > 0)
+        if len(hits) == 0 or k <= 0:
+            return []
+        if len(hits) > k:
+            # Keep everything tied with the k-th best score so the ID tie-break is exact
+            threshold = np.partition(scores[hits], len(hits) - k)[len(hits) - k]
+            hits = hits[scores[hits] >= threshold]
+        ids = np.array(self.candidate_ids, dtype=str)[hits]
+        top = hits[np.lexsort((ids, -scores[hits]))][:k]
+        return [(self.candidate_ids[i], int(scores[i])) for i in top]
+
+    def save(self, bitset_file: str = DEFAULT_BITSET_FILE) -> bool:
+        """Write the bit matrix and candidate IDs to disk"""
+        try:
+            os.makedirs(os.path.dirname(bitset_file) or '.', exist_ok=True)
+            temp_path = bitset_file + '.tmp.npz'
+            np.savez(
+                temp_path,
+                bits=self.bits,
+                candidate_ids=np.array(self.candidate_ids, dtype=str),
+                taxonomy_hash=np.array(self.taxonomy.content_hash)
+            )
+            os.replace(temp_path, bitset_file)
+            return True
+        except Exception as e:
+            print(f"[ERROR] Failed to save skill bitsets: {e}")
+            return False
+
+    @classmethod
+    def load(cls, bitset_file: str = DEFAULT_BITSET_FILE):
+        """
+        Load a saved bit matrix.
+
+        Args:
+            bitset_file: Path written by save()
+
+        Returns:
+            SkillBitsetIndex, or None if the file is missing or was built
+            with a different taxonomy
+        """
+        if not os.path.exists(bitset_file):
+            return None
+        index = cls()
+        try:
+            with np.load(bitset_file) as data:
+                if str(data['taxonomy_hash']) != index.taxonomy.content_hash:
+                    print("[WARN] Skill bitsets were built with a different taxonomy - ignoring them")
+                    return None
+                index.bits = data['bits']
+                index.candidate_ids = data['candidate_ids'].tolist()
+        except Exception as e:
+            print(f"[ERROR] Failed to load skill bitsets: {e}")
+            return None
+        return index
+
+    @classmethod
+    def from_resume_index(cls, resume_index):
+        """
+        Build the bit matrix from a ResumeIndex.
+
+        Args:
+            resume_index: ResumeIndex instance
+
+        Returns:
+            SkillBitsetIndex with one row per indexed candidate
+        """
+        index = cls()
+        index.add_candidates(
+            (candidate_id, candidate['skills'])
+            for candidate_id, candidate in resume_index.candidates.items()
+        )
+        return index
+
+
+# Example usage (for testing): python -m src.skill_bitset
+if __name__ == "__main__":
+    import random
+    import time
+
+    bitset_index = SkillBitsetIndex()
+    skills = list(bitset_index.skill_bits)
+    rng = random.Random(0)
+    count = 100000
+    bitset_index.add_candidates((f"cand{i}", rng.sample(skills, 15)) for i in range(count))
+
+    jd = ['python', 'django', 'postgresql', 'aws', 'docker', 'rest']
+    start = time.perf_counter()
+    best = bitset_index.top_k(jd, k=10)
+    print(f"Scored {count} candidates in {(time.perf_counter() - start) * 1000:.1f} ms")
+    print(best[:5])
@@ -0,0 +1,336 @@
+"""
+Skill Matcher Module
+Finds skills and multi-word phrases in text with a single linear pass,
+with a trigram-indexed fuzzy fallback for misspelled or split skill names.
+"""
+
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+
+# Tokens keep the characters that matter for tech skills: "c++", "c#",
+# "node.js" and "asp.net" stay whole, while spaces, slashes, hyphens and
+# other punctuation act as separators ("ci/cd" -> "ci", "cd").
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+(?:\.[a-z0-9]+)*[+#]*')
+
+# Marker key for "a phrase ends at this trie node"
+_TERMINAL = '$'
+
+# Default fuzzy threshold: allowed edits per character of the token (0 = off, so
+# keyword scores only change when fuzzy matching is switched on; 0.15 is a good value)
+DEFAULT_FUZZY_THRESHOLD = 0.0
+
+# Skill names shorter than this must match exactly: ordinary English words one
+# edit away from a short skill ("nesting" -> testing) are far more common than typos of it
+FUZZY_MIN_LENGTH = 8
+
+# Upper bound on memoized fuzzy lookups (cleared when full)
+_FUZZY_CACHE_SIZE = 50000
+
+
+def _trigrams(word: str) -> set:
+    """Distinct character trigrams of a word padded with boundary markers"""
+    padded = f"^{word}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def bounded_levenshtein(a: str, b: str, max_distance: int) -> int:
+    """
+    Levenshtein distance that gives up once it exceeds max_distance.
+
+    Args:
+        a: First string
+        b: Second string
+        max_distance: Largest distance of interest
+
+    Returns:
+        Edit distance, or max_distance + 1 if it is larger than max_distance
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        for j, char_b in enumerate(b, 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b))
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    return min(previous[-1], max_distance + 1)
+
+
+class SkillMatch(NamedTuple):
+    """A single skill occurrence found in text."""
+    skill: str
+    start: int
+    end: int
+
+
+def tokenize(text: str) -> List[Tuple[str, int, int]]:
+    """
+    Split text into normalized (lowercase) tokens with character offsets.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of (token, start, end) tuples
+    """
+    return [(m.group(0), m.start(), m.end()) for m in TOKEN_PATTERN.finditer(text.lower())]
+
+
+class SkillMatcher:
+    """
+    Compiled skill matcher backed by a token trie.
+    The text is tokenized once and every skill or phrase is found in one pass,
+    so the cost depends on the text length and the longest phrase, not on the
+    number of skills in the list.
+    """
+
+    def __init__(self, skills: Iterable[str], aliases: Dict[str, str] = None,
+                 fuzzy_threshold: float = DEFAULT_FUZZY_THRESHOLD):
+        """
+        Compile the matcher.
+
+        Args:
+            skills: Canonical skill names
+            aliases: Optional mapping of alias -> canonical skill name
+            fuzzy_threshold: Allowed edits per character for fuzzy matches of
+                             tokens that weren't exact hits (0 disables fuzzy matching)
+        """
+        self.trie = {}
+        self.skills = []
+
+        # Fuzzy index: every phrase with its separators removed ("postgresql",
+        # "machinelearning"), plus trigram -> form IDs for candidate lookup
+        self.fuzzy_forms = []    # (form, canonical, token_count)
+        self.joined_forms = {}   # form -> canonical
+        self.trigram_index = {}  # trigram -> list of form IDs
+        self.form_prefixes = set()  # first two characters of every form
+        self._fuzzy_cache = {}   # (word, joined) -> canonical or None
+        self.fuzzy_threshold = fuzzy_threshold
+
+        for skill in skills:
+            self.add_phrase(skill, skill)
+            self.skills.append(skill)
+
+        for alias, canonical in (aliases or {}).items():
+            self.add_phrase(alias, canonical)
+
+    def add_phrase(self, phrase: str, canonical: str):
+        """
+        Add a phrase to the trie, reporting it as the canonical skill on match.
+
+        Args:
+            phrase: Surface form to look for (e.g. "k8s")
+            canonical: Skill name reported when the phrase is found
+        """
+        tokens = [token for token, _, _ in tokenize(phrase)]
+        if not tokens:
+            return
+
+        node = self.trie
+        for token in tokens:
+            node = node.setdefault(token, {})
+        node[_TERMINAL] = canonical
+
+        form = ''.join(tokens)
+        if form not in self.joined_forms:
+            self.joined_forms[form] = canonical
+            form_id = len(self.fuzzy_forms)
+            self.fuzzy_forms.append((form, canonical, len(tokens)))
+            self.form_prefixes.add(form[:2])
+            for gram in _trigrams(form):
+                self.trigram_index.setdefault(gram, []).append(form_id)
+        self._fuzzy_cache = {}
+
+    @property
+    def fuzzy_threshold(self) -> float:
+        """Allowed edits per character for fuzzy matches (0 disables fuzzy matching)"""
+        return self._fuzzy_threshold
+
+    @fuzzy_threshold.setter
+    def fuzzy_threshold(self, value: float):
+        self._fuzzy_threshold = value
+        self._fuzzy_cache = {}
+
+    def fuzzy_lookup(self, word: str, joined: bool = False) -> Optional[str]:
+        """
+        Find the skill whose (joined) name is closest to a word, within the
+        fuzzy threshold. Only forms sharing enough trigrams with the word are
+        compared, so the cost doesn't grow with the size of the taxonomy.
+        Skill names shorter than FUZZY_MIN_LENGTH, and names starting with a
+        different letter than the word ("readership" vs leadership), only
+        match exactly.
+
+        Args:
+            word: Normalized token, or adjacent tokens joined together
+            joined: True if word is several tokens joined. A single token only
+                    matches multi-word skills exactly ("machinelearning"), so
+                    "programming" doesn't become "r programming".
+
+        Returns:
+            Canonical skill name, or None
+        """
+        cache_key = (word, joined)
+        if cache_key in self._fuzzy_cache:
+            return self._fuzzy_cache[cache_key]
+
+        max_edits = int(len(word) * self._fuzzy_threshold)
+
+        skill = self.joined_forms.get(word)
+        if skill is None and max_edits > 0 and not word.isdigit():
+            grams = _trigrams(word)
+            shared = {}
+            for gram in grams:
+                for form_id in self.trigram_index.get(gram, ()):
+                    shared[form_id] = shared.get(form_id, 0) + 1
+
+            # Each edit destroys at most 3 trigrams (q-gram count filter)
+            min_shared = len(grams) - 3 * max_edits
+            best_distance = max_edits + 1
+            # Sorted so ties go to the earliest skill in the taxonomy
+            for form_id in sorted(shared):
+                if shared[form_id] < min_shared:
+                    continue
+                form, canonical, token_count = self.fuzzy_forms[form_id]
+                if (token_count > 1 and not joined) or len(form) < FUZZY_MIN_LENGTH or form[0] != word[0]:
+                    continue
+                distance = bounded_levenshtein(word, form, best_distance - 1)
+                if distance < best_distance:
+                    best_distance, skill = distance, canonical
+
+        if len(self._fuzzy_cache) >= _FUZZY_CACHE_SIZE:
+            self._fuzzy_cache = {}
+        self._fuzzy_cache[cache_key] = skill
+        return skill
+
+    def _fuzzy_token_spans(self, tokens: List[str], exact_spans: List[Tuple[str, int, int]]) -> List[Tuple[str, int, int]]:
+        """
+        Fuzzy-match the tokens not covered by an exact match.
+        A token is first tried joined with the next uncovered token
+        ("postgre sql", "tensor flow"), then on its own ("kubernates").
+
+        Args:
+            tokens: Normalized tokens
+            exact_spans: Spans already found by the trie
+
+        Returns:
+            List of (skill, first_token_index, last_token_index)
+        """
+        token_count = len(tokens)
+        covered = bytearray(token_count)
+        for _, i, j in exact_spans:
+            covered[i:j + 1] = b'\x01' * (j - i + 1)
+
+        # Resolve each distinct word once; only positions that can start a
+        # match are visited (a join must share its first two characters with a skill)
+        unique_words = set(tokens)
+        single_hits = {word for word in unique_words if self.fuzzy_lookup(word) is not None}
+        join_starts = {word for word in unique_words if word[:2] in self.form_prefixes}
+        interesting = single_hits | join_starts
+
+        spans = []
+        next_free = 0
+        for i in [i for i, token in enumerate(tokens) if token in interesting]:
+            if i < next_free or covered[i]:
+                continue
+            if tokens[i] in join_starts and i + 1 < token_count and not covered[i + 1]:
+                skill = self.fuzzy_lookup(tokens[i] + tokens[i + 1], joined=True)
+                if skill is not None:
+                    spans.append((skill, i, i + 1))
+                    next_free = i + 2
+                    continue
+            if tokens[i] in single_hits:
+                spans.append((self.fuzzy_lookup(tokens[i]), i, i))
+
+        return spans
+
+    def _match_token_spans(self, tokens: List[str]) -> List[Tuple[str, int, int]]:
+        """
+        Walk the trie from every token position, then fuzzy-match the
+        tokens that weren't part of an exact match.
+
+        Args:
+            tokens: Normalized tokens
+
+        Returns:
+            List of (skill, first_token_index, last_token_index)
+        """
+        spans = []
+        trie = self.trie
+        token_count = len(tokens)
+
+        for i in range(token_count):
+            node = trie.get(tokens[i])
+            j = i
+            while node is not None:
+                if _TERMINAL in node:
+                    spans.append((node[_TERMINAL], i, j))
+                j += 1
+                if j >= token_count:
+                    break
+                node = node.get(tokens[j])
+
+        if self.fuzzy_threshold > 0:
+            fuzzy_spans = self._fuzzy_token_spans(tokens, spans)
+            if fuzzy_spans:
+                spans.extend(fuzzy_spans)
+                spans.sort(key=lambda span: span[1])
+
+        return spans
+
+    def find_matches(self, text: str) -> List[SkillMatch]:
+        """
+        Find every skill occurrence in the text, with character offsets.
+        Overlapping phrases are all reported, so "unit testing" yields both
+        "unit testing" and "testing" (same as a per-keyword word-boundary search).
+
+        Args:
+            text: Text to search
+
+        Returns:
+            List of SkillMatch ordered by start offset
+        """
+        tokens = tokenize(text)
+        spans = self._match_token_spans([token for token, _, _ in tokens])
+        return [SkillMatch(skill, tokens[i][1], tokens[j][2]) for skill, i, j in spans]
+
+    def find_skills(self, text: str) -> List[str]:
+        """
+        Find the unique skills mentioned in the text.
+        Skips offset bookkeeping, so this is the fast path for scoring.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            List of skill names in order of first appearance
+        """
+        tokens = TOKEN_PATTERN.findall(text.lower())
+        return list(dict.fromkeys(skill for skill, _, _ in self._match_token_spans(tokens)))
+
+    def count_skills(self, text: str) -> Tuple[Dict[str, int], int]:
+        """
+        Count how often each skill occurs in the text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Tuple of (skill -> occurrence count, number of tokens in the text)
+        """
+        tokens = TOKEN_PATTERN.findall(text.lower())
+        counts = {}
+        for skill, _, _ in self._match_token_spans(tokens):
+            counts[skill] = counts.get(skill, 0) + 1
+        return counts, len(tokens)
+
+
+# Example usage (for testing)
+if __name__ == "__main__":
+    matcher = SkillMatcher(['python', 'django', 'node.js', 'c++', 'ci/cd', 'jenkins', 'kubernetes', 'rest', 'testing', 'unit testing'])
+    sample = "Built REST APIs in Python/Django, Node.js and C++; CI/CD with Jenkins. Unit testing. Deployed with Jen kins to Kubernates."
+    for match in matcher.find_matches(sample):
+        print(f"{match.skill:20} {sample[match.start:match.end]!r}")
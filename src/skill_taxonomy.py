@@ -0,0 +1,152 @@
+"""
+Skill Taxonomy Module
+Loads the versioned skill taxonomy (canonical skills, aliases, categories, weights)
+and compiles it once per process into a shared SkillMatcher.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+from typing import Dict, List, Optional
+
+from src.skill_matcher import DEFAULT_FUZZY_THRESHOLD, SkillMatcher
+
+DEFAULT_TAXONOMY_FILE = 'skill_taxonomy.json'
+DEFAULT_CACHE_DIR = os.path.join('data', 'cache')
+
+# Bump when the pickled SkillMatcher layout changes, so old caches are ignored
+COMPILED_FORMAT_VERSION = 2
+
+# Process-wide compiled taxonomies, keyed by taxonomy file path
+_taxonomies = {}
+_taxonomies_lock = threading.Lock()
+
+
+class SkillTaxonomy:
+    """
+    Canonical skill list with aliases, categories and weights.
+    The compiled matcher is pickled to disk keyed by the taxonomy file's
+    content hash, so later processes skip the compile step entirely.
+    """
+
+    def __init__(self, taxonomy_file: str = DEFAULT_TAXONOMY_FILE, cache_dir: str = DEFAULT_CACHE_DIR):
+        """
+        Load the taxonomy, using the on-disk compiled cache when it is current.
+
+        Args:
+            taxonomy_file: Path to the taxonomy JSON file
+            cache_dir: Folder for the compiled (pickled) taxonomy
+        """
+        self.taxonomy_file = taxonomy_file
+        self.cache_dir = cache_dir
+        self.version = ''
+        self.content_hash = ''
+        self.skills = {}  # canonical name -> {'category', 'weight', 'aliases'}
+        self.matcher = SkillMatcher([])
+        self._load()
+
+    def _load(self):
+        """Load the compiled cache if it matches the file, otherwise compile and cache"""
+        try:
+            with open(self.taxonomy_file, 'rb') as f:
+                raw = f.read()
+        except Exception as e:
+            print(f"[ERROR] Failed to load skill taxonomy: {e}")
+            return
+
+        self.content_hash = hashlib.sha256(raw).hexdigest()
+        cache_path = os.path.join(self.cache_dir, f"skill_taxonomy_v{COMPILED_FORMAT_VERSION}_{self.content_hash[:16]}.pickle")
+
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'rb') as f:
+                    self.version, self.skills, self.matcher = pickle.load(f)
+                self._apply_fuzzy_threshold()
+                return
+            except Exception as e:
+                print(f"[WARN] Ignoring unreadable taxonomy cache: {e}")
+
+        try:
+            data = json.loads(raw.decode('utf-8'))
+        except Exception as e:
+            print(f"[ERROR] Invalid skill taxonomy file: {e}")
+            return
+
+        self.version = str(data.get('version', ''))
+        aliases = {}
+        for entry in data.get('skills', []):
+            name = entry['name'].lower()
+            self.skills[name] = {
+                'category': entry.get('category', 'Other'),
+                'weight': float(entry.get('weight', 1.0)),
+                'aliases': [alias.lower() for alias in entry.get('aliases', [])]
+            }
+            for alias in self.skills[name]['aliases']:
+                aliases[alias] = name
+
+        self.matcher = SkillMatcher(list(self.skills), aliases)
+        self._apply_fuzzy_threshold()
+        print(f"[OK] Compiled skill taxonomy v{self.version} ({len(self.skills)} skills, {len(aliases)} aliases)")
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = cache_path + '.tmp'
+            with open(temp_path, 'wb') as f:
+                pickle.dump((self.version, self.skills, self.matcher), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        except Exception as e:
+            print(f"[WARN] Could not write taxonomy cache: {e}")
+
+    def _apply_fuzzy_threshold(self):
+        """Set the matcher's fuzzy threshold from SKILL_FUZZY_THRESHOLD (0 disables fuzzy matching)"""
+        try:
+            self.matcher.fuzzy_threshold = float(os.getenv('SKILL_FUZZY_THRESHOLD', DEFAULT_FUZZY_THRESHOLD))
+        except ValueError:
+            print("[WARN] Invalid SKILL_FUZZY_THRESHOLD - using the default")
+            self.matcher.fuzzy_threshold = DEFAULT_FUZZY_THRESHOLD
+
+    def get_weight(self, skill: str) -> float:
+        """Get a skill's weight (1.0 for unknown skills)"""
+        return self.skills.get(skill, {}).get('weight', 1.0)
+
+    def get_category(self, skill: str) -> Optional[str]:
+        """Get a skill's category"""
+        return self.skills.get(skill, {}).get('category')
+
+    def get_skills_by_category(self) -> Dict[str, List[str]]:
+        """Group canonical skills by category"""
+        categories = {}
+        for name, info in self.skills.items():
+            categories.setdefault(info['category'], []).append(name)
+        return categories
+
+
+def get_skill_taxonomy(taxonomy_file: str = DEFAULT_TAXONOMY_FILE) -> SkillTaxonomy:
+    """
+    Get the process-wide taxonomy for a file, compiling it on first use.
+    All JDMatcher instances share the same compiled matcher.
+
+    Args:
+        taxonomy_file: Path to the taxonomy JSON file
+
+    Returns:
+        Shared SkillTaxonomy instance
+    """
+    taxonomy = _taxonomies.get(taxonomy_file)
+    if taxonomy is None:
+        with _taxonomies_lock:
+            taxonomy = _taxonomies.get(taxonomy_file)
+            if taxonomy is None:
+                taxonomy = SkillTaxonomy(taxonomy_file)
+                _taxonomies[taxonomy_file] = taxonomy
+    return taxonomy
+
+
+# Example usage (for testing): python -m src.skill_taxonomy
+if __name__ == "__main__":
+    taxonomy = get_skill_taxonomy()
+    print(f"Taxonomy version: {taxonomy.version}")
+    for category, skills in taxonomy.get_skills_by_category().items():
+        print(f"{category}: {', '.join(skills)}")
@@ -0,0 +1,28 @@
+"""
+Shared pytest setup: tests import the app's modules as src.<module> and run
+offline against the local stub LLM server (src/llm_stub_server.py).
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.llm_stub_server import start_stub_server
+
+
+@pytest.fixture
+def stub_server():
+    """Start a stub server; call it with start_stub_server() keyword arguments"""
+    servers = []
+
+    def start(**options):
+        server, url = start_stub_server(**options)
+        servers.append(server)
+        return url
+
+    yield start
+    for server in servers:
+        server.shutdown()
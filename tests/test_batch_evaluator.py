@@ -0,0 +1,102 @@
+"""
+Tests for BatchResumeEvaluator: splitting batch replies and re-evaluating
+resumes missing from them, against the stub LLM server.
+"""
+
+import json
+
+import pytest
+
+from src.batch_evaluator import BatchResumeEvaluator
+from src.combined_evaluator import SchemaError
+from src.llm_client import LLMClient
+from src.llm_stub_server import stub_parts
+
+RESUMES = [f"Candidate {i}\ncandidate{i}@example.com\nPython, Django" for i in range(4)]
+
+
+def entry(resume_id, text):
+    candidate, evaluation = stub_parts(text)
+    return {'id': resume_id, 'candidate': candidate, 'evaluation': evaluation}
+
+
+class TamperingClient(LLMClient):
+    """Stub-backed client that edits batch replies before they are parsed."""
+
+    def __init__(self, base_url, tamper):
+        super().__init__(api_key='stub', base_url=base_url)
+        self.tamper = tamper
+        self.requests = 0
+
+    def chat(self, messages, **kwargs):
+        self.requests += 1
+        content, usage = super().chat(messages, **kwargs)
+        payload = json.loads(content)
+        if 'results' in payload:
+            payload = self.tamper(payload)
+        return json.dumps(payload), usage
+
+
+def test_split_results_indexes_valid_entries_by_position():
+    payload = {'results': [entry('r2', 'b'), entry('r1', 'a')]}
+    results = BatchResumeEvaluator.split_results(payload, 2)
+    assert sorted(results) == [0, 1]
+    assert results[0] == stub_parts('a')
+
+
+def test_split_results_leaves_out_missing_out_of_range_and_invalid_ids():
+    invalid = entry('r3', 'c')
+    del invalid['evaluation']['fit_score']
+    payload = {'results': [entry('r1', 'a'), entry('r9', 'x'), entry('0', 'y'), entry('resume', 'z'),
+                           invalid, 'not an object']}
+    assert list(BatchResumeEvaluator.split_results(payload, 4)) == [0]
+
+
+def test_split_results_drops_ids_answered_twice():
+    payload = {'results': [entry('r1', 'a'), entry('r1', 'b'), entry('r1', 'c'), entry('r2', 'd')]}
+    assert list(BatchResumeEvaluator.split_results(payload, 2)) == [1]
+
+
+def test_split_results_rejects_reply_without_results_list():
+    with pytest.raises(SchemaError):
+        BatchResumeEvaluator.split_results({'results': 'none'}, 2)
+
+
+def test_full_batch_uses_one_request(stub_server):
+    client = TamperingClient(stub_server(), tamper=lambda payload: payload)
+    evaluator = BatchResumeEvaluator(client=client, batch_size=4)
+
+    outcomes = evaluator.evaluate_batch(RESUMES, "Python JD")
+
+    assert client.requests == 1
+    assert [candidate['email'] for candidate, _ in outcomes] == [f"candidate{i}@example.com" for i in range(4)]
+    assert evaluator.stats['retried'] == 0
+
+
+def test_missing_and_invalid_results_are_retried_one_at_a_time(stub_server):
+    def tamper(payload):
+        results = [result for result in payload['results'] if result['id'] != 'r2']  # r2 missing
+        for result in results:
+            if result['id'] == 'r4':
+                result['evaluation']['fit_score'] = 42  # out of range
+        return {'results': results}
+
+    client = TamperingClient(stub_server(), tamper=tamper)
+    evaluator = BatchResumeEvaluator(client=client, batch_size=4)
+
+    outcomes = evaluator.evaluate_batch(RESUMES, "Python JD")
+
+    assert client.requests == 3  # one batch + two single retries
+    assert evaluator.stats['retried'] == 2
+    assert [candidate['email'] for candidate, _ in outcomes] == [f"candidate{i}@example.com" for i in range(4)]
+    assert all(0 <= evaluation['fit_score'] <= 5 for _, evaluation in outcomes)
+
+
+def test_unparseable_batch_falls_back_to_single_calls(stub_server):
+    client = TamperingClient(stub_server(), tamper=lambda payload: {'results': None})
+    evaluator = BatchResumeEvaluator(client=client, batch_size=4)
+
+    outcomes = evaluator.evaluate_batch(RESUMES[:2], "Python JD")
+
+    assert evaluator.stats['retried'] == 2
+    assert all(evaluation['fit_label'] != 'Evaluation Failed' for _, evaluation in outcomes)
@@ -0,0 +1,96 @@
+"""
+Tests for the concurrent, rate-limited EvaluationEngine against the stub LLM server.
+"""
+
+import threading
+import time
+
+from src.evaluation_engine import EvaluationEngine, TokenBucket
+from src.llm_client import LLMClient
+
+
+class StubEvaluator:
+    """Two-call evaluator that records how many calls are in flight at once."""
+
+    def __init__(self, base_url):
+        self.client = LLMClient(api_key='stub', base_url=base_url)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def _chat(self, prompt):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            return self.client.chat_json([{'role': 'user', 'content': prompt}])
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def extract_candidate_data(self, resume_text, jd_text):
+        return self._chat(f"Extract candidate data.\n{resume_text}\n{jd_text}")
+
+    def evaluate_resume(self, resume_text, jd_text):
+        return self._chat(f"Evaluate fit.\n{resume_text}\n{jd_text}")
+
+
+def make_resumes(count):
+    return [f"Resume {i}: candidate{i}@example.com, Python, Django" for i in range(count)]
+
+
+def test_results_come_back_in_input_order(stub_server):
+    url = stub_server(latency=0.05)
+    engine = EvaluationEngine(StubEvaluator(url), max_workers=4, requests_per_minute=0, tokens_per_minute=0)
+    completed = []
+
+    results = engine.evaluate_resumes(make_resumes(10), "Python JD",
+                                      on_result=lambda index, result, done, total: completed.append(index))
+
+    assert [candidate['email'] for candidate, _ in results] == [f"candidate{i}@example.com" for i in range(10)]
+    assert all('fit_score' in evaluation for _, evaluation in results)
+    assert sorted(completed) == list(range(10))
+    assert engine.stats['llm_calls'] == 20
+
+
+def test_calls_run_concurrently_up_to_max_workers(stub_server):
+    url = stub_server(latency=0.2)
+    evaluator = StubEvaluator(url)
+    engine = EvaluationEngine(evaluator, max_workers=4, requests_per_minute=0, tokens_per_minute=0)
+
+    start = time.perf_counter()
+    engine.evaluate_resumes(make_resumes(8), "Python JD")
+    elapsed = time.perf_counter() - start
+
+    # 16 calls of 0.2s would take 3.2s one at a time
+    assert 1 < evaluator.peak <= 4
+    assert elapsed < 2.0
+
+
+def test_token_bucket_waits_once_burst_is_spent():
+    bucket = TokenBucket(rate_per_minute=600, capacity=1)  # 10 per second, no burst
+
+    assert bucket.acquire() == 0.0
+    start = time.perf_counter()
+    waited = bucket.acquire()
+
+    assert waited > 0.05
+    assert time.perf_counter() - start >= 0.05
+
+
+def test_unlimited_bucket_never_waits():
+    bucket = TokenBucket(rate_per_minute=0)
+    assert all(bucket.acquire(1000) == 0.0 for _ in range(100))
+
+
+def test_engine_request_rate_limit_is_applied(stub_server):
+    url = stub_server()
+    engine = EvaluationEngine(StubEvaluator(url), max_workers=4, requests_per_minute=0, tokens_per_minute=0)
+    engine.request_bucket = TokenBucket(rate_per_minute=1200, capacity=1)  # 20 requests per second
+
+    start = time.perf_counter()
+    engine.evaluate_resumes(make_resumes(5), "Python JD")
+
+    # 10 calls: the first is free, the other 9 wait 50ms each
+    assert time.perf_counter() - start >= 0.4
+    assert engine.stats['rate_limit_wait'] > 0
@@ -0,0 +1,82 @@
+"""
+Tests for JobQueue claims (a worker whose job was requeued as stale can't
+store results, report progress or finish it) and job upload folder cleanup.
+"""
+
+import os
+
+from src.job_queue import DONE, QUEUED, RUNNING, JobQueue
+
+
+def test_requeued_job_ignores_its_stale_worker(tmp_path):
+    queue = JobQueue(str(tmp_path / 'jobs.db'))
+    job_id = queue.submit('demo', {'files': ['a.pdf']})
+    stale = queue.claim('worker-1')
+
+    assert queue.requeue_stale(max_age_seconds=-1) == 1
+    assert queue.get_job(job_id)['status'] == QUEUED
+    assert not queue.update_progress(job_id, 1, 1, claim_token=stale['claim_token'])
+
+    current = queue.claim('worker-2')
+    assert current['job_id'] == job_id
+    assert queue.add_result(job_id, 0, {'by': 'worker-2'}, claim_token=current['claim_token'])
+    assert not queue.add_result(job_id, 0, {'by': 'worker-1'}, claim_token=stale['claim_token'])
+    assert queue.get_results(job_id) == [{'by': 'worker-2'}]
+    assert not queue.complete(job_id, {'by': 'worker-1'}, claim_token=stale['claim_token'])
+    assert not queue.fail(job_id, "worker-1 gave up", claim_token=stale['claim_token'])
+    assert queue.get_job(job_id)['status'] == RUNNING
+
+    assert queue.complete(job_id, {'by': 'worker-2'}, claim_token=current['claim_token'])
+    job = queue.get_job(job_id)
+    assert job['status'] == DONE and job['summary'] == {'by': 'worker-2'}
+
+
+def test_submit_uses_a_pre_made_job_id(tmp_path):
+    queue = JobQueue(str(tmp_path / 'jobs.db'))
+    job_id = JobQueue.new_job_id()
+
+    assert queue.submit('demo', {}, job_id=job_id) == job_id
+    assert queue.claim('worker-1', job_id=job_id)['job_id'] == job_id
+
+
+def test_job_upload_folders_are_removed_on_failure_and_pruned_when_old(tmp_path, monkeypatch):
+    from src.evaluation_jobs import job_uploads_folder, process_job, prune_job_uploads
+
+    monkeypatch.chdir(tmp_path)
+    queue = JobQueue(str(tmp_path / 'jobs.db'))
+
+    def submit_with_upload():
+        job_id = JobQueue.new_job_id()
+        os.makedirs(job_uploads_folder(job_id))
+        queue.submit('unknown', {'resumes_folder': job_uploads_folder(job_id)}, job_id=job_id)
+        return job_id
+
+    failed_id = submit_with_upload()
+    assert not process_job(queue, queue.claim('worker-1'))
+    assert not os.path.exists(job_uploads_folder(failed_id))
+
+    done_id, running_id = submit_with_upload(), submit_with_upload()
+    done = queue.claim('worker-1', job_id=done_id)
+    queue.complete(done_id, {}, claim_token=done['claim_token'])
+    queue.claim('worker-1', job_id=running_id)
+
+    assert prune_job_uploads(queue) == 0  # finished too recently
+    assert prune_job_uploads(queue, retention_hours=-1) == 1
+    assert not os.path.exists(job_uploads_folder(done_id))
+    assert os.path.exists(job_uploads_folder(running_id))
+
+
+def test_keyword_scores_never_replace_ai_leaderboard_entries(tmp_path, monkeypatch):
+    from src.evaluation_jobs import save_scores
+    from src.leaderboard import Leaderboard
+    from src.prescreen import SCREENED_OUT_LABEL
+    from src.score_sketch import ai_scores_key
+
+    monkeypatch.chdir(tmp_path)
+    base = {'candidate_id': 'c1', 'candidate_name': 'Jane', 'filename': 'jane.pdf', 'email': ''}
+    save_scores([dict(base, fit_score=4, fit_label='Strong Fit')], 'ROLE1', 'Engineer')
+    save_scores([dict(base, fit_score=0, fit_label=SCREENED_OUT_LABEL, keyword_score=12)], 'ROLE1', 'Engineer')
+
+    leaderboard = Leaderboard()
+    assert [(e['score'], e['source']) for e in leaderboard.top(ai_scores_key('ROLE1'))] == [(80, 'AI Evaluator')]
+    assert [(e['score'], e['source']) for e in leaderboard.top('ROLE1')] == [(12, 'Keyword pre-screen')]
@@ -0,0 +1,62 @@
+"""
+Tests for CachedResumeEvaluator: only usable answers are cached.
+"""
+
+from src.llm_cache import CachedResumeEvaluator, LLMCache
+from src.llm_stub_server import stub_parts
+
+
+class FlakyEvaluator:
+    """Combined evaluator whose first answers are failures."""
+
+    def __init__(self, failures):
+        self.failures = list(failures)
+        self.calls = 0
+
+    def extract_and_evaluate(self, resume_text, jd_text):
+        self.calls += 1
+        if self.failures:
+            return self.failures.pop(0)
+        return stub_parts(resume_text)
+
+
+def make_cached(tmp_path, evaluator):
+    return CachedResumeEvaluator(evaluator, LLMCache(str(tmp_path / 'llm_cache.db')), model='stub')
+
+
+def test_valid_answer_is_cached(tmp_path):
+    evaluator = FlakyEvaluator([])
+    cached = make_cached(tmp_path, evaluator)
+
+    first = cached.extract_and_evaluate("Jane Doe jane@example.com Python", "JD")
+    assert cached.is_cached('extract_and_evaluate', "Jane  Doe jane@example.com Python", "JD")
+    second = cached.extract_and_evaluate("Jane  Doe jane@example.com Python", "JD")
+
+    assert evaluator.calls == 1
+    assert tuple(second) == tuple(first)
+
+
+def test_failed_answers_are_not_cached(tmp_path):
+    bad_evaluation = dict(stub_parts("x")[1], fit_score=9)
+    evaluator = FlakyEvaluator([(None, None), ({'name': 'Jane'}, None), (stub_parts("x")[0], bad_evaluation)])
+    cached = make_cached(tmp_path, evaluator)
+
+    for _ in range(3):
+        cached.extract_and_evaluate("Jane Doe jane@example.com Python", "JD")
+        assert not cached.is_cached('extract_and_evaluate', "Jane Doe jane@example.com Python", "JD")
+
+    candidate_data, evaluation = cached.extract_and_evaluate("Jane Doe jane@example.com Python", "JD")
+    assert evaluator.calls == 4 and candidate_data and evaluation
+    assert cached.is_cached('extract_and_evaluate', "Jane Doe jane@example.com Python", "JD")
+
+
+def test_prompt_version_env_var_changes_the_key(tmp_path, monkeypatch):
+    evaluator = FlakyEvaluator([])
+    evaluator.PROMPT_VERSION = 'combined-1'
+    monkeypatch.setenv('LLM_PROMPT_VERSION', '1')
+    make_cached(tmp_path, evaluator).extract_and_evaluate("Jane Doe jane@example.com Python", "JD")
+
+    monkeypatch.setenv('LLM_PROMPT_VERSION', '2')
+    cached = make_cached(tmp_path, evaluator)
+    assert cached.prompt_version == 'combined-1:2'
+    assert not cached.is_cached('extract_and_evaluate', "Jane Doe jane@example.com Python", "JD")
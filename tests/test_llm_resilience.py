@@ -0,0 +1,157 @@
+"""
+Tests for LLM retries, the circuit breaker and adaptive concurrency, against
+the stub LLM server with seeded fault injection.
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.evaluation_engine import EvaluationEngine
+from src.llm_client import LLMClient, LLMError
+from src.llm_resilience import CLOSED, OPEN, AIMDLimiter, CircuitBreaker, CircuitOpenError
+
+MESSAGES = [{'role': 'user', 'content': 'Resume: Jane Doe, jane@example.com, Python'}]
+
+
+@pytest.fixture
+def retry_waits(monkeypatch):
+    """Record retry waits instead of sleeping through them"""
+    waits = []
+    monkeypatch.setattr('src.llm_client.time', SimpleNamespace(sleep=waits.append))
+    return waits
+
+
+def make_engine(client, breaker=None, limiter=None, max_retries=0):
+    return EvaluationEngine(SimpleNamespace(client=client), max_workers=8, requests_per_minute=0,
+                            tokens_per_minute=0, breaker=breaker, limiter=limiter, max_retries=max_retries)
+
+
+def test_client_retries_throttled_and_failed_calls(stub_server, retry_waits):
+    client = LLMClient(api_key='stub', base_url=stub_server(error_rate=0.4, throttle_rate=0.4, seed=3),
+                       max_retries=10)
+
+    for _ in range(10):
+        assert client.chat_json(MESSAGES)['email']
+
+    assert 1.0 in retry_waits  # stub 429s ask for Retry-After: 1
+    assert any(wait != 1.0 for wait in retry_waits)  # 500s back off exponentially
+
+
+def test_client_gives_up_after_max_retries(stub_server, retry_waits):
+    client = LLMClient(api_key='stub', base_url=stub_server(throttle_rate=1.0), max_retries=2)
+
+    with pytest.raises(LLMError) as error:
+        client.chat(MESSAGES)
+
+    assert error.value.status_code == 429
+    assert retry_waits == [1.0, 1.0]
+
+
+def test_breaker_trips_then_half_opens_and_closes(stub_server):
+    failing = LLMClient(api_key='stub', base_url=stub_server(error_rate=0.8, seed=7), max_retries=0)
+    breaker = CircuitBreaker(window=10, min_calls=5, error_rate=0.5, p95_seconds=0, cooldown_seconds=0.2)
+    engine = make_engine(failing, breaker=breaker)
+
+    for _ in range(10):
+        try:
+            engine.call_llm(failing.chat_json, MESSAGES)
+        except CircuitOpenError:
+            break
+        except LLMError:
+            pass
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        engine.call_llm(failing.chat_json, MESSAGES)
+
+    # After the cooldown a single trial call goes through to the recovered provider
+    failing.base_url = stub_server()
+    time.sleep(0.25)
+    assert engine.call_llm(failing.chat_json, MESSAGES)['email']
+    assert breaker.state == CLOSED
+    assert breaker.get_stats()['trips'] == 1
+
+
+def test_failed_trial_call_reopens_breaker(stub_server):
+    client = LLMClient(api_key='stub', base_url=stub_server(error_rate=1.0, seed=1), max_retries=0)
+    breaker = CircuitBreaker(window=5, min_calls=5, error_rate=0.5, p95_seconds=0, cooldown_seconds=0.1)
+    engine = make_engine(client, breaker=breaker)
+
+    for _ in range(5):
+        with pytest.raises(LLMError):
+            engine.call_llm(client.chat_json, MESSAGES)
+    time.sleep(0.15)
+    with pytest.raises(LLMError) as error:
+        engine.call_llm(client.chat_json, MESSAGES)
+
+    assert not isinstance(error.value, CircuitOpenError)  # the trial call reached the provider
+    assert breaker.state == OPEN
+    assert breaker.get_stats()['trips'] == 2
+
+
+def test_throttling_halves_concurrency_limit(stub_server):
+    client = LLMClient(api_key='stub', base_url=stub_server(throttle_rate=1.0, seed=5), max_retries=0)
+    limiter = AIMDLimiter(8, latency_target=0)
+    engine = make_engine(client, breaker=CircuitBreaker(error_rate=1.1), limiter=limiter)
+
+    with pytest.raises(LLMError):
+        engine.call_llm(client.chat_json, MESSAGES)
+    assert limiter.limit == 4
+
+    # 429s from calls already in flight don't halve it again
+    with pytest.raises(LLMError):
+        engine.call_llm(client.chat_json, MESSAGES)
+    assert limiter.limit == 4 and limiter.decreases == 1
+
+
+def test_engine_retries_throttled_calls_outside_its_slot(stub_server, monkeypatch):
+    client = LLMClient(api_key='stub', base_url=stub_server(throttle_rate=0.5, seed=7), max_retries=5)
+    limiter = AIMDLimiter(8, latency_target=0)
+    engine = make_engine(client, breaker=CircuitBreaker(error_rate=1.1), limiter=limiter, max_retries=10)
+    waits = []
+
+    def sleep(seconds):
+        waits.append((seconds, limiter.in_flight))
+        limiter.last_decrease -= 2  # let each 429 lower the limit, as if the waits had passed
+
+    monkeypatch.setattr('src.evaluation_engine.time', SimpleNamespace(sleep=sleep, monotonic=time.monotonic))
+
+    assert engine.call_llm(client.chat_json, MESSAGES)['email']
+    assert client.max_retries == 0  # the engine does the retrying
+    # Seed 7: two 429s (Retry-After: 1), then a success; the slot is free while waiting
+    assert waits == [(1.0, 0), (1.0, 0)]
+    assert engine.stats['llm_retries'] == 2
+    assert limiter.decreases == 2  # every 429 lowers the limit
+    assert engine.breaker.get_stats()['error_rate'] == 0.0  # retried 429s aren't breaker failures
+
+
+def test_limit_grows_back_after_successes():
+    limiter = AIMDLimiter(8, initial=2, latency_target=0)
+    for _ in range(20):
+        limiter.on_success(0.01)
+    assert 2 < limiter.limit <= 8
+
+
+def test_failing_provider_falls_back_to_keyword_scores(stub_server):
+    client = LLMClient(api_key='stub', base_url=stub_server(error_rate=0.6, seed=11), max_retries=0)
+
+    class Evaluator:
+        def extract_candidate_data(self, resume_text, jd_text):
+            return client.chat_json([{'role': 'user', 'content': f"Extract.\n{resume_text}"}])
+
+        def evaluate_resume(self, resume_text, jd_text):
+            return client.chat_json([{'role': 'user', 'content': f"Evaluate fit.\n{resume_text}"}])
+
+    breaker = CircuitBreaker(window=10, min_calls=5, error_rate=0.5, p95_seconds=0, cooldown_seconds=60)
+    engine = EvaluationEngine(Evaluator(), max_workers=2, requests_per_minute=0, tokens_per_minute=0,
+                              breaker=breaker, max_retries=0)
+    fallback = lambda text: {'fit_score': 1, 'fit_label': 'Weak Fit (keyword only)'}
+
+    results = engine.evaluate_resumes([f"Resume {i}: candidate{i}@example.com" for i in range(20)], "JD",
+                                      fallback=fallback)
+
+    assert len(results) == 20
+    assert engine.stats['fallbacks'] > 0
+    assert breaker.state == OPEN and breaker.get_stats()['rejected'] > 0
+    assert all(evaluation['fit_label'] != 'Evaluation Failed' for _, evaluation in results)
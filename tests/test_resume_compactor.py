@@ -0,0 +1,32 @@
+"""
+Tests for ResumeCompactor boilerplate removal.
+"""
+
+from src.resume_compactor import ResumeCompactor
+
+
+def page(number, body):
+    return ["Jane Doe | jane@example.com", *body, "Confidential - Jane Doe Resume", f"Page {number} of 3"]
+
+
+def test_page_headers_and_footers_are_dropped_after_first_page():
+    lines = page(1, ["SUMMARY", "Backend engineer"]) + page(2, ["Built APIs"]) + page(3, ["Wrote tests"])
+
+    kept = ResumeCompactor(token_budget=0).remove_boilerplate(lines)
+
+    assert kept.count("Jane Doe | jane@example.com") == 1
+    assert kept.count("Confidential - Jane Doe Resume") == 1
+    assert not any(line.startswith("Page ") for line in kept)
+    assert "Built APIs" in kept and "Wrote tests" in kept
+
+
+def test_repeated_lines_inside_pages_are_kept():
+    body = []
+    for company in ("Acme", "Globex", "Initech", "Umbrella"):
+        body += [f"{company} Ltd", "Software Engineer", "Responsibilities:", f"Shipped features at {company}"]
+    lines = page(1, ["EXPERIENCE"] + body)
+
+    kept = ResumeCompactor(token_budget=0).remove_boilerplate(lines)
+
+    assert kept.count("Software Engineer") == 4
+    assert kept.count("Responsibilities:") == 4
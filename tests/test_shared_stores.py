@@ -0,0 +1,52 @@
+"""
+Tests for concurrent writers of the shared data files: two jobs that loaded a
+store at the same time must not drop each other's changes when they save.
+"""
+
+import threading
+
+from src.resume_index import ResumeIndex
+from src.score_sketch import ScoreSketchStore
+from src.score_store import ScoreMatrixStore
+
+
+def test_resume_index_saves_merge(tmp_path):
+    paths = dict(index_file=str(tmp_path / 'index.json'), bitset_file=str(tmp_path / 'bitsets.npz'))
+    first, second = ResumeIndex(**paths), ResumeIndex(**paths)
+
+    first_id = first.add_candidate({'candidate_name': 'Jane', 'resume_text': 'Jane Doe Python Django'})
+    second_id = second.add_candidate({'candidate_name': 'John', 'resume_text': 'John Roe Java Spring'})
+    assert first.save() and second.save()
+
+    reloaded = ResumeIndex(**paths)
+    assert set(reloaded.candidates) == {first_id, second_id}
+    assert first_id in reloaded.postings.get('python', set())
+
+
+def test_score_matrix_writers_keep_each_others_rows(tmp_path):
+    first, second = ScoreMatrixStore(str(tmp_path)), ScoreMatrixStore(str(tmp_path))
+
+    threads = [
+        threading.Thread(target=store.set_scores, args=([f"{name}{i}" for i in range(50)], ['ROLE1'],
+                                                        [[i] for i in range(50)]))
+        for store, name in ((first, 'a'), (second, 'b'))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    reloaded = ScoreMatrixStore(str(tmp_path), readonly=True)
+    assert len(reloaded.candidate_ids) == 100
+    assert reloaded.get_score('a7', 'ROLE1') == 7 and reloaded.get_score('b42', 'ROLE1') == 42
+
+
+def test_score_sketch_saves_merge(tmp_path):
+    sketch_file = str(tmp_path / 'sketches.json')
+    first, second = ScoreSketchStore(sketch_file), ScoreSketchStore(sketch_file)
+
+    first.record('ROLE1', [10, 20, 30])
+    second.record('ROLE1', [40, 50])
+    assert first.save() and second.save()
+
+    assert ScoreSketchStore(sketch_file).get('ROLE1').n == 5